@@ -0,0 +1,56 @@
+"""Benchmark: effect of each BooleanOptions setting on draw time.
+
+Full grids with connectors, chamfers and corner screws, drawn once per
+option set after a warm-up drawing has built the templates.  Speedups
+are against the default options.
+
+Usage::
+
+    uv run python benchmarks/bench_booleans.py [--sizes 2 4 8 16] [--strategy tiles]
+"""
+
+import argparse
+import os
+import time
+
+from ogt import LayoutMask, draw_grid, prepare_grid
+from ogt.draw import BooleanOptions
+
+OPTIONS = {
+    "default": BooleanOptions(),
+    "serial": BooleanOptions(parallel=False),
+    "fuzzy 1e-5": BooleanOptions(fuzzy=1e-5),
+    "history": BooleanOptions(history=True),
+    "fuzzy 1e-5 + history": BooleanOptions(fuzzy=1e-5, history=True),
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[2, 4, 8, 16])
+    parser.add_argument("--strategy", choices=["tiles", "variants"], default="tiles")
+    parser.add_argument("--tile-fusion", choices=["sequential", "batch", "tree"], default="batch")
+    parser.add_argument("--cutouts", choices=["sequential", "batch"], default="batch")
+    args = parser.parse_args()
+    kwargs = {"strategy": args.strategy, "tile_fusion": args.tile_fusion, "cutouts": args.cutouts}
+
+    print(f"{os.cpu_count()} CPUs")
+    print(f"{'grid':<8} " + " ".join(f"{name:>20}" for name in OPTIONS))
+    for size in args.sizes:
+        plan = prepare_grid(
+            LayoutMask.full(size, size), connectors=True, tile_chamfers=True, screws="corners"
+        )
+        draw_grid(prepare_grid(LayoutMask.full(2, 2), connectors=True), **kwargs)
+        timings = []
+        for options in OPTIONS.values():
+            start = time.perf_counter()
+            draw_grid(plan, boolean_options=options, **kwargs)
+            timings.append(time.perf_counter() - start)
+        print(
+            f"{f'{size}x{size}':<8} "
+            + " ".join(f"{t:>11.2f}s ({timings[0] / t:>4.2f}x)" for t in timings)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Benchmark: cache hit rate keyed on compact codes vs canonical orientation.
+
+Two samples of generated codes, each replayed against an empty cache:
+
+- ``catalog``: full rectangles up to 6x6 (2x4 and 4x2 are both asked for)
+  with random feature options.
+- ``editor``: small random layouts up to 4x4, like grids drawn by hand.
+
+Every request whose key was already seen counts as a hit.
+
+Usage::
+
+    uv run python benchmarks/bench_canonical.py [--requests 5000]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from ogt import LayoutMask, canonicalize, prepare_grid_arrays
+from ogt.compact import encode
+
+OPTIONS = [
+    {},
+    {"connectors": True},
+    {"connectors": True, "tile_chamfers": True},
+    {"connectors": True, "tile_chamfers": True, "screws": "corners"},
+]
+
+
+def sample(kind: str, requests: int) -> list:
+    rng = np.random.default_rng(0)
+    plans = []
+    for _ in range(requests):
+        if kind == "catalog":
+            rows, cols = rng.integers(1, 7, size=2)
+            tiles = np.ones((rows, cols), dtype=bool)
+        else:
+            rows, cols = rng.integers(1, 5, size=2)
+            tiles = rng.random((rows, cols)) < 0.75
+            tiles[rng.integers(rows), rng.integers(cols)] = True
+        options = OPTIONS[rng.integers(len(OPTIONS))]
+        plans.append(prepare_grid_arrays(LayoutMask(tiles), **options))
+    return plans
+
+
+def hit_rate(keys: list[str]) -> str:
+    """Hit rate, and the number of distinct entries (= grids drawn)."""
+    entries = len(set(keys))
+    return f"{1 - entries / len(keys):.1%} ({entries})"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+
+    print(f"{'sample':<9} {'code hits':>16} {'canonical hits':>16} {'canonicalize':>14}")
+    for kind in ("catalog", "editor"):
+        plans = sample(kind, args.requests)
+        codes = [encode(plan) for plan in plans]
+
+        start = time.perf_counter()
+        canonical = [encode(canonicalize(plan)[0]) for plan in plans]
+        per_plan = (time.perf_counter() - start) / len(plans)
+
+        print(
+            f"{kind:<9} {hit_rate(codes):>16} {hit_rate(canonical):>16} {per_plan * 1e6:>11.0f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Benchmark: compact code size and speed, format v0 vs v1.
+
+Layouts range from realistic (full rectangles, an L shape, a frame around
+a cut-out) to random noise, which no encoding can compress.
+
+Usage::
+
+    uv run python benchmarks/bench_compact.py [SIZE ...]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from ogt import LayoutMask, prepare_grid_arrays
+from ogt.compact import decode, encode
+
+OPTIONS = {"connectors": True, "tile_chamfers": True, "screws": "corners"}
+
+
+def layouts(n: int) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(0)
+    l_shape = np.ones((n, n), dtype=bool)
+    l_shape[: n // 2, n // 2 :] = False
+    frame = np.ones((n, n), dtype=bool)
+    frame[n // 4 : -(n // 4), n // 4 : -(n // 4)] = False
+    return {
+        "full": np.ones((n, n), dtype=bool),
+        "L shape": l_shape,
+        "frame": frame,
+        "random 90%": rng.random((n, n)) < 0.9,
+        "random 50%": rng.random((n, n)) < 0.5,
+    }
+
+
+def per_call(fn, budget: float = 0.5) -> float:
+    """Return the mean seconds per ``fn()`` call over about *budget* seconds."""
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        fn()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= budget:
+            return elapsed / calls
+
+
+def main() -> None:
+    sizes = [int(s) for s in sys.argv[1:]] or [10, 100, 300]
+    print(
+        f"{'size':<9} {'layout':<12} {'v0 chars':>9} {'v1 chars':>9} "
+        f"{'encode v0/v1 (ms)':>19} {'decode v0/v1 (ms)':>19}"
+    )
+    for n in sizes:
+        for name, tiles in layouts(n).items():
+            plan = prepare_grid_arrays(LayoutMask(tiles), **OPTIONS)
+            codes = [encode(plan, version=v) for v in (0, 1)]
+            assert decode(codes[0]) == decode(codes[1])
+            enc = [per_call(lambda v=v: encode(plan, version=v)) * 1e3 for v in (0, 1)]
+            dec = [per_call(lambda c=c: decode(c)) * 1e3 for c in codes]
+            print(
+                f"{f'{n}x{n}':<9} {name:<12} {len(codes[0]):>9} {len(codes[1]):>9} "
+                f"{enc[0]:>9.2f} /{enc[1]:>7.2f} {dec[0]:>9.2f} /{dec[1]:>7.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
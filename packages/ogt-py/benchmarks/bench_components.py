@@ -0,0 +1,56 @@
+"""Benchmark: sparse layouts fused whole vs drawn one island at a time.
+
+Each layout is a square of islands, k x k tiles each, split by rows and
+columns of holes.  ``whole`` fuses every tile into one shape and cuts it,
+as draw_grid did before splitting plans into connected components.
+
+Usage::
+
+    uv run python benchmarks/bench_components.py [--island 3] [--sizes 2 3 4]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from ogt import LayoutMask, draw_grid, prepare_grid
+from ogt.draw.grid import _draw_solid
+
+
+def sparse_layout(islands: int, island: int) -> LayoutMask:
+    size = islands * (island + 1) - 1
+    tiles = np.ones((size, size), dtype=bool)
+    tiles[island :: island + 1, :] = False
+    tiles[:, island :: island + 1] = False
+    return LayoutMask(tiles)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--island", type=int, default=3)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[2, 3, 4])
+    parser.add_argument("--strategy", choices=["tiles", "variants"], default="tiles")
+    args = parser.parse_args()
+
+    print(f"{'layout':<16} {'tiles':>6} {'whole':>9} {'islands':>9} {'speedup':>8}")
+    for islands in args.sizes:
+        layout = sparse_layout(islands, args.island)
+        plan = prepare_grid(layout, connectors=True, tile_chamfers=True)
+        kwargs = {"tile_fusion": "sequential", "cutouts": "sequential"}
+
+        start = time.perf_counter()
+        _draw_solid(plan, strategy=args.strategy, **kwargs)
+        whole = time.perf_counter() - start
+
+        start = time.perf_counter()
+        draw_grid(plan, strategy=args.strategy, **kwargs)
+        split = time.perf_counter() - start
+
+        name = f"{len(plan.tiles)}x{len(plan.tiles)} ({islands**2})"
+        count = int(layout.tiles.sum())
+        print(f"{name:<16} {count:>6} {whole:>8.2f}s {split:>8.2f}s {whole / split:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Benchmark: sequential vs batched summit cutouts on the reference grid sizes.
+
+Usage::
+
+    uv run python benchmarks/bench_cutouts.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tests"))
+
+from grid_fixtures import GRID_CONFIGS  # noqa: E402
+
+from ogt import Tile, draw_grid, prepare_grid  # noqa: E402
+
+
+def main() -> None:
+    print(f"{'config':<40} {'sequential':>11} {'batch':>8} {'speedup':>8}")
+    for param in GRID_CONFIGS:
+        (config,) = param.values
+        layout = [[Tile()] * config.cols for _ in range(config.rows)]
+        plan = prepare_grid(
+            layout,
+            opengrid_type=config.opengrid_type,
+            connectors=config.connectors,
+            tile_chamfers=config.chamfers,
+            screws=config.screws,
+        )
+        timings = {}
+        for mode in ("sequential", "batch"):
+            start = time.perf_counter()
+            draw_grid(plan, tile_fusion="batch", cutouts=mode)
+            timings[mode] = time.perf_counter() - start
+        speedup = timings["sequential"] / timings["batch"]
+        print(
+            f"{param.id:<40} {timings['sequential']:>10.2f}s {timings['batch']:>7.2f}s "
+            f"{speedup:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark: decode_many vs one decode per code, on a catalog-like batch.
+
+The batch has many codes per tile layout, each with its own features and
+screw size, like a catalog of variants.
+
+Usage::
+
+    uv run python benchmarks/bench_decode_many.py [--codes 20000] [--layouts 200]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from ogt import LayoutMask, prepare_grid_arrays
+from ogt.compact import decode, decode_many, encode
+from ogt.prepare import NO_CONNECTOR, ScrewSize
+
+
+def catalog(n_codes: int, n_layouts: int, size: int, version: int) -> list[str]:
+    rng = np.random.default_rng(0)
+    layouts = []
+    for _ in range(n_layouts):
+        tiles = rng.random((size, size)) < 0.85
+        tiles[0, 0] = True
+        layouts.append(
+            prepare_grid_arrays(
+                LayoutMask(tiles), connectors=True, tile_chamfers=True, screws="all"
+            )
+        )
+
+    codes = []
+    for k in range(n_codes):
+        plan = layouts[rng.integers(n_layouts)]
+        # Switch off a random part of the features
+        keep = rng.random(plan.screws.shape) < rng.random()
+        plan = type(plan)(
+            tiles=plan.tiles,
+            connector_turns=np.where(keep, plan.connector_turns, NO_CONNECTOR),
+            tile_chamfers=plan.tile_chamfers & keep,
+            screws=plan.screws & keep,
+            screw_size=ScrewSize(diameter=3 + k % 20 / 10),
+        )
+        codes.append(encode(plan, version=version))
+    return codes
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--codes", type=int, default=20000)
+    parser.add_argument("--layouts", type=int, default=200)
+    parser.add_argument("--size", type=int, default=8)
+    parser.add_argument("--workers", type=int, nargs="*", default=[2, 4])
+    args = parser.parse_args()
+
+    for version in (0, 1):
+        codes = catalog(args.codes, args.layouts, args.size, version)
+        print(f"v{version}: {args.codes} codes, {args.layouts} layouts of {args.size}x{args.size}")
+        baseline = timed(lambda: [decode(code) for code in codes])
+        print(f"  {'decode, one by one':<34} {args.codes / baseline:>9,.0f} codes/s")
+        for arrays in (False, True):
+            for workers in (None, *args.workers):
+                elapsed = timed(lambda: decode_many(codes, workers=workers, arrays=arrays))
+                name = "decode_many" + (", arrays" if arrays else "")
+                name += f", {workers} workers" if workers else ""
+                print(f"  {name:<34} {args.codes / elapsed:>9,.0f} codes/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Benchmark: general fuse vs OCCT gluing on the reference grid sizes.
+
+For each gluing option, ``fuse`` is the time to fuse the placed tiles,
+the step gluing applies to, best of ``--repeat`` runs; ``draw`` is the
+whole drawing, cutouts included.  Every option runs in a fresh process, so
+``peak`` is that drawing's alone: the growth of the peak resident set over
+a process that has built its templates already.
+
+Usage::
+
+    uv run python benchmarks/bench_glue.py [--tile-fusion sequential] [--repeat 3]
+"""
+
+import argparse
+import multiprocessing
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tests"))
+
+from grid_fixtures import GRID_CONFIGS, GridConfig  # noqa: E402
+
+GLUES = ("off", "shift", "full")
+
+
+def _draw(config: GridConfig, rows: int, cols: int, **kwargs) -> None:
+    from ogt import Tile, make_opengrid
+
+    make_opengrid(
+        [[Tile()] * cols for _ in range(rows)],
+        opengrid_type=config.opengrid_type,
+        connectors=config.connectors,
+        tile_chamfers=config.chamfers,
+        screws=config.screws,
+        **kwargs,
+    )
+
+
+def measure(
+    config: GridConfig, glue: str, tile_fusion: str, repeat: int
+) -> tuple[float, float, float]:
+    """Seconds to fuse and to draw *config*, and peak memory growth in MB."""
+    from ogt.draw.booleans import fuse_all
+    from ogt.draw.grid import _place_tiles
+
+    _draw(config, 1, 1)
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    _draw(config, config.rows, config.cols, tile_fusion=tile_fusion, glue=glue)
+    draw = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    tiles = _place_tiles([[True] * config.cols] * config.rows, config.opengrid_type)
+    fuse = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fuse_all(tiles, tile_fusion, glue)
+        fuse = min(fuse, time.perf_counter() - start)
+    return fuse, draw, (peak - baseline) / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--tile-fusion", choices=["sequential", "batch", "tree"], default="sequential"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    print(f"{'':<40} " + " ".join(f"{glue:^24}" for glue in GLUES))
+    print(f"{'config':<40} " + " ".join(f"{'fuse':>7} {'draw':>7} {'peak':>8}" for _ in GLUES))
+    for param in GRID_CONFIGS:
+        (config,) = param.values
+        cells = []
+        for glue in GLUES:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                future = pool.submit(measure, config, glue, args.tile_fusion, args.repeat)
+                fuse, draw, memory = future.result()
+            cells.append(f"{fuse:>6.2f}s {draw:>6.2f}s {memory:>6.1f}MB")
+        print(f"{param.id:<40} " + " ".join(cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Benchmark: placing cutout tools by copy (translate) vs by location (place).
+
+Places every summit cutout tool of a full grid with connectors, chamfers
+and corner screws, as draw_grid does before cutting them.  Each method
+runs in a fresh process that has built its tools already; memory is the
+growth of its peak resident set.
+
+Usage::
+
+    uv run python benchmarks/bench_instances.py [--sizes 16 32 64]
+"""
+
+import argparse
+import multiprocessing
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+METHODS = ("translate", "place")
+
+
+def measure(size: int, method: str) -> tuple[float, float]:
+    """Seconds to place every cutout tool of a size x size grid, and MB."""
+    import cadquery as cq
+
+    from ogt import LayoutMask, prepare_grid
+    from ogt.constants import TILE_SIZE
+    from ogt.draw.grid import _summit_cutouts, _summit_keys
+    from ogt.draw.instances import place
+
+    plan = prepare_grid(
+        LayoutMask.full(size, size), connectors=True, tile_chamfers=True, screws="corners"
+    )
+    keys = _summit_keys(plan)
+    placements = [
+        (tool, j * TILE_SIZE, -i * TILE_SIZE)
+        for i, row in enumerate(keys)
+        for j, key in enumerate(row)
+        for tool in _summit_cutouts(plan.opengrid_type, plan.screw_size, key)
+    ]
+
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    if method == "translate":
+        shapes = [shape.translate(cq.Vector(x, y, 0)) for shape, x, y in placements]
+    else:
+        shapes = [place(shape, x, y) for shape, x, y in placements]
+    elapsed = time.perf_counter() - start
+    assert len(shapes) == len(placements)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return elapsed, (peak - baseline) / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[16, 32, 64])
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    print(f"{'grid':<8} " + " ".join(f"{method:>20}" for method in METHODS))
+    for size in args.sizes:
+        cells = []
+        for method in METHODS:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                elapsed, memory = pool.submit(measure, size, method).result()
+            cells.append(f"{elapsed:>8.3f}s {memory:>8.1f}MB")
+        print(f"{f'{size}x{size}':<8} " + " ".join(cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Benchmark: drawing a grid in 1, 2, 4 and 8 worker processes.
+
+Each run starts a fresh pool, so the times include spawning the workers,
+importing cadquery and building the templates in each of them.  Ratios
+are against 1 worker and capped by the number of CPUs, printed first;
+on a single grid the seam fuse makes every worker count slower than 1.
+
+Usage::
+
+    uv run python benchmarks/bench_parallel.py [--sizes 8 16] [--strategy variants]
+"""
+
+import argparse
+import os
+import time
+
+from ogt import LayoutMask, draw_grid, prepare_grid
+
+WORKERS = (1, 2, 4, 8)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[8, 16])
+    parser.add_argument("--strategy", choices=["tiles", "variants"], default="variants")
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} CPUs, strategy {args.strategy}")
+    print(f"{'grid':<8} " + " ".join(f"{f'{n} worker(s)':>18}" for n in WORKERS))
+    for size in args.sizes:
+        plan = prepare_grid(
+            LayoutMask.full(size, size), connectors=True, tile_chamfers=True, screws="corners"
+        )
+        timings = []
+        for workers in WORKERS:
+            start = time.perf_counter()
+            draw_grid(plan, tile_fusion="batch", strategy=args.strategy, workers=workers)
+            timings.append(time.perf_counter() - start)
+        print(
+            f"{f'{size}x{size}':<8} "
+            + " ".join(f"{t:>9.1f}s ({timings[0] / t:>3.1f}x)" for t in timings)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Benchmark: GridPlan vs GridPlanArrays construction time and memory.
+
+Usage::
+
+    uv run python benchmarks/bench_plan.py [SIZE ...]
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+
+from ogt import LayoutMask, prepare_grid, prepare_grid_arrays
+
+OPTIONS = {"connectors": True, "tile_chamfers": True, "screws": "corners"}
+
+
+def measure(build):
+    """Return (seconds, bytes allocated and still held) for ``build()``."""
+    gc.collect()
+    start = time.perf_counter()
+    build()
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return elapsed, held
+
+
+def main() -> None:
+    sizes = [int(s) for s in sys.argv[1:]] or [100, 1000]
+    print(f"{'size':<10} {'form':<15} {'time':>9} {'memory':>11}")
+    for n in sizes:
+        layout = LayoutMask.full(n, n)
+        for name, build in (
+            ("GridPlan", lambda: prepare_grid(layout, **OPTIONS)),
+            ("GridPlanArrays", lambda: prepare_grid_arrays(layout, **OPTIONS)),
+        ):
+            elapsed, held = measure(build)
+            print(f"{f'{n}x{n}':<10} {name:<15} {elapsed:>8.3f}s {held / 1e6:>9.2f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""Load test: ``ogt serve`` vs one ``ogt generate`` process per request.
+
+Starts ``ogt serve`` on a Unix socket, fires requests at it from several
+client threads, and compares the throughput with running the one-shot CLI
+for each request.  Everything runs locally.
+
+Every request asks for a different grid (the same layout with its own
+screw size), so the server cannot answer one request from the drawing of
+another and the rate counts real drawings.
+
+Usage::
+
+    uv run python benchmarks/bench_serve.py [--requests 24] [--workers 2]
+"""
+
+import argparse
+import http.client
+import json
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from ogt.compact import decode, encode
+from ogt.prepare.types import ScrewSize
+
+CODE = "0.f.2.2.KlAK.8A._4A"
+
+OGT = [sys.executable, "-c", "from ogt.cli import cli; cli()"]
+
+
+def codes(count: int) -> list[str]:
+    """*count* distinct codes for CODE's layout, one screw size each."""
+    plan = decode(CODE)
+    result = []
+    for k in range(count):
+        inset, diameter = divmod(k, 30)
+        screw_size = ScrewSize(diameter=3.0 + diameter / 10, head_inset=1.0 + inset / 10)
+        result.append(encode(plan.model_copy(update={"screw_size": screw_size})))
+    return result
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path: str, timeout: float = 300):
+        super().__init__("localhost", timeout=timeout)
+        self.path = path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.path)
+
+
+def post(path: str, body: dict) -> int:
+    conn = UnixHTTPConnection(path)
+    try:
+        conn.request("POST", "/generate", body=json.dumps(body))
+        response = conn.getresponse()
+        response.read()
+        return response.status
+    finally:
+        conn.close()
+
+
+def wait_ready(path: str, process: subprocess.Popen, timeout: float = 300) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("ogt serve exited during startup")
+        conn = UnixHTTPConnection(path)
+        try:
+            conn.request("GET", "/health")
+            if conn.getresponse().status == 200:
+                return
+        except OSError:
+            time.sleep(0.2)
+        finally:
+            conn.close()
+    raise RuntimeError("ogt serve did not start in time")
+
+
+def bench_cli(requests: int, fmt: str, tmp: Path) -> float:
+    start = time.perf_counter()
+    for k, code in enumerate(codes(requests)):
+        subprocess.run(
+            [*OGT, "generate", code, "--format", fmt] + ["-o", str(tmp / f"cli-{k}.{fmt}")],
+            check=True,
+            capture_output=True,
+        )
+    return time.perf_counter() - start
+
+
+def bench_server(requests: int, workers: int, fmt: str, tmp: Path) -> tuple[float, float]:
+    path = str(tmp / "ogt.sock")
+    process = subprocess.Popen(
+        [*OGT, "serve", "--socket", path, "--quiet"]
+        + ["--workers", str(workers), "--queue-size", str(requests)],
+        stdout=subprocess.DEVNULL,
+    )
+    try:
+        start = time.perf_counter()
+        wait_ready(path, process)
+        startup = time.perf_counter() - start
+
+        bodies = [{"code": code, "format": fmt} for code in codes(requests)]
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers * 2) as clients:
+            statuses = list(clients.map(lambda body: post(path, body), bodies))
+        elapsed = time.perf_counter() - start
+        if any(status != 200 for status in statuses):
+            raise RuntimeError(f"Unexpected statuses: {sorted(set(statuses))}")
+        return startup, elapsed
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=24)
+    parser.add_argument("--cli-requests", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--format", dest="fmt", choices=["stl", "step"], default="stl")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="ogt-bench-") as tmp:
+        cli_elapsed = bench_cli(args.cli_requests, args.fmt, Path(tmp))
+        startup, server_elapsed = bench_server(args.requests, args.workers, args.fmt, Path(tmp))
+
+    cli_rps = args.cli_requests / cli_elapsed
+    server_rps = args.requests / server_elapsed
+    print(f"grid {CODE} with distinct screw sizes, format {args.fmt}")
+    print(f"{'one-shot CLI':<28} {cli_rps:>8.2f} req/s  ({args.cli_requests} requests)")
+    print(
+        f"{'ogt serve, ' + str(args.workers) + ' worker(s)':<28} {server_rps:>8.2f} req/s  "
+        f"({args.requests} requests, {startup:.1f}s startup)"
+    )
+    print(f"{'speedup':<28} {server_rps / cli_rps:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
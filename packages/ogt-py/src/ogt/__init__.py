@@ -1,30 +1,77 @@
-from ogt.draw import draw_grid
-from ogt.grid import make_opengrid
+import importlib
+from typing import TYPE_CHECKING
+
+from ogt.layout import LayoutMask
 from ogt.prepare import (
+    FrozenGridPlan,
     GridPlan,
+    GridPlanArrays,
+    PlanTransform,
     ScrewSize,
     SummitFeatures,
+    canonicalize,
     compute_corner_screw_positions,
     compute_eligible_connector_positions,
     compute_eligible_screw_positions,
     compute_eligible_tile_chamfer_positions,
+    label_components,
     prepare_grid,
+    prepare_grid_arrays,
 )
 from ogt.slot import Hole, Slot, Tile
-from ogt.draw.tile.full import make_opengrid_full_tile
+
+if TYPE_CHECKING:
+    from ogt.draw import BooleanOptions, draw_grid, transform_grid
+    from ogt.draw.tile.full import make_opengrid_full_tile
+    from ogt.generate import generate_bytes
+    from ogt.grid import make_opengrid
+
+# Names that need cadquery, imported on first access
+_LAZY_ATTRIBUTES = {
+    "BooleanOptions": "ogt.draw",
+    "draw_grid": "ogt.draw",
+    "generate_bytes": "ogt.generate",
+    "make_opengrid": "ogt.grid",
+    "make_opengrid_full_tile": "ogt.draw.tile.full",
+    "transform_grid": "ogt.draw",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 __all__ = [
+    "BooleanOptions",
+    "FrozenGridPlan",
     "GridPlan",
+    "GridPlanArrays",
+    "LayoutMask",
+    "PlanTransform",
     "ScrewSize",
     "SummitFeatures",
+    "canonicalize",
     "compute_corner_screw_positions",
     "compute_eligible_connector_positions",
     "compute_eligible_screw_positions",
     "compute_eligible_tile_chamfer_positions",
+    "label_components",
     "draw_grid",
+    "generate_bytes",
     "make_opengrid",
     "make_opengrid_full_tile",
     "prepare_grid",
+    "prepare_grid_arrays",
+    "transform_grid",
     "Slot",
     "Tile",
     "Hole",
@@ -0,0 +1,13 @@
+"""Installed version of ogt, for cache keys."""
+
+import functools
+import importlib.metadata
+
+
+@functools.cache
+def ogt_version() -> str:
+    """Installed ogt version, or ``"unknown"`` when running from a bare tree."""
+    try:
+        return importlib.metadata.version("ogt")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
@@ -7,9 +7,11 @@ from pathlib import Path
 
 import click
 
+from ogt.export import export_geometry
+
 
 def parse_size(ctx, param, value):
-    """Parse a ``ROWSxCOLS`` string into a list[list[Tile]]."""
+    """Parse a ``ROWSxCOLS`` string into a full LayoutMask."""
     if value is None:
         return None
     try:
@@ -22,9 +24,9 @@ def parse_size(ctx, param, value):
     except ValueError:
         raise click.BadParameter(f"Expected ROWSxCOLS (e.g. 2x4), got {value!r}")
 
-    from ogt.slot import Tile
+    from ogt.layout import LayoutMask
 
-    return [[Tile()] * cols for _ in range(rows)]
+    return LayoutMask.full(rows, cols)
 
 
 def auto_name(layout_str, ext):
@@ -35,10 +37,54 @@ def derive_output(plan_path, fmt):
     return Path(plan_path).with_suffix(f".{fmt}")
 
 
-def export_geometry(workplane, path, fmt):
-    import cadquery as cq
+def load_engine():
+    """Import the CAD engine, telling the user it may take a while."""
+    click.echo("Loading CAD engine (may take up to 1 min on first run)…", nl=False)
+    sys.stdout.flush()
+    import ogt.draw  # noqa: F401
+
+    click.echo(" done.")
+
+
+def render(plan, output, fmt, draw_kwargs, tolerance, angular_tolerance, cache_dir, cache_max_size):
+    """Draw *plan* and export it to *output*, through the result cache if enabled."""
+    cache = None
+    if cache_dir is not None:
+        from ogt.result_cache import ResultCache, result_key
+
+        max_bytes = None if cache_max_size is None else cache_max_size * 1024 * 1024
+        cache = ResultCache(Path(cache_dir) / "results", max_bytes=max_bytes)
+        key = result_key(plan, fmt, tolerance, angular_tolerance, draw_kwargs)
+        data = cache.get(key)
+        if data is not None:
+            Path(output).write_bytes(data)
+            click.echo(f"Exported to {output} (cached)")
+            return
+
+    from ogt.prepare.frozen import FrozenGridPlan
+
+    work = FrozenGridPlan.from_plan(plan)
+    xmin, ymin, xmax, ymax = work.extents
+    click.echo(
+        f"Drawing {work.tile_count} tiles, {work.connector_count} connectors, "
+        f"{work.tile_chamfer_count} chamfers, {work.screw_count} screws "
+        f"({xmax - xmin:g} x {ymax - ymin:g} mm)"
+    )
+
+    load_engine()
+    from ogt.draw import draw_grid
+
+    if cache_dir is not None:
+        from ogt.draw.template_cache import set_cache_dir
+
+        set_cache_dir(Path(cache_dir) / "templates")
+
+    result = draw_grid(plan, **draw_kwargs)
+    export_geometry(result, output, fmt, tolerance, angular_tolerance)
 
-    cq.exporters.export(workplane, str(path), fmt.upper())
+    if cache is not None:
+        cache.put(key, Path(output).read_bytes())
+    click.echo(f"Exported to {output}")
 
 
 def resolve_plan(code, layout, opengrid_type, connectors, tile_chamfers, screws):
@@ -105,6 +151,86 @@ def prepare_options(fn):
     return wrapper
 
 
+def draw_options(fn):
+    """Shared drawing options for draw and generate commands."""
+
+    @click.option(
+        "--tile-fusion",
+        type=click.Choice(["sequential", "batch", "tree"]),
+        default="sequential",
+        help="How placed tiles are fused together.",
+    )
+    @click.option(
+        "--cutouts",
+        type=click.Choice(["sequential", "batch"]),
+        default="sequential",
+        help="Cut summit features one by one, or all at once.",
+    )
+    @click.option(
+        "--strategy",
+        type=click.Choice(["tiles", "variants"]),
+        default="tiles",
+        help="Build one tile per slot, or place pre-cut tile variants.",
+    )
+    @click.option(
+        "--glue",
+        type=click.Choice(["off", "shift", "full"]),
+        default="shift",
+        show_default=True,
+        help="OCCT gluing option for fusing touching tiles; off runs the general fuse.",
+    )
+    @functools.wraps(fn)
+    def wrapper(*args, tile_fusion, cutouts, strategy, glue, **kwargs):
+        draw_kwargs = {
+            "tile_fusion": tile_fusion,
+            "cutouts": cutouts,
+            "strategy": strategy,
+            "glue": glue,
+        }
+        return fn(*args, draw_kwargs=draw_kwargs, **kwargs)
+
+    return wrapper
+
+
+def export_options(fn):
+    """Shared export and cache options for draw and generate commands."""
+
+    @click.option(
+        "--format", "fmt", type=click.Choice(["stl", "step"]), default="step", help="Output format."
+    )
+    @click.option(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        show_default=True,
+        help="STL linear tessellation tolerance (mm).",
+    )
+    @click.option(
+        "--angular-tolerance",
+        type=float,
+        default=0.1,
+        show_default=True,
+        help="STL angular tessellation tolerance (rad).",
+    )
+    @click.option(
+        "--cache-dir",
+        type=click.Path(file_okay=False),
+        default=None,
+        help="Reuse exported files and CAD templates stored in this directory.",
+    )
+    @click.option(
+        "--cache-max-size",
+        type=click.IntRange(min=0),
+        default=None,
+        help="Evict least recently used results above this size (MB).",
+    )
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        return fn(*args, **kwargs)
+
+    return wrapper
+
+
 @click.group()
 def cli():
     """ogt — openGrid CadQuery CLI."""
@@ -126,54 +252,135 @@ def prepare(code, layout, opengrid_type, connectors, tile_chamfers, screws, outp
 
 @cli.command()
 @click.argument("plan_file", type=click.Path(exists=True))
-@click.option(
-    "--format", "fmt", type=click.Choice(["stl", "step"]), default="step", help="Output format."
-)
 @click.option("-o", "--output", type=click.Path(), default=None, help="Output file path.")
-def draw(plan_file, fmt, output):
+@export_options
+@draw_options
+def draw(plan_file, output, fmt, draw_kwargs, **export_kwargs):
     """Draw geometry from a PLAN_FILE (JSON) and export."""
     from pydantic import ValidationError
 
-    click.echo("Loading CAD engine (may take up to 1 min on first run)…", nl=False)
-    sys.stdout.flush()
-    from ogt.draw import draw_grid
     from ogt.prepare.types import GridPlan
 
-    click.echo(" done.")
-
     try:
         data = json.loads(Path(plan_file).read_text())
         plan = GridPlan(**data)
     except ValidationError as e:
         raise click.ClickException(f"Invalid plan file: {e}")
 
-    result = draw_grid(plan)
-
     if output is None:
         output = str(derive_output(plan_file, fmt))
 
-    export_geometry(result, output, fmt)
-    click.echo(f"Exported to {output}")
+    render(plan, output, fmt, draw_kwargs, **export_kwargs)
 
 
 @cli.command()
 @prepare_options
-@click.option(
-    "--format", "fmt", type=click.Choice(["stl", "step"]), default="step", help="Output format."
-)
-def generate(code, layout, opengrid_type, connectors, tile_chamfers, screws, output, fmt):
+@export_options
+@draw_options
+def generate(
+    code,
+    layout,
+    opengrid_type,
+    connectors,
+    tile_chamfers,
+    screws,
+    output,
+    fmt,
+    draw_kwargs,
+    **export_kwargs,
+):
     """Prepare and draw in one step — from compact CODE or --size to geometry."""
-    click.echo("Loading CAD engine (may take up to 1 min on first run)…", nl=False)
-    sys.stdout.flush()
-    from ogt.draw import draw_grid
-
-    click.echo(" done.")
     plan = resolve_plan(code, layout, opengrid_type, connectors, tile_chamfers, screws)
-    result = draw_grid(plan)
 
     rows, cols = len(plan.tiles), len(plan.tiles[0])
     if output is None:
         output = auto_name(f"{rows}x{cols}", fmt)
 
-    export_geometry(result, output, fmt)
-    click.echo(f"Exported to {output}")
+    render(plan, output, fmt, draw_kwargs, **export_kwargs)
+
+
+@cli.command()
+@click.option("--host", default="127.0.0.1", show_default=True, help="Address to listen on.")
+@click.option("--port", type=int, default=8000, show_default=True, help="TCP port to listen on.")
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Listen on this Unix socket instead of TCP.",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Worker processes, each with a warm CAD engine.",
+)
+@click.option(
+    "--queue-size",
+    type=click.IntRange(min=0),
+    default=8,
+    show_default=True,
+    help="Requests allowed to wait for a worker before answering 503.",
+)
+@click.option(
+    "--max-tiles",
+    type=click.IntRange(min=1),
+    default=1024,
+    show_default=True,
+    help="Largest grid accepted, in tiles (rows x cols).",
+)
+@click.option(
+    "--timeout",
+    type=click.FloatRange(min=0),
+    default=600.0,
+    show_default=True,
+    help="Seconds a request may wait for its drawing before answering 504; 0 waits forever.",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    default=None,
+    help="Reuse CAD templates stored in this directory.",
+)
+@click.option("--quiet", is_flag=True, help="Do not log requests.")
+@draw_options
+def serve(
+    host, port, socket_path, workers, queue_size, max_tiles, timeout, cache_dir, quiet, draw_kwargs
+):
+    """Serve grid geometry over HTTP from warm worker processes.
+
+    POST /generate with a JSON body {"code": ...} or {"plan": ...}, and
+    optionally "format" (step or stl), "tolerance", "angular_tolerance".
+    """
+    from ogt.serve import create_server
+
+    click.echo(f"Starting {workers} worker(s)…", nl=False)
+    sys.stdout.flush()
+    server = create_server(
+        host=host,
+        port=port,
+        socket_path=socket_path,
+        workers=workers,
+        queue_size=queue_size,
+        draw_kwargs=draw_kwargs,
+        cache_dir=None if cache_dir is None else Path(cache_dir) / "templates",
+        quiet=quiet,
+        max_tiles=max_tiles,
+        timeout=timeout or None,
+    )
+    click.echo(" done.")
+
+    if socket_path is not None:
+        click.echo(f"Serving on unix:{socket_path}")
+    else:
+        bound_host, bound_port = server.server_address[:2]
+        click.echo(f"Serving on http://{bound_host}:{bound_port}")
+    sys.stdout.flush()
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -22,7 +22,8 @@ Format specification v0
 
 R and C are both stored because bits are packed into bytes (multiples of 8),
 so the exact number of significant bits is lost.  R alone is not enough to
-derive C.
+derive C.  R×C is at most ``MAX_CELLS`` (1,000,000), in every version: a
+few characters of header must not make the decoder allocate gigabytes.
 
 Screw encoding
 --------------
@@ -55,39 +56,80 @@ Example
 2×2 grid, all tiles, all features active, type full, default screws::
 
     0.f.2.2.KlAK.8A._4A
+
+Format specification v1
+=======================
+
+**Form**: ``1.{TYPE}.{R}.{C}.{SCREW}.{TILES}.{FEATURES}``
+
+``TYPE``, ``R``, ``C`` and ``SCREW`` are as in v0.  v1 codes stay short
+for large grids, where v0 grows by one character per 6 cells.
+
+Feature encoding
+----------------
+One bit per *eligible* summit only: bits v0 stores for summits the decoder
+ignores are left out.  The bits are grouped by feature, first every
+connector-eligible summit, then every chamfer-eligible one, then every
+screw-eligible one, each group in row-major order.  Turning a feature on or
+off everywhere then gives long runs.  ``*`` means every eligible summit is
+active.
+
+Bitstream encoding
+------------------
+``TILES`` and ``FEATURES`` (unless ``*``) are a method character followed
+by base64url data without ``=``:
+
+- ``b`` -- raw: bits packed MSB first, as in v0
+- ``r`` -- run lengths: alternating runs of 0s and 1s, starting with 0s
+  (so the first run may be empty), each length an unsigned LEB128 varint
+- ``z`` -- raw deflate (no zlib header) of the ``b`` bytes
+
+The encoder writes whichever is shortest, preferring ``b``, then ``r``,
+then ``z`` on ties, so every plan has a single v1 code.
+
+Example
+-------
+The 2x2 example above::
+
+    1.f.2.2.KlAK.b8A.*
+
+``encode`` writes v0 by default, since the web editor only reads v0;
+``decode`` reads both.
 """
 
 import base64
 import math
-
-from ogt.prepare.connectors import (
-    _connector_direction,
-    compute_eligible_connector_positions,
+import multiprocessing
+import zlib
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Literal, overload
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from ogt.prepare.arrays import CONNECTOR_TURNS, NO_CONNECTOR, GridPlanArrays
+from ogt.prepare.eligibility import (
+    CONNECTOR_ELIGIBLE,
+    SCREW_ELIGIBLE,
+    TILE_CHAMFER_ELIGIBLE,
+    summit_codes,
 )
-from ogt.prepare.screws import compute_eligible_screw_positions
-from ogt.prepare.tile_chamfers import compute_eligible_tile_chamfer_positions
-from ogt.prepare.types import GridPlan, ScrewSize, SummitFeatures
-from ogt.slot import Hole, Tile
+from ogt.prepare.types import GridPlan, ScrewSize
 
+# Most tiles in a code: a bound on what decoding an untrusted code allocates
+MAX_CELLS = 1_000_000
 
-def _bits_to_bytes(bits: list[bool]) -> bytes:
+
+def _bits_to_bytes(bits: ArrayLike) -> bytes:
     """Pack bools into bytes, MSB first, right-padded with 0s."""
-    n_bytes = math.ceil(len(bits) / 8)
-    result = bytearray(n_bytes)
-    for i, bit in enumerate(bits):
-        if bit:
-            result[i // 8] |= 1 << (7 - i % 8)
-    return bytes(result)
+    return np.packbits(np.asarray(bits, dtype=bool)).tobytes()
 
 
-def _bytes_to_bits(data: bytes, n_bits: int) -> list[bool]:
-    """Unpack *n_bits* from *data*, MSB first."""
-    bits: list[bool] = []
-    for i in range(n_bits):
-        byte_idx = i // 8
-        bit_idx = 7 - i % 8
-        bits.append(bool(data[byte_idx] & (1 << bit_idx)))
-    return bits
+def _bytes_to_bits(data: bytes, n_bits: int) -> np.ndarray:
+    """Unpack *n_bits* from *data*, MSB first, as a flat bool array."""
+    return np.unpackbits(np.frombuffer(data, dtype=np.uint8), count=n_bits).view(bool)
 
 
 def _b64url_encode(data: bytes) -> str:
@@ -101,10 +143,117 @@ def _b64url_decode(s: str) -> bytes:
     return base64.urlsafe_b64decode(s)
 
 
-def encode(plan: GridPlan) -> str:
-    """Encode a :class:`GridPlan` into a compact string."""
-    rows = len(plan.tiles)
-    cols = len(plan.tiles[0])
+# Feature groups of the v1 feature bits, in order
+_FEATURE_GROUPS = (CONNECTOR_ELIGIBLE, TILE_CHAMFER_ELIGIBLE, SCREW_ELIGIBLE)
+
+
+def _run_lengths(bits: np.ndarray) -> list[int]:
+    """Alternating run lengths of *bits*, starting with a run of 0s."""
+    starts = np.flatnonzero(np.diff(bits.view(np.int8))) + 1
+    edges = np.concatenate(([0], starts, [bits.size]))
+    runs = np.diff(edges).tolist()
+    if bits.size and bits[0]:
+        runs.insert(0, 0)
+    return runs
+
+
+def _encode_varints(values: list[int]) -> bytes:
+    """Encode unsigned ints as LEB128 varints."""
+    out = bytearray()
+    for value in values:
+        while value >= 0x80:
+            out.append(value & 0x7F | 0x80)
+            value >>= 7
+        out.append(value)
+    return bytes(out)
+
+
+def _decode_varints(data: bytes) -> list[int]:
+    """Decode LEB128 varints."""
+    values: list[int] = []
+    value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            values.append(value)
+            value = shift = 0
+    if shift:
+        raise ValueError("Truncated run length")
+    return values
+
+
+def _encode_bitstream(bits: np.ndarray) -> str:
+    """Encode a flat bool array as a v1 bitstream field, the shortest way."""
+    packed = _bits_to_bytes(bits)
+    candidates = [b"b" + packed]
+    # Every run costs at least one byte, so with more runs than packed bytes
+    # RLE cannot win; skip building it for noisy layouts
+    if np.count_nonzero(np.diff(bits.view(np.int8))) < len(packed):
+        candidates.append(b"r" + _encode_varints(_run_lengths(bits)))
+    candidates.append(b"z" + zlib.compress(packed, 9, wbits=-15))
+    best = min(candidates, key=len)
+    return chr(best[0]) + _b64url_encode(best[1:])
+
+
+def _decode_bitstream(field: str, n_bits: int, name: str) -> np.ndarray:
+    """Decode a v1 bitstream field into a flat bool array of *n_bits*."""
+    if not field:
+        raise ValueError(f"Insufficient {name} data")
+    method, data = field[0], _b64url_decode(field[1:])
+    if method == "r":
+        runs = _decode_varints(data)
+        if sum(runs) != n_bits:
+            raise ValueError(f"{name.capitalize()} runs cover {sum(runs)} bits, expected {n_bits}")
+        values = np.arange(len(runs)) % 2 == 1
+        return np.repeat(values, runs)
+    if method == "z":
+        try:
+            # Never inflate more than the bits need
+            data = zlib.decompressobj(wbits=-15).decompress(data, math.ceil(n_bits / 8))
+        except zlib.error as e:
+            raise ValueError(f"Invalid deflate {name} data: {e}")
+    elif method != "b":
+        raise ValueError(f"Invalid {name} encoding: {method!r}")
+    if len(data) < math.ceil(n_bits / 8):
+        raise ValueError(f"Insufficient {name} data")
+    return _bytes_to_bits(data, n_bits)
+
+
+def _plan_bits(plan: GridPlan | GridPlanArrays) -> tuple[np.ndarray, np.ndarray]:
+    """Return the tiles and the summits with an active feature, as bool arrays."""
+    if isinstance(plan, GridPlanArrays):
+        active = (plan.connector_turns != NO_CONNECTOR) | plan.tile_chamfers | plan.screws
+        return plan.tiles, active
+    tiles = np.array(plan.tiles, dtype=bool).reshape(len(plan.tiles), -1)
+    active = np.array(
+        [
+            [s.connector_angle is not None or s.tile_chamfer or s.screw for s in row]
+            for row in plan.summits
+        ],
+        dtype=bool,
+    )
+    return tiles, active
+
+
+def encode(plan: GridPlan | GridPlanArrays, version: int = 0) -> str:
+    """Encode a :class:`GridPlan` (or its array form) into a compact string.
+
+    Parameters
+    ----------
+    plan : GridPlan | GridPlanArrays
+    version : ``0`` | ``1``
+        Format version.  v1 is much shorter for large grids, but the web
+        editor only reads v0.
+    """
+    if version not in (0, 1):
+        raise ValueError(f"Unsupported version: {version!r}")
+
+    tiles, active = _plan_bits(plan)
+    rows, cols = tiles.shape
+    if rows * cols > MAX_CELLS:
+        raise ValueError(f"Grid too large: {rows}x{cols} is over {MAX_CELLS} cells")
 
     # Type
     type_char = "f" if plan.opengrid_type == "full" else "l"
@@ -119,31 +268,99 @@ def encode(plan: GridPlan) -> str:
     )
     screw_str = _b64url_encode(screw_bytes)
 
-    # Tiles → R×C bits row-major
-    tile_bits = [plan.tiles[r][c] for r in range(rows) for c in range(cols)]
-    tiles_str = _b64url_encode(_bits_to_bytes(tile_bits))
+    if version == 0:
+        # Tiles → R×C bits row-major, features → (R+1)×(C+1) bits row-major
+        tiles_str = _b64url_encode(_bits_to_bytes(tiles))
+        features_str = _b64url_encode(_bits_to_bytes(active))
+    else:
+        tiles_str = _encode_bitstream(tiles.ravel())
+        # Features → one bit per eligible summit, grouped by feature
+        codes = summit_codes(tiles)
+        feature_bits = np.concatenate([active[eligible[codes]] for eligible in _FEATURE_GROUPS])
+        features_str = "*" if feature_bits.all() else _encode_bitstream(feature_bits)
+
+    return f"{version}.{type_char}.{rows}.{cols}.{screw_str}.{tiles_str}.{features_str}"
+
+
+@dataclass(frozen=True)
+class _DecodedLayout:
+    """What decoding derives from the tiles alone.
+
+    Codes that share a version, size and tile field share one of these.
+    The summit arrays mark where each feature is eligible.
+    """
+
+    tiles: np.ndarray
+    connector_turns: np.ndarray
+    tile_chamfers: np.ndarray
+    screws: np.ndarray
+
+    @property
+    def eligible(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Eligibility masks in v1 feature group order."""
+        return (self.connector_turns != NO_CONNECTOR, self.tile_chamfers, self.screws)
+
+
+def _layout_key(code: str) -> tuple[str, ...]:
+    """Group key of *code*: its version, ``R.C`` and ``TILES`` fields."""
+    parts = code.split(".")
+    if len(parts) != 7:
+        return (code,)
+    return (parts[0], parts[2], parts[3], parts[5])
 
-    # Features → (R+1)×(C+1) bits row-major
-    feature_bits: list[bool] = []
-    for i in range(rows + 1):
-        for j in range(cols + 1):
-            s = plan.summits[i][j]
-            active = s.connector_angle is not None or s.tile_chamfer or s.screw
-            feature_bits.append(active)
-    features_str = _b64url_encode(_bits_to_bytes(feature_bits))
 
-    return f"0.{type_char}.{rows}.{cols}.{screw_str}.{tiles_str}.{features_str}"
+def _decode_layout(version: str, rows: int, cols: int, tiles_str: str) -> _DecodedLayout:
+    n_tile_bits = rows * cols
+    if version == "0":
+        tiles_data = _b64url_decode(tiles_str)
+        if len(tiles_data) < math.ceil(n_tile_bits / 8):
+            raise ValueError("Insufficient tile data")
+        tiles = _bytes_to_bits(tiles_data, n_tile_bits).reshape(rows, cols)
+    else:
+        tiles = _decode_bitstream(tiles_str, n_tile_bits, "tile").reshape(rows, cols)
+
+    codes = summit_codes(tiles)
+    return _DecodedLayout(
+        tiles=tiles,
+        connector_turns=CONNECTOR_TURNS[codes],
+        tile_chamfers=TILE_CHAMFER_ELIGIBLE[codes],
+        screws=SCREW_ELIGIBLE[codes],
+    )
 
 
-def decode(code: str) -> GridPlan:
-    """Decode a compact string into a :class:`GridPlan`."""
+def _decode_active(version: str, features_str: str, layout: _DecodedLayout) -> np.ndarray:
+    """Return the (R+1)x(C+1) summits whose feature bit is set."""
+    shape = layout.screws.shape
+    if version == "0":
+        n_feature_bits = shape[0] * shape[1]
+        features_data = _b64url_decode(features_str)
+        if len(features_data) < math.ceil(n_feature_bits / 8):
+            raise ValueError("Insufficient feature data")
+        return _bytes_to_bits(features_data, n_feature_bits).reshape(shape)
+
+    # v1: bits for eligible summits only, grouped by feature
+    masks = layout.eligible
+    if features_str == "*":
+        return masks[0] | masks[1] | masks[2]
+    sizes = [int(mask.sum()) for mask in masks]
+    feature_bits = _decode_bitstream(features_str, sum(sizes), "feature")
+    active = np.zeros(shape, dtype=bool)
+    for mask, bits in zip(masks, np.split(feature_bits, np.cumsum(sizes)[:-1])):
+        active[mask] = bits
+    return active
+
+
+def _decode_arrays(
+    code: str, layouts: dict[tuple[str, ...], _DecodedLayout], max_cells: int = MAX_CELLS
+) -> GridPlanArrays:
+    """Decode *code*, reusing and filling the *layouts* cache."""
     parts = code.split(".")
     if len(parts) != 7:
         raise ValueError(f"Expected 7 dot-separated parts, got {len(parts)}")
 
     version, type_char, r_str, c_str, screw_str, tiles_str, features_str = parts
 
-    if version != "0":
+    if version not in ("0", "1"):
         raise ValueError(f"Unsupported version: {version!r}")
 
     if type_char not in ("f", "l"):
@@ -157,6 +374,9 @@ def decode(code: str) -> GridPlan:
         raise ValueError(f"Invalid dimensions: {r_str!r} x {c_str!r}")
     if rows < 1 or cols < 1:
         raise ValueError(f"Dimensions must be >= 1, got {rows}x{cols}")
+    # Before any bitstream is expanded or inflated to rows x cols bits
+    if rows * cols > max_cells:
+        raise ValueError(f"Grid too large: {rows}x{cols} is over {max_cells} cells")
 
     # Screw
     screw_data = _b64url_decode(screw_str)
@@ -168,51 +388,124 @@ def decode(code: str) -> GridPlan:
         head_inset=screw_data[2] / 10,
     )
 
-    # Tiles
-    tiles_data = _b64url_decode(tiles_str)
-    n_tile_bits = rows * cols
-    if len(tiles_data) < math.ceil(n_tile_bits / 8):
-        raise ValueError("Insufficient tile data")
-    tile_bits = _bytes_to_bits(tiles_data, n_tile_bits)
-    tiles: list[list[bool]] = []
-    for r in range(rows):
-        tiles.append([tile_bits[r * cols + c] for c in range(cols)])
-
-    # Build layout for eligibility functions
-    layout = [[Tile() if t else Hole() for t in row] for row in tiles]
-
-    # Compute eligibility
-    connector_eligible = compute_eligible_connector_positions(layout)
-    chamfer_eligible = compute_eligible_tile_chamfer_positions(layout)
-    screw_eligible = compute_eligible_screw_positions(layout)
+    # Tiles and eligibility
+    key = (version, r_str, c_str, tiles_str)
+    layout = layouts.get(key)
+    if layout is None:
+        layout = layouts[key] = _decode_layout(version, rows, cols, tiles_str)
 
     # Features
-    features_data = _b64url_decode(features_str)
-    n_feature_bits = (rows + 1) * (cols + 1)
-    if len(features_data) < math.ceil(n_feature_bits / 8):
-        raise ValueError("Insufficient feature data")
-    feature_bits = _bytes_to_bits(features_data, n_feature_bits)
-
-    # Build summits
-    summits: list[list[SummitFeatures]] = []
-    for i in range(rows + 1):
-        row: list[SummitFeatures] = []
-        for j in range(cols + 1):
-            bit = feature_bits[i * (cols + 1) + j]
-            sf = SummitFeatures()
-            if bit:
-                if connector_eligible[i][j]:
-                    sf.connector_angle = _connector_direction(layout, i, j)
-                elif chamfer_eligible[i][j]:
-                    sf.tile_chamfer = True
-                elif screw_eligible[i][j]:
-                    sf.screw = True
-            row.append(sf)
-        summits.append(row)
-
-    return GridPlan(
-        tiles=tiles,
-        summits=summits,
-        opengrid_type=opengrid_type,
+    active = _decode_active(version, features_str, layout)
+
+    # An active bit turns on whichever feature its summit is eligible for;
+    # the three are mutually exclusive.  Bits on ineligible summits are ignored.
+    return GridPlanArrays(
+        tiles=layout.tiles.copy(),
+        connector_turns=np.where(active, layout.connector_turns, NO_CONNECTOR),
+        tile_chamfers=active & layout.tile_chamfers,
+        screws=active & layout.screws,
+        opengrid_type=opengrid_type,  # type: ignore[arg-type]
         screw_size=screw_size,
     )
+
+
+def decode(code: str, max_cells: int = MAX_CELLS) -> GridPlan:
+    """Decode a compact string (any version) into a :class:`GridPlan`.
+
+    Codes for grids of more than *max_cells* tiles (rows x cols) are
+    rejected before anything is decoded; *max_cells* cannot raise the
+    format's own ``MAX_CELLS`` limit.
+    """
+    return decode_arrays(code, max_cells).to_plan()
+
+
+def decode_arrays(code: str, max_cells: int = MAX_CELLS) -> GridPlanArrays:
+    """Decode a compact string (any version) into a :class:`GridPlanArrays`.
+
+    Much faster than :func:`decode` for large grids, which spends most of
+    its time creating one ``SummitFeatures`` per summit.  *max_cells* is as
+    in :func:`decode`.
+    """
+    return _decode_arrays(code, {}, min(max_cells, MAX_CELLS))
+
+
+def _decode_chunk(codes: list[str]) -> list[GridPlanArrays]:
+    """Process pool task: decode a chunk of codes in one process."""
+    return decode_many(codes, arrays=True)
+
+
+@overload
+def decode_many(
+    codes: Iterable[str], workers: int | None = None, arrays: Literal[False] = False
+) -> list[GridPlan]: ...
+
+
+@overload
+def decode_many(
+    codes: Iterable[str], workers: int | None = None, *, arrays: Literal[True]
+) -> list[GridPlanArrays]: ...
+
+
+@overload
+def decode_many(
+    codes: Iterable[str], workers: int | None = None, arrays: bool = False
+) -> list[GridPlan] | list[GridPlanArrays]: ...
+
+
+def decode_many(
+    codes: Iterable[str], workers: int | None = None, arrays: bool = False
+) -> list[GridPlan] | list[GridPlanArrays]:
+    """Decode many compact strings, sharing work between same-layout codes.
+
+    Codes with the same version, size and ``TILES`` field only differ in
+    their screw and feature fields, so their tiles and summit eligibility
+    are decoded once.
+
+    Parameters
+    ----------
+    codes : Iterable[str]
+    workers : int | None
+        Decode in this many worker processes.  Codes are sorted by layout
+        before being split into chunks, so each layout is mostly decoded
+        by a single worker.  ``None`` decodes in this process.
+    arrays : bool
+        Return :class:`GridPlanArrays` instead of :class:`GridPlan`.
+        Workers always send back arrays, which are much cheaper to pickle,
+        so without *arrays* the conversion to GridPlan happens in this
+        process and limits what *workers* can gain.
+
+    Returns
+    -------
+    list[GridPlan] | list[GridPlanArrays]
+        One plan per code, in input order.
+
+    Raises
+    ------
+    ValueError
+        On the first invalid code, as :func:`decode` would.
+    """
+    codes = list(codes)
+    if workers is None or len(codes) < 2:
+        layouts: dict[tuple[str, ...], _DecodedLayout] = {}
+        decoded = [_decode_arrays(code, layouts) for code in codes]
+    else:
+        order = sorted(range(len(codes)), key=lambda i: _layout_key(codes[i]))
+        # A few chunks per worker keeps them busy when chunks take uneven time
+        n_chunks = min(len(codes), workers * 4)
+        bounds = [len(codes) * k // n_chunks for k in range(n_chunks + 1)]
+        chunks = [order[lo:hi] for lo, hi in zip(bounds, bounds[1:])]
+
+        by_index: dict[int, GridPlanArrays] = {}
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            # Forking a threaded process (ogt serve) can deadlock the child
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+            results = pool.map(_decode_chunk, [[codes[i] for i in chunk] for chunk in chunks])
+            for chunk, chunk_plans in zip(chunks, results):
+                by_index.update(zip(chunk, chunk_plans))
+        decoded = [by_index[i] for i in range(len(codes))]
+
+    if arrays:
+        return decoded
+    return [plan.to_plan() for plan in decoded]
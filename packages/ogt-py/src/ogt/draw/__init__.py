@@ -1,7 +1,10 @@
 """Grid drawing phase: CadQuery geometry construction from a GridPlan."""
 
-from ogt.draw.grid import draw_grid
+from ogt.draw.booleans import BooleanOptions
+from ogt.draw.grid import draw_grid, transform_grid
 
 __all__ = [
+    "BooleanOptions",
     "draw_grid",
+    "transform_grid",
 ]
@@ -0,0 +1,190 @@
+"""Boolean helpers: combine many placed solids into one, subtract many tools."""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Literal
+
+import cadquery as cq
+from OCP.BOPAlgo import BOPAlgo_GlueEnum
+from OCP.BRepAlgoAPI import BRepAlgoAPI_BooleanOperation, BRepAlgoAPI_Cut, BRepAlgoAPI_Fuse
+from OCP.TopTools import TopTools_ListOfShape
+
+TileFusion = Literal["sequential", "batch", "tree"]
+CutoutMode = Literal["sequential", "batch"]
+Glue = Literal["off", "shift", "full"]
+
+_GLUE = {
+    "off": BOPAlgo_GlueEnum.BOPAlgo_GlueOff,
+    "shift": BOPAlgo_GlueEnum.BOPAlgo_GlueShift,
+    "full": BOPAlgo_GlueEnum.BOPAlgo_GlueFull,
+}
+
+
+@dataclass(frozen=True)
+class BooleanOptions:
+    """OCCT settings for every fuse and cut of a drawing.
+
+    Booleans always leave their inputs untouched (``SetNonDestructive``):
+    placed cutout tools share their geometry with cached templates (see
+    :mod:`ogt.draw.instances`), which a destructive boolean would change
+    under the next drawing.
+
+    Attributes
+    ----------
+    parallel : bool
+        Let OCCT split each boolean over threads (``SetRunParallel``), as
+        cadquery's own booleans do.
+    fuzzy : float
+        Fuzzy tolerance in mm (``SetFuzzyValue``): boundaries closer than
+        this are treated as coincident.  0 is exact.
+    history : bool
+        Record which input sub-shapes became which output ones
+        (``SetToFillHistory``).  Nothing in ogt reads the history.
+    """
+
+    parallel: bool = True
+    fuzzy: float = 0.0
+    history: bool = False
+
+    def __post_init__(self):
+        if self.fuzzy < 0:
+            raise ValueError(f"fuzzy must not be negative, got {self.fuzzy}")
+
+
+DEFAULT_BOOLEAN_OPTIONS = BooleanOptions()
+
+
+def _shape_list(shapes: Sequence[cq.Shape]) -> TopTools_ListOfShape:
+    result = TopTools_ListOfShape()
+    for shape in shapes:
+        result.Append(shape.wrapped)
+    return result
+
+
+def _run(
+    op: BRepAlgoAPI_BooleanOperation,
+    shape: cq.Shape,
+    tools: Sequence[cq.Shape],
+    options: BooleanOptions,
+) -> cq.Shape:
+    """Run boolean *op* with *shape* as argument and *tools* as tools."""
+    op.SetArguments(_shape_list([shape]))
+    op.SetTools(_shape_list(tools))
+    op.SetRunParallel(options.parallel)
+    op.SetNonDestructive(True)
+    if options.fuzzy:
+        op.SetFuzzyValue(options.fuzzy)
+    op.SetToFillHistory(options.history)
+    op.Build()
+    if not op.IsDone():
+        raise RuntimeError(f"{type(op).__name__} failed")
+    return cq.Shape.cast(op.Shape())
+
+
+def _fuse(
+    shape: cq.Shape, others: Sequence[cq.Shape], glue: Glue, options: BooleanOptions
+) -> cq.Shape:
+    """``shape.fuse(*others)`` with OCCT's gluing option set to *glue*."""
+    if glue not in _GLUE:
+        raise ValueError(f"Unknown glue option: {glue!r}")
+    op = BRepAlgoAPI_Fuse()
+    op.SetGlue(_GLUE[glue])
+    return _run(op, shape, others, options)
+
+
+def _cut(shape: cq.Shape, tools: Sequence[cq.Shape], options: BooleanOptions) -> cq.Shape:
+    """``shape.cut(*tools)``."""
+    return _run(BRepAlgoAPI_Cut(), shape, tools, options)
+
+
+def fuse_all(
+    shapes: Sequence[cq.Shape],
+    mode: TileFusion = "sequential",
+    glue: Glue = "off",
+    options: BooleanOptions = DEFAULT_BOOLEAN_OPTIONS,
+) -> cq.Shape:
+    """Fuse *shapes* into a single shape.
+
+    Parameters
+    ----------
+    shapes : Sequence[cq.Shape]
+        Solids to fuse, at least one.
+    mode : ``"sequential"`` | ``"batch"`` | ``"tree"``
+        ``"sequential"`` fuses one shape at a time into the growing result.
+        ``"batch"`` hands every shape to a single multi-argument fuse.
+        ``"tree"`` fuses neighbouring pairs, level by level, so each fuse
+        only ever sees two operands of similar size.
+    glue : ``"off"`` | ``"shift"`` | ``"full"``
+        OCCT's gluing option.  ``"off"`` is the general fuse.  ``"shift"``
+        is only valid when the shapes do not overlap, though they may share
+        faces, as neighbouring tiles do; it skips most face/face
+        intersection work.  ``"full"`` further requires shared faces to
+        coincide exactly.
+    options : BooleanOptions
+        OCCT settings for every fuse.
+
+    Returns
+    -------
+    cq.Shape
+    """
+    if not shapes:
+        raise ValueError("Nothing to fuse")
+
+    if mode == "sequential":
+        result = shapes[0]
+        for shape in shapes[1:]:
+            result = _fuse(result, [shape], glue, options).clean()
+        return result
+
+    if mode == "batch":
+        if len(shapes) == 1:
+            return shapes[0]
+        return _fuse(shapes[0], shapes[1:], glue, options).clean()
+
+    if mode == "tree":
+        level = list(shapes)
+        while len(level) > 1:
+            level = [
+                _fuse(level[k], [level[k + 1]], glue, options) if k + 1 < len(level) else level[k]
+                for k in range(0, len(level), 2)
+            ]
+        return level[0].clean()
+
+    raise ValueError(f"Unknown fusion mode: {mode!r}")
+
+
+def cut_all(
+    shape: cq.Shape,
+    tools: Sequence[cq.Shape],
+    mode: CutoutMode = "sequential",
+    options: BooleanOptions = DEFAULT_BOOLEAN_OPTIONS,
+) -> cq.Shape:
+    """Subtract every tool in *tools* from *shape*.
+
+    Parameters
+    ----------
+    shape : cq.Shape
+        Solid to cut from.
+    tools : Sequence[cq.Shape]
+        Positioned cutout solids.
+    mode : ``"sequential"`` | ``"batch"``
+        ``"sequential"`` runs one boolean against the whole shape per tool.
+        ``"batch"`` gathers every tool into a single compound and cuts once.
+    options : BooleanOptions
+        OCCT settings for every cut.
+
+    Returns
+    -------
+    cq.Shape
+    """
+    if mode == "sequential":
+        for tool in tools:
+            shape = _cut(shape, [tool], options).clean()
+        return shape
+
+    if mode == "batch":
+        if not tools:
+            return shape
+        return _cut(shape, [cq.Compound.makeCompound(tools)], options).clean()
+
+    raise ValueError(f"Unknown cutout mode: {mode!r}")
@@ -9,6 +9,7 @@ import math
 
 import cadquery as cq
 
+from ogt.draw.template_cache import brep_cached
 
 CONNECTOR_CUTOUT_HEIGHT = 2.4
 
@@ -19,6 +20,31 @@ _CONNECTING_ARC_OFFSET = 5.100
 _INNER_FILLET_R = 0.500
 _OUTER_FILLET_R = 0.250
 
+# Profile vertices in canonical coords (x=depth, y=lateral).
+# Edge table: (type, from, to, center, radius)
+_PROFILE_EDGES = (
+    # 1: outer fillet bottom-left
+    ("ARC", (0.000, -2.567), (0.275, -2.318), (0.250, -2.567), 0.250),
+    # 2: connecting arc (left dimple)
+    ("ARC", (0.275, -2.318), (1.156, -2.555), (0.000, -5.100), 2.795),
+    # 3: inner fillet bottom
+    ("ARC", (1.156, -2.555), (1.363, -2.600), (1.363, -2.100), 0.500),
+    # 4: bottom flat
+    ("LINE", (1.363, -2.600), (2.500, -2.600), None, None),
+    # 5: bottom arc (big semicircle)
+    ("ARC", (2.500, -2.600), (2.500, 2.600), (2.500, 0.000), 2.600),
+    # 6: top flat
+    ("LINE", (2.500, 2.600), (1.363, 2.600), None, None),
+    # 7: inner fillet top
+    ("ARC", (1.363, 2.600), (1.156, 2.555), (1.363, 2.100), 0.500),
+    # 8: connecting arc (right dimple)
+    ("ARC", (1.156, 2.555), (0.275, 2.318), (0.000, 5.100), 2.795),
+    # 9: outer fillet top-left
+    ("ARC", (0.275, 2.318), (0.000, 2.567), (0.250, 2.567), 0.250),
+    # 10: closing line
+    ("LINE", (0.000, 2.567), (0.000, -2.567), None, None),
+)
+
 
 def _arc_mid(
     cx: float, cy: float, r: float, ax: float, ay: float, bx: float, by: float
@@ -51,6 +77,7 @@ def _arc_mid(
 
 
 @functools.lru_cache(maxsize=1)
+@brep_cached("connector_cutout", CONNECTOR_CUTOUT_HEIGHT, _PROFILE_EDGES)
 def make_connector_cutout() -> cq.Workplane:
     """Build the connector cutout tool in canonical orientation.
 
@@ -61,35 +88,10 @@ def make_connector_cutout() -> cq.Workplane:
     The profile is the exact 9-edge wire extracted from the original
     OpenGrid STEP file, extruded by CONNECTOR_CUTOUT_HEIGHT.
     """
-    # Profile vertices in canonical coords (x=depth, y=lateral).
-    # Edge table: (type, from, to, center, radius)
-    edges = [
-        # 1: outer fillet bottom-left
-        ("ARC", (0.000, -2.567), (0.275, -2.318), (0.250, -2.567), 0.250),
-        # 2: connecting arc (left dimple)
-        ("ARC", (0.275, -2.318), (1.156, -2.555), (0.000, -5.100), 2.795),
-        # 3: inner fillet bottom
-        ("ARC", (1.156, -2.555), (1.363, -2.600), (1.363, -2.100), 0.500),
-        # 4: bottom flat
-        ("LINE", (1.363, -2.600), (2.500, -2.600), None, None),
-        # 5: bottom arc (big semicircle)
-        ("ARC", (2.500, -2.600), (2.500, 2.600), (2.500, 0.000), 2.600),
-        # 6: top flat
-        ("LINE", (2.500, 2.600), (1.363, 2.600), None, None),
-        # 7: inner fillet top
-        ("ARC", (1.363, 2.600), (1.156, 2.555), (1.363, 2.100), 0.500),
-        # 8: connecting arc (right dimple)
-        ("ARC", (1.156, 2.555), (0.275, 2.318), (0.000, 5.100), 2.795),
-        # 9: outer fillet top-left
-        ("ARC", (0.275, 2.318), (0.000, 2.567), (0.250, 2.567), 0.250),
-        # 10: closing line
-        ("LINE", (0.000, 2.567), (0.000, -2.567), None, None),
-    ]
-
     # Build the wire as a CadQuery sketch on the XY plane, then extrude in Z.
     wp = cq.Workplane("XY").moveTo(0.000, -2.567)
 
-    for kind, _start, end, center, radius in edges:
+    for kind, _start, end, center, radius in _PROFILE_EDGES:
         if kind == "LINE":
             wp = wp.lineTo(end[0], end[1])
         else:
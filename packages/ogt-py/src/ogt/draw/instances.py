@@ -0,0 +1,32 @@
+"""Placement of templates by location, without copying their geometry.
+
+``Shape.translate`` rebuilds the whole B-rep of the shape it moves, so
+placing a cutout tool 100 times holds 100 copies of every face.  An
+instance shares the template's underlying ``TShape`` and only carries a
+``TopLoc_Location``; OCCT applies the location wherever the geometry is
+read, booleans and export included.
+
+Instances suit cutout tools and finished parts.  Tiles that are fused
+together stay copies: fusing instances of one tile is several times
+slower, as the fuse keeps meeting the same faces under other locations.
+
+"""
+
+import cadquery as cq
+from OCP.gp import gp_Trsf, gp_Vec
+from OCP.TopLoc import TopLoc_Location
+
+
+def translation(x: float, y: float, z: float = 0.0) -> TopLoc_Location:
+    """Location moving a shape by (x, y, z)."""
+    trsf = gp_Trsf()
+    trsf.SetTranslation(gp_Vec(x, y, z))
+    return TopLoc_Location(trsf)
+
+
+def place(shape: cq.Shape, x: float, y: float, z: float = 0.0) -> cq.Shape:
+    """An instance of *shape* moved by (x, y, z), sharing its geometry.
+
+    Same as ``shape.translate((x, y, z))``, without the copy.
+    """
+    return shape.__class__(shape.wrapped.Moved(translation(x, y, z)))
@@ -0,0 +1,162 @@
+"""Parallel drawing: parts of a plan drawn in worker processes.
+
+A plan with several connected components (see
+:mod:`ogt.prepare.components`) is drawn one component per task.  A single
+component is split into at most one rectangle per worker instead.  Each
+worker draws its part with :func:`~ogt.draw.grid.draw_grid`, building its
+own templates, and sends the shape back as BREP.  The parent then fuses
+the rectangles along their seams, in a single fuse and a single clean of
+the result.
+
+A summit's cutouts only reach into the 4 tiles around it, so a chunk of
+tiles ``[r0, r1) x [c0, c1)`` takes the summits ``[r0, r1] x [c0, c1]``:
+summits on a seam are cut from the tiles on both sides, and the fused
+chunks are the grid :func:`draw_grid` would draw in one process.
+
+"""
+
+import io
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import cadquery as cq
+
+from ogt.constants import TILE_SIZE
+from ogt.draw.booleans import DEFAULT_BOOLEAN_OPTIONS, fuse_all
+from ogt.draw.instances import place
+from ogt.draw.template_cache import get_cache_dir, set_cache_dir
+from ogt.prepare.arrays import GridPlanArrays
+from ogt.prepare.components import component_plans, label_components
+from ogt.prepare.frozen import FrozenGridPlan
+from ogt.prepare.types import GridPlan
+
+# (row, col, rows, cols) of a chunk, in tiles
+Chunk = tuple[int, int, int, int]
+
+
+def _splits(size: int, parts: int) -> list[int]:
+    return [k * size // parts for k in range(parts + 1)]
+
+
+def chunk_bounds(rows: int, cols: int, chunks: int) -> list[Chunk]:
+    """Split a rows x cols grid into at most *chunks* even rectangles.
+
+    Of the ``a x b`` splits with the most rectangles, picks the one with
+    the shortest seams, since the parent fuses every seam on its own.
+
+    Returns
+    -------
+    list[Chunk]
+        ``(row, col, rows, cols)`` of each rectangle, row by row.
+    """
+    splits = [(a, min(cols, chunks // a)) for a in range(1, min(rows, chunks) + 1)]
+    # Most rectangles first, then shortest seams
+    a, b = min(splits, key=lambda ab: (-ab[0] * ab[1], (ab[0] - 1) * cols + (ab[1] - 1) * rows))
+
+    row_splits, col_splits = _splits(rows, a), _splits(cols, b)
+    return [
+        (r0, c0, r1 - r0, c1 - c0)
+        for r0, r1 in zip(row_splits, row_splits[1:])
+        for c0, c1 in zip(col_splits, col_splits[1:])
+    ]
+
+
+def _sub_plan(plan: FrozenGridPlan, chunk: Chunk) -> FrozenGridPlan:
+    """The tiles of *chunk* and every summit on their corners."""
+    row, col, rows, cols = chunk
+    tiles = (slice(row, row + rows), slice(col, col + cols))
+    summits = (slice(row, row + rows + 1), slice(col, col + cols + 1))
+    return FrozenGridPlan(
+        tiles=plan.tiles[tiles],
+        connector_angles=plan.connector_angles[summits],
+        tile_chamfers=plan.tile_chamfers[summits],
+        screws=plan.screws[summits],
+        opengrid_type=plan.opengrid_type,
+        screw_size=plan.screw_size,
+    )
+
+
+def _init_worker(cache_dir: str | None) -> None:
+    """Pool initializer: share the parent's on-disk template cache."""
+    if cache_dir is not None:
+        set_cache_dir(cache_dir)
+
+
+def _draw_chunk(plan: FrozenGridPlan, row: int, col: int, draw_kwargs: dict) -> bytes:
+    """Worker task: draw a chunk, move it into place and return it as BREP."""
+    from ogt.draw.grid import draw_grid
+
+    shape = draw_grid(plan, **draw_kwargs).val()
+    shape = place(shape, col * TILE_SIZE, -row * TILE_SIZE)
+    buffer = io.BytesIO()
+    shape.exportBrep(buffer)
+    return buffer.getvalue()
+
+
+def _draw_in_pool(
+    tasks: list[tuple[int, int, FrozenGridPlan]], workers: int, draw_kwargs: dict
+) -> list[cq.Shape]:
+    """Draw every ``(row, col, plan)`` in a pool, each moved to its place."""
+    cache_dir = get_cache_dir()
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(tasks)),
+        # Workers load cadquery themselves, like the ogt serve pool
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(None if cache_dir is None else str(cache_dir),),
+    ) as pool:
+        futures = [pool.submit(_draw_chunk, sub, row, col, draw_kwargs) for row, col, sub in tasks]
+        return [cq.Shape.importBrep(io.BytesIO(future.result())) for future in futures]
+
+
+def draw_grid_parallel(
+    plan: GridPlan | GridPlanArrays | FrozenGridPlan, workers: int, **draw_kwargs
+) -> cq.Workplane:
+    """Draw *plan* in up to *workers* processes.
+
+    A plan with several connected components is drawn one component per
+    task, and the components are returned as a compound, as
+    :func:`~ogt.draw.grid.draw_grid` does.  A single component is split
+    into rectangular chunks that are fused along their seams; that fuse
+    alone takes longer than drawing the whole component in one process.
+
+    Parameters
+    ----------
+    plan : GridPlan | GridPlanArrays | FrozenGridPlan
+    workers : int
+        Worker processes, and the most chunks a component is split into.
+    **draw_kwargs
+        Passed to :func:`~ogt.draw.grid.draw_grid` for every chunk.
+        *glue* and *boolean_options* also apply to the seam fuse.
+
+    Returns
+    -------
+    cq.Workplane
+        The same geometry as ``draw_grid(plan, **draw_kwargs)``.
+    """
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    frozen = plan if isinstance(plan, FrozenGridPlan) else FrozenGridPlan.from_plan(plan)
+
+    labels, count = label_components(frozen.tiles)
+    if count == 0:
+        return cq.Workplane("XY")
+    if count > 1:
+        shapes = _draw_in_pool(component_plans(frozen, labels, count), workers, draw_kwargs)
+        return cq.Workplane("XY").add(cq.Compound.makeCompound(shapes))
+
+    tasks = [
+        (chunk[0], chunk[1], sub)
+        for chunk in chunk_bounds(*frozen.shape, workers)
+        if (sub := _sub_plan(frozen, chunk)).tile_count
+    ]
+    shapes = _draw_in_pool(tasks, workers, draw_kwargs)
+    # Every seam in one fuse: a sequential fuse would clean the whole,
+    # growing solid once per chunk
+    result = fuse_all(
+        shapes,
+        "batch",
+        draw_kwargs.get("glue", "shift"),
+        draw_kwargs.get("boolean_options", DEFAULT_BOOLEAN_OPTIONS),
+    )
+    return cq.Workplane("XY").add(result)
@@ -0,0 +1,113 @@
+"""Persistent on-disk cache for CAD templates.
+
+Tile and cutout templates take several booleans to build.  ``lru_cache``
+keeps them for the life of a process; this cache stores them as native
+BREP files so later processes can load them instead.
+
+The cache is off unless a directory is configured, either with
+:func:`set_cache_dir` or the ``OGT_CACHE_DIR`` environment variable.
+
+Entries are keyed on the ogt version, the template name, the geometry
+constants the template is built from and the factory's arguments.  When the
+version or a constant changes, the entry gets a new file name and stale
+files for the same template are removed.
+
+"""
+
+import functools
+import hashlib
+import logging
+import os
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+
+import cadquery as cq
+
+from ogt._version import ogt_version
+
+CACHE_DIR_ENV = "OGT_CACHE_DIR"
+
+logger = logging.getLogger(__name__)
+
+_cache_dir: Path | None = None
+
+
+def set_cache_dir(path: str | Path | None) -> None:
+    """Store templates under *path*, or disable the cache with ``None``.
+
+    Takes precedence over ``OGT_CACHE_DIR``.
+    """
+    global _cache_dir
+    _cache_dir = Path(path) if path is not None else None
+
+
+def get_cache_dir() -> Path | None:
+    """Return the configured template cache directory, if any."""
+    if _cache_dir is not None:
+        return _cache_dir
+    env = os.environ.get(CACHE_DIR_ENV)
+    return Path(env) if env else None
+
+
+def template_key(name: str, *params: object) -> str:
+    """Hex digest identifying a template built from *params*."""
+    payload = repr((ogt_version(), name, params))
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def _write_atomic(shape: cq.Shape, path: Path) -> None:
+    """Export *shape* next to *path*, then move it into place."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".", suffix=".brep")
+    os.close(fd)
+    try:
+        shape.exportBrep(tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def brep_cached(
+    name: str, *constants: object
+) -> Callable[[Callable[..., cq.Workplane]], Callable[..., cq.Workplane]]:
+    """Cache a template factory's result as a BREP file.
+
+    Parameters
+    ----------
+    name : str
+        Template name, used as the file name prefix.
+    *constants
+        Geometry constants the template depends on.  Part of the key,
+        together with the ogt version and the factory's arguments.
+    """
+
+    def decorator(factory: Callable[..., cq.Workplane]) -> Callable[..., cq.Workplane]:
+        @functools.wraps(factory)
+        def wrapper(*args: object) -> cq.Workplane:
+            cache_dir = get_cache_dir()
+            if cache_dir is None:
+                return factory(*args)
+
+            key = template_key(name, *constants)
+            path = cache_dir / f"{name}-{key}-{template_key(name, *args)}.brep"
+            if path.exists():
+                try:
+                    return cq.Workplane("XY").add(cq.Shape.importBrep(str(path)))
+                except (OSError, ValueError) as e:
+                    # Unreadable entry (cadquery raises ValueError for a bad
+                    # BREP): rebuild and overwrite it below
+                    logger.warning("Rebuilding template cache entry %s: %s", path, e)
+
+            result = factory(*args)
+
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            for stale in cache_dir.glob(f"{name}-*.brep"):
+                if not stale.name.startswith(f"{name}-{key}-"):
+                    stale.unlink(missing_ok=True)
+            _write_atomic(result.val(), path)
+            return result
+
+        return wrapper
+
+    return decorator
@@ -4,6 +4,7 @@ Retroengineered from the original STEP file, see ./retroengineer.
 
 """
 
+import functools
 import math
 
 import cadquery as cq
@@ -13,10 +14,18 @@ from ogt.draw.tile.full import TILE_THICKNESS as FULL_TILE_THICKNESS
 INTERSECTION_DISTANCE = 4.2
 
 TILE_CHAMFER = math.sqrt(INTERSECTION_DISTANCE**2 * 2)
-TILE_CHAMFER_CUTOUT = (
-    cq.Workplane("XY")
-    .rect(TILE_CHAMFER, TILE_CHAMFER)
-    .extrude(FULL_TILE_THICKNESS)
-    .rotate((0, 0, 0), (0, 0, 1), 45)
-    .translate((0, 0, 0))
-)
+
+
+@functools.lru_cache(maxsize=2)
+def make_tile_chamfer_cutout(tile_thickness: float = FULL_TILE_THICKNESS) -> cq.Workplane:
+    """Build the tile chamfer cutout tool for a tile of *tile_thickness*.
+
+    A square prism rotated 45 degrees, centered on the summit at the origin,
+    Z from 0 to *tile_thickness*.
+    """
+    return (
+        cq.Workplane("XY")
+        .rect(TILE_CHAMFER, TILE_CHAMFER)
+        .extrude(tile_thickness)
+        .rotate((0, 0, 0), (0, 0, 1), 45)
+    )
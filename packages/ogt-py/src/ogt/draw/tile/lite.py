@@ -17,10 +17,31 @@ import math
 import cadquery as cq
 
 from ogt.constants import TILE_SIZE
+from ogt.draw.template_cache import brep_cached
 
 LITE_TILE_THICKNESS = 4.0
 _SQRT2 = math.sqrt(2)
 
+# Closed (Y, Z) outline of an axis-aligned wall, Y=0 on the tile edge, +Y into the tile.
+LITE_WALL_PROFILE = (
+    (0.0, LITE_TILE_THICKNESS),
+    (0.0, 0.0),
+    (1.1, 0.0),
+    (1.5, 0.4),
+    (1.5, 1.4),
+    (0.8, 2.4),
+    (0.8, LITE_TILE_THICKNESS),
+)
+
+# Closed (Y, Z) outline of a 45-degree corner post, Y=0 on the corner line.
+LITE_CORNER_PROFILE = (
+    (0.0, LITE_TILE_THICKNESS),
+    (5.57, LITE_TILE_THICKNESS),
+    (5.57, 1.4),
+    (4.17, 0.0),
+    (0.0, 0.0),
+)
+
 
 def _make_tile_wall() -> cq.Workplane:
     """Axis-aligned wall segment (one side of the square frame).
@@ -33,18 +54,7 @@ def _make_tile_wall() -> cq.Workplane:
     """
     half_size = TILE_SIZE / 2  # 14
 
-    profile = (
-        cq.Workplane("YZ")
-        .moveTo(0.0, LITE_TILE_THICKNESS)
-        .lineTo(0.0, 0.0)
-        .lineTo(1.1, 0.0)
-        .lineTo(1.5, 0.4)
-        .lineTo(1.5, 1.4)
-        .lineTo(0.8, 2.4)
-        .lineTo(0.8, LITE_TILE_THICKNESS)
-        .close()
-        .extrude(TILE_SIZE)
-    )
+    profile = cq.Workplane("YZ").polyline(LITE_WALL_PROFILE).close().extrude(TILE_SIZE)
 
     # Center on X, outer face at Y = -14
     return profile.translate((-half_size, -half_size, 0))
@@ -62,22 +72,14 @@ def _make_corner_wall() -> cq.Workplane:
     half_size = TILE_SIZE / 2  # 14
     extrude_len = TILE_SIZE * _SQRT2
 
-    profile = (
-        cq.Workplane("YZ")
-        .moveTo(0.0, LITE_TILE_THICKNESS)
-        .lineTo(5.57, LITE_TILE_THICKNESS)
-        .lineTo(5.57, 1.4)
-        .lineTo(4.17, 0.0)
-        .lineTo(0.0, 0.0)
-        .close()
-        .extrude(extrude_len)
-    )
+    profile = cq.Workplane("YZ").polyline(LITE_CORNER_PROFILE).close().extrude(extrude_len)
 
     # Center on X, outer face at Y = -14*sqrt(2)
     return profile.translate((-extrude_len / 2, -half_size * _SQRT2, 0))
 
 
 @functools.lru_cache(maxsize=1)
+@brep_cached("lite_tile", TILE_SIZE, LITE_TILE_THICKNESS, LITE_WALL_PROFILE, LITE_CORNER_PROFILE)
 def make_opengrid_lite_tile() -> cq.Workplane:
     """Build a complete 1x1 openGrid lite tile."""
     # Axis-aligned frame: 4 walls at 0, 90, 180, 270
@@ -0,0 +1,17 @@
+"""Export of drawn grids to files, shared by the CLI and the library."""
+
+
+def export_geometry(workplane, path, fmt, tolerance=0.1, angular_tolerance=0.1):
+    """Write *workplane* to *path* as *fmt* (``"step"`` or ``"stl"``).
+
+    *tolerance* and *angular_tolerance* set the STL tessellation.
+    """
+    import cadquery as cq
+
+    cq.exporters.export(
+        workplane,
+        str(path),
+        fmt.upper(),
+        tolerance=tolerance,
+        angularTolerance=angular_tolerance,
+    )
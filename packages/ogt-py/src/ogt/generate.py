@@ -0,0 +1,160 @@
+"""In-process generation of exported grid files, safe to call from threads.
+
+:func:`generate_bytes` turns a compact code into STEP or STL bytes.
+Concurrent calls for the same grid are coalesced: the first caller draws
+it, the others wait for that result instead of drawing it again.
+
+"""
+
+import copy
+import tempfile
+import threading
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Generic, TypeVar
+
+from ogt.compact import decode
+from ogt.export import export_geometry
+from ogt.prepare.types import GridPlan
+from ogt.result_cache import DEFAULT_ANGULAR_TOLERANCE, DEFAULT_TOLERANCE, result_key
+
+T = TypeVar("T")
+
+
+@dataclass
+class _Call(Generic[T]):
+    """One in-flight computation and the callers waiting on it."""
+
+    done: threading.Event = field(default_factory=threading.Event)
+    # Set by the leader before done, unless it raised
+    result: T = field(init=False)
+    error: BaseException | None = None
+
+
+def _waiter_error(error: BaseException) -> BaseException:
+    """A copy of the leader's *error* for one waiting caller to raise.
+
+    Raising the leader's own exception from every waiting thread would
+    append each thread's frames to its one shared traceback.  Exceptions
+    that cannot be copied are wrapped instead.
+    """
+    try:
+        return copy.copy(error)
+    except Exception:
+        return RuntimeError(f"Coalesced call failed: {error!r}")
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key.
+
+    While a call for a key is running, other calls for the same key wait
+    for it and get its result, or a copy of its exception chained to the
+    original.  Nothing is kept once the call returns; caching finished
+    results is left to the caller.
+
+    Attributes
+    ----------
+    computed : int
+        Calls that ran their function.
+    coalesced : int
+        Calls that waited on another call's result instead.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call[Any]] = {}
+        self.computed = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Run *fn*, unless a call for *key* is already running."""
+        with self._lock:
+            running = self._calls.get(key)
+            if running is None:
+                call: _Call[T] = _Call()
+                self._calls[key] = call
+                self.computed += 1
+            else:
+                self.coalesced += 1
+
+        if running is not None:
+            running.done.wait()
+            if running.error is not None:
+                raise _waiter_error(running.error) from running.error
+            return running.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def stats(self) -> dict[str, int]:
+        """Return the ``computed`` and ``coalesced`` counters."""
+        with self._lock:
+            return {"computed": self.computed, "coalesced": self.coalesced}
+
+
+_flight = SingleFlight()
+
+
+def export_bytes(
+    workplane,
+    fmt: str,
+    tolerance: float = DEFAULT_TOLERANCE,
+    angular_tolerance: float = DEFAULT_ANGULAR_TOLERANCE,
+) -> bytes:
+    """Export *workplane* as *fmt* and return the file contents."""
+    with tempfile.TemporaryDirectory(prefix="ogt-") as tmp:
+        path = Path(tmp) / f"grid.{fmt}"
+        export_geometry(workplane, path, fmt, tolerance, angular_tolerance)
+        return path.read_bytes()
+
+
+def generate_bytes(
+    code: str | GridPlan,
+    fmt: str = "step",
+    tolerance: float = DEFAULT_TOLERANCE,
+    angular_tolerance: float = DEFAULT_ANGULAR_TOLERANCE,
+    **draw_kwargs,
+) -> bytes:
+    """Draw a grid and return it exported as *fmt*.
+
+    Parameters
+    ----------
+    code : str | GridPlan
+        Compact code of the grid, or an already prepared plan.
+    fmt : ``"step"`` | ``"stl"``
+        Export format.
+    tolerance, angular_tolerance : float
+        STL tessellation settings.
+    **draw_kwargs
+        Passed to :func:`ogt.draw.draw_grid`.
+
+    Returns
+    -------
+    bytes
+        The exported file.  Concurrent calls for the same canonical grid,
+        format and settings share a single computation; see
+        :func:`generate_stats`.
+    """
+    plan = decode(code) if isinstance(code, str) else code
+    key = result_key(plan, fmt, tolerance, angular_tolerance, draw_kwargs)
+
+    def compute() -> bytes:
+        from ogt.draw import draw_grid
+
+        return export_bytes(draw_grid(plan, **draw_kwargs), fmt, tolerance, angular_tolerance)
+
+    return _flight.do(key, compute)
+
+
+def generate_stats() -> dict[str, int]:
+    """Return how many :func:`generate_bytes` calls were computed or coalesced."""
+    return _flight.stats()
@@ -9,30 +9,53 @@ from typing import Literal
 import cadquery as cq
 
 from ogt.draw import draw_grid
+from ogt.draw.booleans import DEFAULT_BOOLEAN_OPTIONS, BooleanOptions, CutoutMode, Glue, TileFusion
+from ogt.draw.grid import DrawStrategy
+from ogt.layout import Layout
 from ogt.prepare import prepare_grid
 from ogt.prepare.types import ScrewSize
-from ogt.slot import Slot
 
 
 def make_opengrid(
-    layout: list[list[Slot]],
+    layout: Layout,
     opengrid_type: Literal["full", "lite"] = "full",
     connectors: bool = False,
     tile_chamfers: bool = False,
     screws: None | Literal["corners", "all"] = None,
     screw_size: ScrewSize | None = None,
+    tile_fusion: TileFusion = "sequential",
+    cutouts: CutoutMode = "sequential",
+    strategy: DrawStrategy = "tiles",
+    workers: int | None = None,
+    glue: Glue = "shift",
+    boolean_options: BooleanOptions = DEFAULT_BOOLEAN_OPTIONS,
 ) -> cq.Workplane:
     """Create an NxM grid of openGrid tiles.
 
     Parameters
     ----------
-    layout : list[list[Slot]]
+    layout : list[list[Slot]] | LayoutMask
         2D array of Slot objects. Tile slots place a tile, Hole slots
-        leave a gap.
+        leave a gap.  A :class:`~ogt.layout.LayoutMask` (True = tile)
+        works too.
         Row 0 at Y=0, increasing rows go -Y (they go "down").
         Col 0 at X=0, increasing cols go +X (they go "right").
     opengrid_type : ``"full"`` | ``"lite"``
         Which tile variant to use.
+    tile_fusion : ``"sequential"`` | ``"batch"`` | ``"tree"``
+        How placed tiles are fused together, see
+        :func:`ogt.draw.booleans.fuse_all`.
+    cutouts : ``"sequential"`` | ``"batch"``
+        How summit cutouts are subtracted, see :func:`ogt.draw.booleans.cut_all`.
+    strategy : ``"tiles"`` | ``"variants"``
+        How the tile frame is built, see :func:`ogt.draw.draw_grid`.
+    workers : int, optional
+        Draw in this many worker processes, see :func:`ogt.draw.draw_grid`.
+        Slower than the default for a single connected grid.
+    glue : ``"off"`` | ``"shift"`` | ``"full"``
+        OCCT's gluing option for fusing tiles, see :func:`ogt.draw.draw_grid`.
+    boolean_options : BooleanOptions
+        OCCT settings for every fuse and cut, see :func:`ogt.draw.draw_grid`.
 
     Returns
     -------
@@ -40,4 +63,12 @@ def make_opengrid(
         Unioned grid of tiles with layout[0][0] top-left corner at the origin.
     """
     plan = prepare_grid(layout, opengrid_type, connectors, tile_chamfers, screws, screw_size)
-    return draw_grid(plan)
+    return draw_grid(
+        plan,
+        tile_fusion=tile_fusion,
+        cutouts=cutouts,
+        strategy=strategy,
+        workers=workers,
+        glue=glue,
+        boolean_options=boolean_options,
+    )
@@ -0,0 +1,81 @@
+"""Compact tile layouts.
+
+A layout is usually a ``list[list[Slot]]``, one object per cell.
+:class:`LayoutMask` holds the same information as a 2D boolean array, so
+large layouts cost one byte per cell instead of one Python object.  Every
+function taking a layout accepts either form.
+
+"""
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from ogt.slot import Hole, Slot, Tile
+
+
+class LayoutMask:
+    """Rectangular layout stored as a boolean array, True = Tile.
+
+    Parameters
+    ----------
+    tiles : ArrayLike
+        rows x cols booleans (or anything ``numpy`` converts to them).
+        Copied, so later changes to *tiles* do not affect the mask.
+
+    Notes
+    -----
+    Indexing follows the Slot layout: row 0 at the top, col 0 on the left.
+    """
+
+    __slots__ = ("tiles",)
+
+    def __init__(self, tiles: ArrayLike):
+        array = np.array(tiles, dtype=bool)
+        if array.ndim != 2 or array.shape[0] < 1 or array.shape[1] < 1:
+            raise ValueError(f"Expected a non-empty rows x cols array, got shape {array.shape}")
+        self.tiles = array
+
+    @classmethod
+    def full(cls, rows: int, cols: int) -> "LayoutMask":
+        """Return a *rows* x *cols* layout with a tile in every cell."""
+        return cls(np.ones((rows, cols), dtype=bool))
+
+    @classmethod
+    def from_slots(cls, layout: list[list[Slot]]) -> "LayoutMask":
+        """Convert a ``list[list[Slot]]`` layout."""
+        return cls([[isinstance(slot, Tile) for slot in row] for row in layout])
+
+    def to_slots(self) -> list[list[Slot]]:
+        """Convert to a ``list[list[Slot]]`` layout, one new object per cell."""
+        return [[Tile() if t else Hole() for t in row] for row in self.tiles.tolist()]
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """``(rows, cols)``."""
+        return self.tiles.shape  # type: ignore[return-value]
+
+    def is_tile(self, row: int, col: int) -> bool:
+        """Whether cell (*row*, *col*) is a tile.  Outside the grid is a hole."""
+        rows, cols = self.tiles.shape
+        return 0 <= row < rows and 0 <= col < cols and bool(self.tiles[row, col])
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, LayoutMask):
+            return NotImplemented
+        return np.array_equal(self.tiles, other.tiles)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        rows, cols = self.tiles.shape
+        return f"LayoutMask({rows}x{cols}, {int(self.tiles.sum())} tiles)"
+
+
+Layout = list[list[Slot]] | LayoutMask
+
+
+def layout_tiles(layout: Layout) -> np.ndarray:
+    """Return a rows x cols boolean array, True where *layout* has a Tile."""
+    if isinstance(layout, LayoutMask):
+        return layout.tiles
+    return np.array([[isinstance(slot, Tile) for slot in row] for row in layout], dtype=bool)
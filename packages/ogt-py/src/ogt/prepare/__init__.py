@@ -1,21 +1,32 @@
 """Grid preparation phase: layout analysis and plan construction."""
 
+from ogt.prepare.arrays import NO_CONNECTOR, GridPlanArrays
+from ogt.prepare.components import label_components
 from ogt.prepare.connectors import compute_eligible_connector_positions
-from ogt.prepare.grid import prepare_grid
+from ogt.prepare.frozen import FrozenGridPlan
+from ogt.prepare.grid import prepare_grid, prepare_grid_arrays
 from ogt.prepare.screws import (
     compute_corner_screw_positions,
     compute_eligible_screw_positions,
 )
+from ogt.prepare.symmetry import PlanTransform, canonicalize
 from ogt.prepare.tile_chamfers import compute_eligible_tile_chamfer_positions
 from ogt.prepare.types import GridPlan, ScrewSize, SummitFeatures
 
 __all__ = [
+    "FrozenGridPlan",
     "GridPlan",
+    "GridPlanArrays",
+    "NO_CONNECTOR",
+    "PlanTransform",
     "ScrewSize",
     "SummitFeatures",
+    "canonicalize",
     "compute_corner_screw_positions",
     "compute_eligible_connector_positions",
     "compute_eligible_screw_positions",
     "compute_eligible_tile_chamfer_positions",
+    "label_components",
     "prepare_grid",
+    "prepare_grid_arrays",
 ]
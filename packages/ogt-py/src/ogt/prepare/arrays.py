@@ -0,0 +1,148 @@
+"""Struct-of-arrays form of a GridPlan, for large grids.
+
+A :class:`~ogt.prepare.types.GridPlan` holds one ``SummitFeatures`` model
+per summit.  :class:`GridPlanArrays` holds the same plan as one numpy array
+per feature, which is much cheaper to build, store and scan when grids get
+large.
+
+"""
+
+from dataclasses import dataclass, field
+from typing import Literal
+
+import numpy as np
+
+from ogt.prepare.eligibility import CONNECTOR_ANGLE, CONNECTOR_ELIGIBLE
+from ogt.prepare.types import GridPlan, ScrewSize, _trusted_plan, _trusted_summit
+
+# Connector rotation sentinel: no connector at this summit
+NO_CONNECTOR = -128
+
+# Connector rotation in quarter turns, by summit code
+CONNECTOR_TURNS = np.where(
+    CONNECTOR_ELIGIBLE, np.nan_to_num(CONNECTOR_ANGLE) // 90, NO_CONNECTOR
+).astype(np.int8)
+
+
+@dataclass(eq=False)
+class GridPlanArrays:
+    """Exhaustive specification of what to draw, one array per feature.
+
+    Attributes
+    ----------
+    tiles : np.ndarray
+        rows x cols ``bool``, True = place tile.
+    connector_turns : np.ndarray
+        (rows+1) x (cols+1) ``int8``.  Z-rotation of the connector cutout
+        in quarter turns (1 = 90 degrees), or :data:`NO_CONNECTOR`.
+    tile_chamfers : np.ndarray
+        (rows+1) x (cols+1) ``bool``.
+    screws : np.ndarray
+        (rows+1) x (cols+1) ``bool``.
+    opengrid_type : ``"full"`` | ``"lite"``
+    screw_size : ScrewSize
+    """
+
+    tiles: np.ndarray
+    connector_turns: np.ndarray
+    tile_chamfers: np.ndarray
+    screws: np.ndarray
+    opengrid_type: Literal["full", "lite"] = "full"
+    screw_size: ScrewSize = field(default_factory=ScrewSize)
+
+    def __post_init__(self):
+        self.tiles = np.asarray(self.tiles, dtype=bool)
+        self.connector_turns = np.asarray(self.connector_turns, dtype=np.int8)
+        self.tile_chamfers = np.asarray(self.tile_chamfers, dtype=bool)
+        self.screws = np.asarray(self.screws, dtype=bool)
+
+        if self.tiles.ndim != 2:
+            raise ValueError(f"tiles must be 2D, got shape {self.tiles.shape}")
+        rows, cols = self.tiles.shape
+        for name in ("connector_turns", "tile_chamfers", "screws"):
+            shape = getattr(self, name).shape
+            if shape != (rows + 1, cols + 1):
+                raise ValueError(
+                    f"{name} has shape {shape} but expected {(rows + 1, cols + 1)} "
+                    f"(tiles has shape {(rows, cols)})"
+                )
+
+    @classmethod
+    def from_plan(cls, plan: GridPlan) -> "GridPlanArrays":
+        """Convert a GridPlan.
+
+        Raises
+        ------
+        ValueError
+            If a connector angle is not a whole number of quarter turns.
+            ``prepare_grid`` and ``compact.decode`` only produce those.
+        """
+        angles = [[s.connector_angle for s in row] for row in plan.summits]
+        turns = np.full((len(angles), len(angles[0])), NO_CONNECTOR, dtype=np.int8)
+        for i, row in enumerate(angles):
+            for j, angle in enumerate(row):
+                if angle is None:
+                    continue
+                quarter, rest = divmod(angle, 90.0)
+                if rest or not -128 < quarter < 128:
+                    raise ValueError(
+                        f"Connector angle {angle} at summit ({i}, {j}) is not a quarter turn"
+                    )
+                turns[i, j] = quarter
+
+        return cls(
+            tiles=np.array(plan.tiles, dtype=bool).reshape(len(plan.tiles), -1),
+            connector_turns=turns,
+            tile_chamfers=np.array([[s.tile_chamfer for s in row] for row in plan.summits]),
+            screws=np.array([[s.screw for s in row] for row in plan.summits]),
+            opengrid_type=plan.opengrid_type,
+            screw_size=plan.screw_size,
+        )
+
+    def connector_angles(self) -> list[list[float | None]]:
+        """Connector Z-rotation in degrees at every summit, ``None`` = none."""
+        degrees = (self.connector_turns * 90.0).tolist()
+        missing = (self.connector_turns == NO_CONNECTOR).tolist()
+        return [
+            [None if m else a for a, m in zip(row, missing_row)]
+            for row, missing_row in zip(degrees, missing)
+        ]
+
+    def to_plan(self) -> GridPlan:
+        """Convert to a GridPlan.
+
+        The arrays' shapes are checked on construction, so the plan is
+        built without running pydantic validation again.
+        """
+        summits = [
+            [
+                _trusted_summit(angle, chamfer, screw)
+                for angle, chamfer, screw in zip(angles, chamfers, screws)
+            ]
+            for angles, chamfers, screws in zip(
+                self.connector_angles(), self.tile_chamfers.tolist(), self.screws.tolist()
+            )
+        ]
+        return _trusted_plan(self.tiles.tolist(), summits, self.opengrid_type, self.screw_size)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the arrays."""
+        return (
+            self.tiles.nbytes
+            + self.connector_turns.nbytes
+            + self.tile_chamfers.nbytes
+            + self.screws.nbytes
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, GridPlanArrays):
+            return NotImplemented
+        return (
+            self.opengrid_type == other.opengrid_type
+            and self.screw_size == other.screw_size
+            and np.array_equal(self.tiles, other.tiles)
+            and np.array_equal(self.connector_turns, other.connector_turns)
+            and np.array_equal(self.tile_chamfers, other.tile_chamfers)
+            and np.array_equal(self.screws, other.screws)
+        )
@@ -0,0 +1,94 @@
+"""Connected components of a plan's tiles.
+
+Two tiles are connected when they share an edge or a corner: tiles that
+only meet diagonally still share the frame at their common summit.  Tiles
+of different components never touch, so each component can be drawn on
+its own and the results kept side by side instead of fused.
+
+"""
+
+import numpy as np
+
+from ogt.prepare.frozen import FrozenGridPlan
+
+_NEIGHBORS = tuple((di, dj) for di in (-1, 0, 1) for dj in (-1, 0, 1) if di or dj)
+
+
+def label_components(tiles: np.ndarray) -> tuple[np.ndarray, int]:
+    """Label the 8-connected components of a tile mask.
+
+    Parameters
+    ----------
+    tiles : np.ndarray
+        rows x cols ``bool``, True = tile.
+
+    Returns
+    -------
+    labels : np.ndarray
+        rows x cols ``int32``, 0 where there is no tile, otherwise the
+        component number from 1, numbered in the row-major order of their
+        first tile.
+    count : int
+        Number of components.
+    """
+    tiles = np.asarray(tiles, dtype=bool)
+    rows, cols = tiles.shape
+    labels = np.zeros((rows, cols), dtype=np.int32)
+    # Python lists: the flood fill below touches one cell at a time
+    remaining = tiles.tolist()
+    count = 0
+    for start in zip(*np.nonzero(tiles)):
+        i, j = int(start[0]), int(start[1])
+        if not remaining[i][j]:
+            continue
+        count += 1
+        remaining[i][j] = False
+        stack = [(i, j)]
+        while stack:
+            i, j = stack.pop()
+            labels[i, j] = count
+            for di, dj in _NEIGHBORS:
+                ni, nj = i + di, j + dj
+                if 0 <= ni < rows and 0 <= nj < cols and remaining[ni][nj]:
+                    remaining[ni][nj] = False
+                    stack.append((ni, nj))
+    return labels, count
+
+
+def component_plans(
+    plan: FrozenGridPlan, labels: np.ndarray, count: int
+) -> list[tuple[int, int, FrozenGridPlan]]:
+    """Split *plan* into one plan per component of *labels*.
+
+    Each plan covers its component's bounding box, with only that
+    component's tiles and only the summits on their corners, since a
+    summit's cutouts never reach further than its 4 tiles.
+
+    Returns
+    -------
+    list[tuple[int, int, FrozenGridPlan]]
+        ``(row, col, plan)`` per component, in label order; *row* and
+        *col* are the bounding box's top-left tile in *plan*.
+    """
+    result = []
+    for label in range(1, count + 1):
+        mask = labels == label
+        rows = np.flatnonzero(mask.any(axis=1))
+        cols = np.flatnonzero(mask.any(axis=0))
+        r0, r1, c0, c1 = rows[0], rows[-1] + 1, cols[0], cols[-1] + 1
+        tiles = mask[r0:r1, c0:c1]
+
+        # Summits at a corner of one of the component's tiles
+        padded = np.pad(tiles, 1)
+        near = padded[:-1, :-1] | padded[:-1, 1:] | padded[1:, :-1] | padded[1:, 1:]
+        summits = (slice(r0, r1 + 1), slice(c0, c1 + 1))
+        sub = FrozenGridPlan(
+            tiles=tiles,
+            connector_angles=np.where(near, plan.connector_angles[summits], np.nan),
+            tile_chamfers=near & plan.tile_chamfers[summits],
+            screws=near & plan.screws[summits],
+            opengrid_type=plan.opengrid_type,
+            screw_size=plan.screw_size,
+        )
+        result.append((int(r0), int(c0), sub))
+    return result
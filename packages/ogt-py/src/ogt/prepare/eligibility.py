@@ -0,0 +1,80 @@
+"""Summit eligibility from 4-bit neighbor codes.
+
+Summit (i, j) touches up to 4 cells: tl = (i-1, j-1), tr = (i-1, j),
+bl = (i, j-1) and br = (i, j).  Packing whether each one is a tile gives a
+code from 0 to 15, and every summit feature rule only depends on that code.
+The rules, and the connector direction, are therefore 16-entry lookup
+tables, applied to the codes of all summits at once.
+
+"""
+
+import math
+
+import numpy as np
+
+# Bit of each neighbor cell in a summit code
+TL = 8
+TR = 4
+BL = 2
+BR = 1
+
+
+def _code_table(rule) -> np.ndarray:
+    """Evaluate ``rule(tl, tr, bl, br)`` for all 16 codes."""
+    return np.array(
+        [rule(bool(c & TL), bool(c & TR), bool(c & BL), bool(c & BR)) for c in range(16)]
+    )
+
+
+def _connector_angle(tl: bool, tr: bool, bl: bool, br: bool) -> float:
+    """Z-rotation (degrees) of a connector cutout, NaN where not eligible.
+
+    Eligible summits have two tiles sharing an edge.  The cutout's
+    canonical orientation extends in +X; the rotation maps it to point
+    into tile material.
+    """
+    # Horizontal edge (top row == each other, bottom row == each other, differ)
+    if tl == tr and bl == br and tl != bl:
+        # Tiles below in grid = -Y in world, tiles above = +Y
+        return -90.0 if bl else 90.0
+    # Vertical edge (left col == each other, right col == each other, differ)
+    if tl == bl and tr == br and tl != tr:
+        # Tiles on the right point +X, tiles on the left -X
+        return 0.0 if tr else 180.0
+    return math.nan
+
+
+CONNECTOR_ANGLE = _code_table(_connector_angle)
+
+# Two tiles sharing an edge: a horizontal or a vertical grid edge
+CONNECTOR_ELIGIBLE = ~np.isnan(CONNECTOR_ANGLE)
+
+# Exactly one tile: an outside corner
+TILE_CHAMFER_ELIGIBLE = _code_table(lambda tl, tr, bl, br: tl + tr + bl + br == 1)
+
+# Four tiles: an inside summit
+SCREW_ELIGIBLE = _code_table(lambda tl, tr, bl, br: tl and tr and bl and br)
+
+
+def summit_codes(tiles: np.ndarray) -> np.ndarray:
+    """Compute the neighbor code of every summit.
+
+    Parameters
+    ----------
+    tiles : np.ndarray
+        rows x cols boolean array, True = tile.
+
+    Returns
+    -------
+    np.ndarray
+        (rows+1) x (cols+1) ``uint8`` array of codes.  Cells outside the
+        grid count as holes.
+    """
+    padded = np.pad(np.asarray(tiles, dtype=np.uint8), 1)
+    codes = (
+        padded[:-1, :-1] * TL  # tl = (i-1, j-1)
+        | padded[:-1, 1:] * TR  # tr = (i-1, j)
+        | padded[1:, :-1] * BL  # bl = (i, j-1)
+        | padded[1:, 1:] * BR  # br = (i, j)
+    )
+    return codes.astype(np.uint8)
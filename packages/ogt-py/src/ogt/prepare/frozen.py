@@ -0,0 +1,198 @@
+"""Immutable, hashable form of a GridPlan.
+
+:class:`~ogt.prepare.types.GridPlan` is a mutable pydantic model, so it
+cannot be a ``dict`` or ``lru_cache`` key.  :class:`FrozenGridPlan` holds
+the same plan in read-only arrays, hashes on a content digest, and caches
+the counts callers use to size work.
+
+"""
+
+import hashlib
+import math
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Literal
+
+import numpy as np
+
+from ogt.constants import TILE_SIZE
+from ogt.prepare.arrays import NO_CONNECTOR, GridPlanArrays
+from ogt.prepare.types import GridPlan, ScrewSize, _trusted_plan, _trusted_summit
+
+
+def _read_only(array: np.ndarray, dtype) -> np.ndarray:
+    array = np.array(array, dtype=dtype)
+    array.flags.writeable = False
+    return array
+
+
+@dataclass(frozen=True, eq=False)
+class FrozenGridPlan:
+    """Exhaustive specification of what to draw, immutable and hashable.
+
+    Two frozen plans are equal, and hash the same, when their
+    :meth:`digest` is; the digest covers every field.
+
+    Attributes
+    ----------
+    tiles : np.ndarray
+        rows x cols ``bool``, True = place tile.  Read-only, like every
+        array here.
+    connector_angles : np.ndarray
+        (rows+1) x (cols+1) ``float64``, connector Z-rotation in degrees,
+        NaN = no connector.
+    tile_chamfers : np.ndarray
+        (rows+1) x (cols+1) ``bool``.
+    screws : np.ndarray
+        (rows+1) x (cols+1) ``bool``.
+    opengrid_type : ``"full"`` | ``"lite"``
+    screw_size : ScrewSize
+    """
+
+    tiles: np.ndarray
+    connector_angles: np.ndarray
+    tile_chamfers: np.ndarray
+    screws: np.ndarray
+    opengrid_type: Literal["full", "lite"] = "full"
+    screw_size: ScrewSize = field(default_factory=ScrewSize)
+
+    def __post_init__(self):
+        # Copies, so the caller's arrays cannot change the plan afterwards
+        object.__setattr__(self, "tiles", _read_only(self.tiles, bool))
+        # + 0.0 turns -0.0 into 0.0, which would otherwise change the digest
+        angles = np.asarray(self.connector_angles, dtype=np.float64) + 0.0
+        object.__setattr__(self, "connector_angles", _read_only(angles, np.float64))
+        object.__setattr__(self, "tile_chamfers", _read_only(self.tile_chamfers, bool))
+        object.__setattr__(self, "screws", _read_only(self.screws, bool))
+
+        if self.tiles.ndim != 2:
+            raise ValueError(f"tiles must be 2D, got shape {self.tiles.shape}")
+        rows, cols = self.tiles.shape
+        for name in ("connector_angles", "tile_chamfers", "screws"):
+            shape = getattr(self, name).shape
+            if shape != (rows + 1, cols + 1):
+                raise ValueError(
+                    f"{name} has shape {shape} but expected {(rows + 1, cols + 1)} "
+                    f"(tiles has shape {(rows, cols)})"
+                )
+
+    def __reduce__(self):
+        # Rebuild through __init__: unpickled and deep-copied arrays come
+        # back writeable, and the cached digest and counts are not kept
+        return (
+            self.__class__,
+            (
+                self.tiles,
+                self.connector_angles,
+                self.tile_chamfers,
+                self.screws,
+                self.opengrid_type,
+                self.screw_size,
+            ),
+        )
+
+    @classmethod
+    def from_plan(cls, plan: GridPlan | GridPlanArrays) -> "FrozenGridPlan":
+        """Freeze a GridPlan or GridPlanArrays."""
+        if isinstance(plan, GridPlanArrays):
+            angles = np.where(
+                plan.connector_turns == NO_CONNECTOR, np.nan, plan.connector_turns * 90.0
+            )
+            return cls(
+                tiles=plan.tiles,
+                connector_angles=angles,
+                tile_chamfers=plan.tile_chamfers,
+                screws=plan.screws,
+                opengrid_type=plan.opengrid_type,
+                screw_size=plan.screw_size,
+            )
+        angles = [
+            [np.nan if s.connector_angle is None else s.connector_angle for s in row]
+            for row in plan.summits
+        ]
+        return cls(
+            tiles=np.array(plan.tiles, dtype=bool).reshape(len(plan.tiles), -1),
+            connector_angles=angles,
+            tile_chamfers=[[s.tile_chamfer for s in row] for row in plan.summits],
+            screws=[[s.screw for s in row] for row in plan.summits],
+            opengrid_type=plan.opengrid_type,
+            screw_size=plan.screw_size,
+        )
+
+    def to_plan(self) -> GridPlan:
+        """Convert to a (new, mutable) GridPlan."""
+        angles = self.connector_angles.tolist()
+        summits = [
+            [
+                _trusted_summit(None if math.isnan(angle) else angle, chamfer, screw)
+                for angle, chamfer, screw in zip(*row)
+            ]
+            for row in zip(angles, self.tile_chamfers.tolist(), self.screws.tolist())
+        ]
+        return _trusted_plan(self.tiles.tolist(), summits, self.opengrid_type, self.screw_size)
+
+    def digest(self) -> str:
+        """SHA-256 of the plan's content, as hex.  Computed once."""
+        return self._digest
+
+    @cached_property
+    def _digest(self) -> str:
+        h = hashlib.sha256()
+        size = self.screw_size
+        h.update(
+            f"{self.opengrid_type}|{size.diameter!r}|{size.head_diameter!r}|"
+            f"{size.head_inset!r}|{self.tiles.shape}|".encode()
+        )
+        h.update(np.packbits(self.tiles).tobytes())
+        # All NaNs hash alike, whatever their payload
+        h.update(np.nan_to_num(self.connector_angles, nan=np.inf).tobytes())
+        h.update(np.packbits(self.tile_chamfers).tobytes())
+        h.update(np.packbits(self.screws).tobytes())
+        return h.hexdigest()
+
+    def __hash__(self) -> int:
+        return int(self._digest[:16], 16)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FrozenGridPlan):
+            return NotImplemented
+        return self._digest == other._digest
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """``(rows, cols)``."""
+        return self.tiles.shape  # type: ignore[return-value]
+
+    @cached_property
+    def tile_count(self) -> int:
+        return int(np.count_nonzero(self.tiles))
+
+    @cached_property
+    def connector_count(self) -> int:
+        return int(np.count_nonzero(~np.isnan(self.connector_angles)))
+
+    @cached_property
+    def tile_chamfer_count(self) -> int:
+        return int(np.count_nonzero(self.tile_chamfers))
+
+    @cached_property
+    def screw_count(self) -> int:
+        return int(np.count_nonzero(self.screws))
+
+    @cached_property
+    def extents(self) -> tuple[float, float, float, float]:
+        """``(xmin, ymin, xmax, ymax)`` of the placed tiles, in mm.
+
+        World coordinates as drawn: columns along +X and rows along -Y
+        from the origin.  All zero when there are no tiles.
+        """
+        rows = np.flatnonzero(self.tiles.any(axis=1))
+        cols = np.flatnonzero(self.tiles.any(axis=0))
+        if not rows.size:
+            return (0.0, 0.0, 0.0, 0.0)
+        return (
+            float(cols[0] * TILE_SIZE),
+            float(-(rows[-1] + 1) * TILE_SIZE),
+            float((cols[-1] + 1) * TILE_SIZE),
+            float(-rows[0] * TILE_SIZE),
+        )
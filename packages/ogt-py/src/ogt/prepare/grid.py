@@ -2,54 +2,41 @@
 
 from typing import Literal
 
-from ogt.prepare.connectors import (
-    _connector_direction,
-    compute_eligible_connector_positions,
-)
-from ogt.prepare.screws import (
-    compute_corner_screw_positions,
-    compute_eligible_screw_positions,
+import numpy as np
+
+from ogt.layout import Layout, layout_tiles
+from ogt.prepare.arrays import CONNECTOR_TURNS, NO_CONNECTOR, GridPlanArrays
+from ogt.prepare.eligibility import (
+    SCREW_ELIGIBLE,
+    TILE_CHAMFER_ELIGIBLE,
+    summit_codes,
 )
-from ogt.prepare.tile_chamfers import compute_eligible_tile_chamfer_positions
+from ogt.prepare.screws import corner_screw_mask
 from ogt.prepare.types import (
     LITE_DEFAULT_SCREW_DIAMETER,
     LITE_DEFAULT_SCREW_HEAD_DIAMETER,
     LITE_DEFAULT_SCREW_HEAD_INSET,
     GridPlan,
     ScrewSize,
-    SummitFeatures,
 )
-from ogt.slot import Slot, Tile
 
 
-def prepare_grid(
-    layout: list[list[Slot]],
+def prepare_grid_arrays(
+    layout: Layout,
     opengrid_type: Literal["full", "lite"] = "full",
     connectors: bool = False,
     tile_chamfers: bool = False,
     screws: None | Literal["corners", "all"] = None,
     screw_size: ScrewSize | None = None,
-) -> GridPlan:
-    """Analyze a layout and produce an exhaustive GridPlan.
+) -> GridPlanArrays:
+    """Analyze a layout and produce an exhaustive plan, one array per feature.
 
-    Parameters
-    ----------
-    layout : list[list[Slot]]
-        2D array of Slot objects.
-    opengrid_type : ``"full"`` | ``"lite"``
-        Which tile variant to use.
-    connectors : bool
-        Whether to add connector cutouts.
-    tile_chamfers : bool
-        Whether to add tile chamfer cutouts.
-    screws : None | ``"corners"`` | ``"all"``
-        Screw placement mode.
-    screw_size : ScrewSize | None
-        Screw dimensions.  ``None`` uses type-specific defaults.
+    Same parameters as :func:`prepare_grid`, which is this function
+    followed by :meth:`GridPlanArrays.to_plan`.
 
     Returns
     -------
-    GridPlan
+    GridPlanArrays
     """
     if screw_size is None:
         if opengrid_type == "lite":
@@ -61,52 +48,75 @@ def prepare_grid(
         else:
             screw_size = ScrewSize()
 
-    n_rows = len(layout)
-    n_cols = len(layout[0])
-
-    # Build tiles bool grid
-    tiles = [[isinstance(slot, Tile) for slot in row] for row in layout]
-
-    # Initialize summits
-    summits = [[SummitFeatures() for _ in range(n_cols + 1)] for _ in range(n_rows + 1)]
+    # Build tiles bool grid, then every summit's neighbor code in one pass
+    tiles = layout_tiles(layout)
+    codes = summit_codes(tiles)
+    no_features = np.zeros(codes.shape, dtype=bool)
 
     # Connectors
     if connectors:
-        eligible = compute_eligible_connector_positions(layout)
-        for i in range(n_rows + 1):
-            for j in range(n_cols + 1):
-                if eligible[i][j]:
-                    summits[i][j].connector_angle = _connector_direction(layout, i, j)
+        connector_turns = CONNECTOR_TURNS[codes]
+    else:
+        connector_turns = np.full(codes.shape, NO_CONNECTOR, dtype=np.int8)
 
     # Tile chamfers
     if tile_chamfers:
         if screws:
             # When screws are enabled, chamfers apply only at outside grid corners
-            corners = [(0, 0), (0, n_cols), (n_rows, 0), (n_rows, n_cols)]
-            for ci, cj in corners:
-                summits[ci][cj].tile_chamfer = True
+            chamfer_mask = no_features.copy()
+            chamfer_mask[[0, 0, -1, -1], [0, -1, 0, -1]] = True
         else:
-            eligible = compute_eligible_tile_chamfer_positions(layout)
-            for i in range(n_rows + 1):
-                for j in range(n_cols + 1):
-                    if eligible[i][j]:
-                        summits[i][j].tile_chamfer = True
+            chamfer_mask = TILE_CHAMFER_ELIGIBLE[codes]
+    else:
+        chamfer_mask = no_features
 
     # Screws
     if screws:
-        eligible = compute_eligible_screw_positions(layout)
+        screw_mask = SCREW_ELIGIBLE[codes]
         if screws == "corners":
-            placement = compute_corner_screw_positions(eligible)
-        else:
-            placement = eligible
-        for i in range(len(placement)):
-            for j in range(len(placement[i])):
-                if placement[i][j]:
-                    summits[i][j].screw = True
-
-    return GridPlan(
-        tiles=tiles,
-        summits=summits,
+            screw_mask = corner_screw_mask(screw_mask)
+    else:
+        screw_mask = no_features
+
+    return GridPlanArrays(
+        tiles=tiles.copy(),
+        connector_turns=connector_turns,
+        tile_chamfers=chamfer_mask,
+        screws=screw_mask,
         opengrid_type=opengrid_type,
         screw_size=screw_size,
     )
+
+
+def prepare_grid(
+    layout: Layout,
+    opengrid_type: Literal["full", "lite"] = "full",
+    connectors: bool = False,
+    tile_chamfers: bool = False,
+    screws: None | Literal["corners", "all"] = None,
+    screw_size: ScrewSize | None = None,
+) -> GridPlan:
+    """Analyze a layout and produce an exhaustive GridPlan.
+
+    Parameters
+    ----------
+    layout : list[list[Slot]] | LayoutMask
+        2D array of Slot objects, or the equivalent boolean mask.
+    opengrid_type : ``"full"`` | ``"lite"``
+        Which tile variant to use.
+    connectors : bool
+        Whether to add connector cutouts.
+    tile_chamfers : bool
+        Whether to add tile chamfer cutouts.
+    screws : None | ``"corners"`` | ``"all"``
+        Screw placement mode.
+    screw_size : ScrewSize | None
+        Screw dimensions.  ``None`` uses type-specific defaults.
+
+    Returns
+    -------
+    GridPlan
+    """
+    return prepare_grid_arrays(
+        layout, opengrid_type, connectors, tile_chamfers, screws, screw_size
+    ).to_plan()
@@ -1,10 +1,13 @@
 """Screw hole eligibility computation."""
 
-from ogt.slot import Slot, Tile
+import numpy as np
+
+from ogt.layout import Layout, layout_tiles
+from ogt.prepare.eligibility import SCREW_ELIGIBLE, summit_codes
 
 
 def compute_eligible_screw_positions(
-    layout: list[list[Slot]],
+    layout: Layout,
 ) -> list[list[bool]]:
     """Compute which summit positions are eligible for screw holes.
 
@@ -12,25 +15,8 @@ def compute_eligible_screw_positions(
     Out-of-bounds neighbors are treated as Hole.
 
     """
-    n_rows = len(layout)
-    n_cols = len(layout[0])
-
-    def is_tile(r: int, c: int) -> bool:
-        if 0 <= r < n_rows and 0 <= c < n_cols:
-            return isinstance(layout[r][c], Tile)
-        return False
-
-    result: list[list[bool]] = []
-    for i in range(n_rows + 1):
-        row: list[bool] = []
-        for j in range(n_cols + 1):
-            tl = is_tile(i - 1, j - 1)
-            tr = is_tile(i - 1, j)
-            bl = is_tile(i, j - 1)
-            br = is_tile(i, j)
-            row.append(tl and tr and bl and br)
-        result.append(row)
-    return result
+    codes = summit_codes(layout_tiles(layout))
+    return SCREW_ELIGIBLE[codes].tolist()
 
 
 def compute_corner_screw_positions(
@@ -44,24 +30,14 @@ def compute_corner_screw_positions(
     Out-of-bounds counts as not eligible.
 
     """
-    n_rows = len(eligible)
-    n_cols = len(eligible[0])
+    return corner_screw_mask(np.asarray(eligible, dtype=bool)).tolist()
 
-    def is_eligible(r: int, c: int) -> bool:
-        if 0 <= r < n_rows and 0 <= c < n_cols:
-            return eligible[r][c]
-        return False
 
-    result: list[list[bool]] = []
-    for i in range(n_rows):
-        row: list[bool] = []
-        for j in range(n_cols):
-            if not eligible[i][j]:
-                row.append(False)
-                continue
-            # Pass-through on an axis = both neighbors on that axis are eligible
-            h_through = is_eligible(i, j - 1) and is_eligible(i, j + 1)
-            v_through = is_eligible(i - 1, j) and is_eligible(i + 1, j)
-            row.append(not h_through and not v_through)
-        result.append(row)
-    return result
+def corner_screw_mask(eligible: np.ndarray) -> np.ndarray:
+    """Array version of :func:`compute_corner_screw_positions`."""
+    padded = np.pad(eligible, 1)
+    center = padded[1:-1, 1:-1]
+    # Pass-through on an axis = both neighbors on that axis are eligible
+    h_through = padded[1:-1, :-2] & padded[1:-1, 2:]
+    v_through = padded[:-2, 1:-1] & padded[2:, 1:-1]
+    return center & ~h_through & ~v_through
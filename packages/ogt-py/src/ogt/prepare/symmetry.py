@@ -0,0 +1,140 @@
+"""Canonical orientation of plans under rotation and mirroring.
+
+Tiles, connector cutouts, chamfers and screws are all symmetric enough that
+rotating a plan by quarter turns or mirroring it left-right gives the
+geometry of the original part, rotated or mirrored the same way.  Such
+plans therefore share one canonical form, which can be drawn once.
+
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from ogt.prepare.arrays import NO_CONNECTOR, GridPlanArrays
+from ogt.prepare.types import GridPlan
+
+
+@dataclass(frozen=True)
+class PlanTransform:
+    """Quarter turns and mirroring of a rows x cols plan.
+
+    The plan is first mirrored left-right (column ``j`` becomes
+    ``cols - 1 - j``) if *mirror*, then rotated counterclockwise by *turns*
+    quarter turns.  The result keeps the grid's placement convention: its
+    top-left corner at the origin, rows along -Y and columns along +X.
+
+    Attributes
+    ----------
+    turns : int
+        Counterclockwise quarter turns, 0 to 3.
+    mirror : bool
+    rows, cols : int
+        Size of the plan the transform applies to.
+    """
+
+    turns: int
+    mirror: bool
+    rows: int
+    cols: int
+
+    @property
+    def is_identity(self) -> bool:
+        return self.turns == 0 and not self.mirror
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """``(rows, cols)`` of the transformed plan."""
+        return (self.cols, self.rows) if self.turns % 2 else (self.rows, self.cols)
+
+    def inverse(self) -> "PlanTransform":
+        """The transform undoing this one."""
+        # Mirroring then turning is an involution; pure turns go back
+        turns = self.turns if self.mirror else -self.turns % 4
+        return PlanTransform(turns, self.mirror, *self.shape)
+
+    def apply_array(self, array: np.ndarray) -> np.ndarray:
+        """Transform a tile or summit array laid out like the plan."""
+        if self.mirror:
+            array = array[:, ::-1]
+        return np.ascontiguousarray(np.rot90(array, self.turns))
+
+    def apply_turns(self, connector_turns: np.ndarray) -> np.ndarray:
+        """Transform a connector rotation array (values only, not positions)."""
+        turns = connector_turns.astype(np.int16)
+        if self.mirror:
+            # Mirroring maps angle a to 180 - a
+            turns = 2 - turns
+        # Back to -1..2, the range prepare_grid uses
+        turns = (turns + self.turns + 1) % 4 - 1
+        return np.where(connector_turns == NO_CONNECTOR, NO_CONNECTOR, turns).astype(np.int8)
+
+    def apply(self, plan: GridPlanArrays) -> GridPlanArrays:
+        """Transform a plan, moving its features and turning its connectors."""
+        if plan.tiles.shape != (self.rows, self.cols):
+            raise ValueError(
+                f"Transform is for a {self.rows}x{self.cols} plan, got {plan.tiles.shape}"
+            )
+        return GridPlanArrays(
+            tiles=self.apply_array(plan.tiles),
+            connector_turns=self.apply_turns(self.apply_array(plan.connector_turns)),
+            tile_chamfers=self.apply_array(plan.tile_chamfers),
+            screws=self.apply_array(plan.screws),
+            opengrid_type=plan.opengrid_type,
+            screw_size=plan.screw_size,
+        )
+
+
+def _orientation_key(plan: GridPlanArrays) -> tuple:
+    return (
+        plan.tiles.shape,
+        np.packbits(plan.tiles).tobytes(),
+        plan.connector_turns.tobytes(),
+        np.packbits(plan.tile_chamfers).tobytes(),
+        np.packbits(plan.screws).tobytes(),
+    )
+
+
+def canonicalize(
+    plan: GridPlan | GridPlanArrays,
+) -> tuple[GridPlan | GridPlanArrays, PlanTransform]:
+    """Return the canonical orientation of *plan*, and how to get back.
+
+    Of the 8 rotations and mirror images of *plan*, the canonical one is
+    the smallest by (shape, tiles, connectors, chamfers, screws), so every
+    orientation of the same part gives the same canonical plan.
+
+    Parameters
+    ----------
+    plan : GridPlan | GridPlanArrays
+
+    Returns
+    -------
+    canonical : GridPlan | GridPlanArrays
+        Same type as *plan*.
+    transform : PlanTransform
+        Maps *canonical* back to *plan*: ``transform.apply`` on the plan
+        arrays, and :func:`ogt.draw.transform_grid` on drawn geometry.
+
+    Raises
+    ------
+    ValueError
+        If *plan* has a connector angle that is not a whole number of
+        quarter turns, see :meth:`GridPlanArrays.from_plan`.
+    """
+    arrays = GridPlanArrays.from_plan(plan) if isinstance(plan, GridPlan) else plan
+    rows, cols = arrays.tiles.shape
+
+    best = None
+    for mirror in (False, True):
+        for turns in range(4):
+            transform = PlanTransform(turns, mirror, rows, cols)
+            candidate = transform.apply(arrays)
+            key = _orientation_key(candidate)
+            if best is None or key < best[0]:
+                best = (key, candidate, transform)
+
+    _, canonical, transform = best  # type: ignore[misc]
+    if isinstance(plan, GridPlan):
+        canonical = canonical.to_plan()
+    return canonical, transform.inverse()
@@ -1,10 +1,11 @@
 """Tile chamfer eligibility computation."""
 
-from ogt.slot import Slot, Tile
+from ogt.layout import Layout, layout_tiles
+from ogt.prepare.eligibility import TILE_CHAMFER_ELIGIBLE, summit_codes
 
 
 def compute_eligible_tile_chamfer_positions(
-    layout: list[list[Slot]],
+    layout: Layout,
 ) -> list[list[bool]]:
     """Compute which summit positions are eligible for tile chamfer
     cutouts.
@@ -15,22 +16,5 @@ def compute_eligible_tile_chamfer_positions(
     Out-of-bounds neighbors are treated as Hole.
 
     """
-    n_rows = len(layout)
-    n_cols = len(layout[0])
-
-    def is_tile(r: int, c: int) -> bool:
-        if 0 <= r < n_rows and 0 <= c < n_cols:
-            return isinstance(layout[r][c], Tile)
-        return False
-
-    result: list[list[bool]] = []
-    for i in range(n_rows + 1):
-        row: list[bool] = []
-        for j in range(n_cols + 1):
-            tl = is_tile(i - 1, j - 1)
-            tr = is_tile(i - 1, j)
-            bl = is_tile(i, j - 1)
-            br = is_tile(i, j)
-            row.append(sum((tl, tr, bl, br)) == 1)
-        result.append(row)
-    return result
+    codes = summit_codes(layout_tiles(layout))
+    return TILE_CHAMFER_ELIGIBLE[codes].tolist()
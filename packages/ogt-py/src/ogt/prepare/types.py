@@ -79,3 +79,48 @@ class GridPlan(BaseModel):
             )
 
         return self
+
+
+# Trusted construction, for plans ogt builds itself.  Validation re-checks
+# every field of every summit and the plan's dimensions, which the
+# producers (prepare_grid, compact.decode) already guarantee.  Plans from
+# user input (``ogt draw`` JSON) must keep going through the validating
+# constructors.
+
+_SUMMIT_FIELDS = set(SummitFeatures.model_fields)
+_new_model = object.__new__
+_set_slot = object.__setattr__
+
+
+def _trusted_summit(
+    connector_angle: float | None, tile_chamfer: bool, screw: bool
+) -> SummitFeatures:
+    """Build a SummitFeatures without validation.
+
+    Equivalent to ``SummitFeatures.model_construct`` with every field set,
+    but without its per-field bookkeeping, which costs more than
+    validating a model this small.
+    """
+    summit = _new_model(SummitFeatures)
+    _set_slot(
+        summit,
+        "__dict__",
+        {"connector_angle": connector_angle, "tile_chamfer": tile_chamfer, "screw": screw},
+    )
+    # Every field is set, so pydantic never needs to add to this set
+    _set_slot(summit, "__pydantic_fields_set__", _SUMMIT_FIELDS)
+    _set_slot(summit, "__pydantic_extra__", None)
+    _set_slot(summit, "__pydantic_private__", None)
+    return summit
+
+
+def _trusted_plan(
+    tiles: list[list[bool]],
+    summits: list[list[SummitFeatures]],
+    opengrid_type: Literal["full", "lite"],
+    screw_size: ScrewSize,
+) -> GridPlan:
+    """Build a GridPlan without validation.  Dimensions must already match."""
+    return GridPlan.model_construct(
+        tiles=tiles, summits=summits, opengrid_type=opengrid_type, screw_size=screw_size
+    )
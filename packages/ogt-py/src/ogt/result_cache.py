@@ -0,0 +1,129 @@
+"""Content-addressed cache of exported grid files.
+
+Entries are keyed on the ogt version, the canonical compact code of a plan
+(see :mod:`ogt.compact`), the draw options, the export format and the
+tessellation settings, and hold the exported file bytes.  A new ogt version
+may draw the same plan differently, so an upgrade starts from an empty
+cache; old entries age out under the size cap.  The cache directory can be capped in size;
+the least recently used entries are evicted first.
+
+"""
+
+import hashlib
+import os
+import tempfile
+from collections.abc import Mapping
+from pathlib import Path
+
+from ogt._version import ogt_version
+from ogt.compact import decode, encode
+from ogt.prepare.types import GridPlan
+
+DEFAULT_TOLERANCE = 0.1
+DEFAULT_ANGULAR_TOLERANCE = 0.1
+
+
+def result_key(
+    plan: GridPlan,
+    fmt: str,
+    tolerance: float = DEFAULT_TOLERANCE,
+    angular_tolerance: float = DEFAULT_ANGULAR_TOLERANCE,
+    draw_options: Mapping[str, object] | None = None,
+) -> str:
+    """Return the cache key for exporting *plan* as *fmt*.
+
+    Plans that survive a compact round trip are keyed on their canonical
+    code, so every spelling of the same grid shares an entry.  Other plans
+    (hand-edited JSON with features the compact format cannot express,
+    screws over 25.5 mm, grids over ``MAX_CELLS``) are keyed on their full
+    JSON dump.
+
+    *draw_options* are the keyword arguments given to
+    :func:`ogt.draw.draw_grid`.  Most of them (strategy, glue, boolean
+    options...) can change the exported file, so all are part of the key.
+    Options left at their default and options passed with the default
+    value give different keys: a cache miss, never a wrong entry.
+    """
+    try:
+        code = encode(plan)
+        compact = decode(code) == plan
+    except ValueError:
+        compact = False
+    if compact:
+        identity = f"code:{code}"
+    else:
+        identity = f"json:{plan.model_dump_json()}"
+
+    if fmt == "stl":
+        settings = f"{tolerance!r}:{angular_tolerance!r}"
+    else:
+        # Only STL is tessellated
+        settings = ""
+
+    options = repr(sorted((draw_options or {}).items()))
+
+    payload = f"{ogt_version()}|{identity}|{options}|{fmt}|{settings}"
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResultCache:
+    """Directory of exported files, one file per key.
+
+    Parameters
+    ----------
+    directory : str | Path
+        Where entries are stored.  Created on first write.
+    max_bytes : int | None
+        Size cap for all entries together.  ``None`` means unbounded.
+    """
+
+    def __init__(self, directory: str | Path, max_bytes: int | None = None):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.bin"
+
+    def get(self, key: str) -> bytes | None:
+        """Return the stored bytes for *key*, or ``None`` on a miss."""
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        # Mark as recently used
+        os.utime(path)
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store *data* under *key*, then evict down to the size cap."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove least recently used entries until under ``max_bytes``."""
+        if self.max_bytes is None:
+            return
+
+        entries = []
+        for path in self.directory.glob("*.bin"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
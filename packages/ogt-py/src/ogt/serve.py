@@ -0,0 +1,398 @@
+"""Local HTTP server that keeps the CAD engine warm between requests.
+
+Each ``ogt generate`` call pays for the cadquery import and for building
+the tile and cutout templates.  ``ogt serve`` does this once per worker
+process, then answers requests from a bounded pool of warm workers.
+
+Requests are ``POST /generate`` with a JSON body holding either a compact
+``code`` or a full ``plan`` (the ``GridPlan`` JSON written by
+``ogt prepare``), plus optional ``format``, ``tolerance`` and
+``angular_tolerance``.  The response body is the exported file.
+``GET /health`` answers ``ok``.  The server only starts listening once
+every worker is warm.
+
+Requests take a slot before their body is parsed, so decoding is bounded
+like drawing.  Grids over ``max_tiles`` are refused, and a drawing that
+runs past ``timeout`` is answered with 504.  A worker cannot be stopped
+alone, so a timeout or a crashed worker replaces the whole pool; the
+other requests it was drawing get 503.
+
+The server listens on a TCP port or a Unix socket and never makes
+outgoing connections.
+
+"""
+
+import json
+import multiprocessing
+import os
+import socketserver
+import threading
+from collections.abc import Generator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from ogt.compact import decode
+from ogt.generate import SingleFlight, export_bytes
+from ogt.prepare.types import GridPlan
+from ogt.result_cache import DEFAULT_ANGULAR_TOLERANCE, DEFAULT_TOLERANCE, result_key
+
+CONTENT_TYPES = {
+    "stl": "model/stl",
+    "step": "model/step",
+}
+
+# Largest accepted request body; a 100x100 plan dump is well under this
+MAX_BODY_BYTES = 16 * 1024 * 1024
+
+# Largest grid drawn by default, in tiles (rows x cols); a 24x16 grid
+# with every feature already takes minutes
+DEFAULT_MAX_TILES = 1024
+
+# Seconds a request waits for its drawing by default, queue included,
+# before it is answered with 504
+DEFAULT_TIMEOUT = 600.0
+
+
+def _warm_worker(cache_dir: str | None) -> None:
+    """Pool initializer: load cadquery and build every template."""
+    from ogt.draw.connectors import make_connector_cutout
+    from ogt.draw.template_cache import set_cache_dir
+    from ogt.draw.tile.chamfers import make_tile_chamfer_cutout
+    from ogt.draw.tile.full import TILE_THICKNESS, make_opengrid_full_tile
+    from ogt.draw.tile.lite import LITE_TILE_THICKNESS, make_opengrid_lite_tile
+
+    if cache_dir is not None:
+        set_cache_dir(cache_dir)
+
+    make_opengrid_full_tile()
+    make_opengrid_lite_tile()
+    make_connector_cutout()
+    make_tile_chamfer_cutout(TILE_THICKNESS)
+    make_tile_chamfer_cutout(LITE_TILE_THICKNESS)
+
+
+def _render_bytes(
+    plan_json: str, fmt: str, draw_kwargs: dict, tolerance: float, angular_tolerance: float
+) -> bytes:
+    """Worker task: draw a plan and return the exported file bytes."""
+    from ogt.draw import draw_grid
+
+    plan = GridPlan.model_validate_json(plan_json)
+    return export_bytes(draw_grid(plan, **draw_kwargs), fmt, tolerance, angular_tolerance)
+
+
+class RequestError(Exception):
+    """A request the server refuses, with the HTTP status to answer."""
+
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+    def __reduce__(self):
+        # Copied for every request waiting on the same drawing
+        return (self.__class__, (self.status, str(self)))
+
+
+def _terminate(pool: ProcessPoolExecutor) -> None:
+    """Stop *pool* and kill its processes, even mid-task."""
+    # The executor has no public way to stop a running task
+    for process in list((pool._processes or {}).values()):
+        process.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def parse_request(
+    body: bytes, max_tiles: int = DEFAULT_MAX_TILES
+) -> tuple[GridPlan, str, float, float]:
+    """Parse a ``/generate`` request body.
+
+    Plans of more than *max_tiles* tiles (rows x cols) are refused; codes
+    are refused from their header, before they are decoded.
+
+    Returns
+    -------
+    tuple[GridPlan, str, float, float]
+        The plan, the export format and the two STL tolerances.
+    """
+    try:
+        data = json.loads(body)
+    except ValueError:
+        raise RequestError(HTTPStatus.BAD_REQUEST, "Body is not valid JSON")
+    if not isinstance(data, dict):
+        raise RequestError(HTTPStatus.BAD_REQUEST, "Body must be a JSON object")
+
+    fmt = data.get("format", "step")
+    if fmt not in CONTENT_TYPES:
+        raise RequestError(HTTPStatus.BAD_REQUEST, f"Unknown format: {fmt!r}")
+
+    try:
+        tolerance = float(data.get("tolerance", DEFAULT_TOLERANCE))
+        angular_tolerance = float(data.get("angular_tolerance", DEFAULT_ANGULAR_TOLERANCE))
+    except (TypeError, ValueError):
+        raise RequestError(HTTPStatus.BAD_REQUEST, "Tolerances must be numbers")
+
+    if ("code" in data) == ("plan" in data):
+        raise RequestError(HTTPStatus.BAD_REQUEST, "Provide exactly one of 'code' or 'plan'")
+    try:
+        if "code" in data:
+            if not isinstance(data["code"], str):
+                raise ValueError("'code' must be a string")
+            plan = decode(data["code"], max_cells=max_tiles)
+        else:
+            plan = GridPlan.model_validate(data["plan"])
+    except ValidationError as e:
+        raise RequestError(HTTPStatus.BAD_REQUEST, f"Invalid plan: {e}")
+    except ValueError as e:
+        raise RequestError(HTTPStatus.BAD_REQUEST, f"Invalid code: {e}")
+
+    rows, cols = len(plan.tiles), len(plan.tiles[0]) if plan.tiles else 0
+    if rows * cols > max_tiles:
+        raise RequestError(
+            HTTPStatus.BAD_REQUEST, f"Grid too large: {rows}x{cols} is over {max_tiles} tiles"
+        )
+
+    return plan, fmt, tolerance, angular_tolerance
+
+
+class GridRequestHandler(BaseHTTPRequestHandler):
+    """Answers ``/health`` and ``/generate``; see the module docstring."""
+
+    server: "GridServerMixin"
+
+    def address_string(self) -> str:
+        # Unix socket peers have no (host, port) address
+        if isinstance(self.client_address, tuple):
+            return super().address_string()
+        return "unix"
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+    def _reply(self, status: HTTPStatus, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _error(self, status: HTTPStatus, message: str) -> None:
+        self._reply(status, (message + "\n").encode(), "text/plain; charset=utf-8")
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._reply(HTTPStatus.OK, b"ok\n", "text/plain; charset=utf-8")
+        else:
+            self._error(HTTPStatus.NOT_FOUND, "Not found")
+
+    def do_POST(self):
+        if self.path != "/generate":
+            self._error(HTTPStatus.NOT_FOUND, "Not found")
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", ""))
+        except ValueError:
+            self._error(HTTPStatus.LENGTH_REQUIRED, "Content-Length required")
+            return
+        if length > MAX_BODY_BYTES:
+            self._error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body too large")
+            return
+
+        body = self.rfile.read(length)
+        try:
+            with self.server.slot():
+                plan, fmt, tolerance, angular_tolerance = parse_request(body, self.server.max_tiles)
+                data = self.server.generate(plan, fmt, tolerance, angular_tolerance)
+        except RequestError as e:
+            self._error(e.status, str(e))
+            return
+        except Exception as e:
+            self.log_error("Generation failed: %r", e)
+            self._error(HTTPStatus.INTERNAL_SERVER_ERROR, "Generation failed")
+            return
+
+        self._reply(HTTPStatus.OK, data, CONTENT_TYPES[fmt])
+
+
+class GridServerMixin:
+    """Worker pool and admission control shared by the TCP and Unix servers.
+
+    At most ``workers + queue_size`` requests are handled at once, from
+    parsing to reply; further requests are answered with 503 straight away
+    instead of piling up.  Requests for a grid that is already being drawn
+    wait for that drawing rather than drawing it again.
+    """
+
+    def setup_pool(
+        self,
+        workers: int,
+        queue_size: int,
+        draw_kwargs: dict | None,
+        cache_dir: str | Path | None,
+        quiet: bool,
+        max_tiles: int = DEFAULT_MAX_TILES,
+        timeout: float | None = DEFAULT_TIMEOUT,
+    ) -> None:
+        self.draw_kwargs = dict(draw_kwargs or {})
+        self.quiet = quiet
+        self.max_tiles = max_tiles
+        # Not "timeout": socketserver uses that name for handle_request()
+        self.request_timeout = timeout
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+        self.flight = SingleFlight()
+        self._workers = workers
+        self._cache_dir = None if cache_dir is None else str(cache_dir)
+        self._pool_lock = threading.Lock()
+        self.pool = self._start_pool()
+        # Start and warm every worker now rather than on the first requests
+        for future in [self.pool.submit(os.getpid) for _ in range(workers)]:
+            future.result()
+
+    def _start_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self._workers,
+            # Workers load cadquery themselves; never fork a threaded server
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_warm_worker,
+            initargs=(self._cache_dir,),
+        )
+
+    def _restart_pool(self, broken: ProcessPoolExecutor) -> None:
+        """Replace *broken* by a new pool, unless another request already did."""
+        with self._pool_lock:
+            if self.pool is not broken:
+                return
+            self.pool = self._start_pool()
+            # Warm the new workers in the background
+            for _ in range(self._workers):
+                self.pool.submit(os.getpid)
+        _terminate(broken)
+
+    @contextmanager
+    def slot(self) -> Generator[None]:
+        """Hold one of the request slots, or refuse the request with 503."""
+        if not self._slots.acquire(blocking=False):
+            raise RequestError(HTTPStatus.SERVICE_UNAVAILABLE, "Server busy, retry later")
+        try:
+            yield
+        finally:
+            self._slots.release()
+
+    def generate(
+        self, plan: GridPlan, fmt: str, tolerance: float, angular_tolerance: float
+    ) -> bytes:
+        """Draw *plan* on a worker and return the exported bytes."""
+
+        def compute() -> bytes:
+            pool = self.pool
+            try:
+                future = pool.submit(
+                    _render_bytes,
+                    plan.model_dump_json(),
+                    fmt,
+                    self.draw_kwargs,
+                    tolerance,
+                    angular_tolerance,
+                )
+                return future.result(timeout=self.request_timeout)
+            except TimeoutError:
+                self._restart_pool(pool)
+                raise RequestError(HTTPStatus.GATEWAY_TIMEOUT, "Generation timed out")
+            except BrokenProcessPool:
+                self._restart_pool(pool)
+                raise RequestError(HTTPStatus.SERVICE_UNAVAILABLE, "Worker stopped, retry later")
+
+        key = result_key(plan, fmt, tolerance, angular_tolerance, self.draw_kwargs)
+        return self.flight.do(key, compute)
+
+    def server_close(self):
+        super().server_close()
+        pool = getattr(self, "pool", None)
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+
+class GridHTTPServer(GridServerMixin, ThreadingHTTPServer):
+    """Grid server on a TCP port."""
+
+    daemon_threads = True
+
+
+class GridUnixServer(GridServerMixin, socketserver.ThreadingUnixStreamServer):
+    """Grid server on a Unix socket."""
+
+    daemon_threads = True
+
+    def server_bind(self):
+        Path(self.server_address).unlink(missing_ok=True)
+        super().server_bind()
+
+    def server_close(self):
+        super().server_close()
+        Path(self.server_address).unlink(missing_ok=True)
+
+
+def create_server(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    socket_path: str | Path | None = None,
+    workers: int = 1,
+    queue_size: int = 8,
+    draw_kwargs: dict | None = None,
+    cache_dir: str | Path | None = None,
+    quiet: bool = False,
+    max_tiles: int = DEFAULT_MAX_TILES,
+    timeout: float | None = DEFAULT_TIMEOUT,
+) -> GridHTTPServer | GridUnixServer:
+    """Create a grid server with a warm worker pool.
+
+    Parameters
+    ----------
+    host, port : str, int
+        TCP address to listen on.  Port ``0`` picks a free port, readable
+        from ``server.server_address``.  Ignored if *socket_path* is set.
+    socket_path : str | Path | None
+        Listen on this Unix socket instead of TCP.
+    workers : int
+        Number of worker processes, each with its own CAD engine.
+    queue_size : int
+        Requests allowed to wait for a busy worker before answering 503.
+    draw_kwargs : dict | None
+        Keyword arguments passed to ``draw_grid`` for every request.
+    cache_dir : str | Path | None
+        Template cache directory shared by the workers.
+    quiet : bool
+        Do not log requests to stderr.
+    max_tiles : int
+        Largest grid accepted, in tiles (rows x cols).
+    timeout : float | None
+        Seconds a request waits for its drawing, queue included, before it
+        is answered with 504 and the workers are restarted.  ``None``
+        waits forever.
+
+    Returns
+    -------
+    GridHTTPServer | GridUnixServer
+        Call ``serve_forever()`` to start answering, ``server_close()`` to
+        stop the workers.
+    """
+    # Warm the workers before listening, so clients never wait on a cold pool
+    if socket_path is not None:
+        server = GridUnixServer(str(socket_path), GridRequestHandler, bind_and_activate=False)
+    else:
+        server = GridHTTPServer((host, port), GridRequestHandler, bind_and_activate=False)
+    try:
+        server.setup_pool(workers, queue_size, draw_kwargs, cache_dir, quiet, max_tiles, timeout)
+        server.server_bind()
+        server.server_activate()
+    except BaseException:
+        server.server_close()
+        raise
+    return server
@@ -0,0 +1,61 @@
+"""Tests for the boolean helpers and their OCCT options."""
+
+import cadquery as cq
+import pytest
+
+from ogt import LayoutMask, prepare_grid
+from ogt.draw import BooleanOptions, draw_grid
+from ogt.draw.booleans import cut_all, fuse_all
+
+OPTIONS = [
+    BooleanOptions(),
+    BooleanOptions(parallel=False),
+    BooleanOptions(fuzzy=1e-5),
+    BooleanOptions(history=True),
+    BooleanOptions(parallel=True, fuzzy=1e-5, history=True),
+]
+
+
+def _boxes(count: int) -> list[cq.Shape]:
+    return [cq.Solid.makeBox(1, 1, 1, cq.Vector(i, 0, 0)) for i in range(count)]
+
+
+def test_negative_fuzzy():
+    with pytest.raises(ValueError, match="fuzzy"):
+        BooleanOptions(fuzzy=-1.0)
+
+
+@pytest.mark.parametrize("options", OPTIONS)
+@pytest.mark.parametrize("mode", ["sequential", "batch", "tree"])
+def test_fuse_all_options(mode, options):
+    result = fuse_all(_boxes(4), mode, glue="shift", options=options)
+    assert len(result.Solids()) == 1
+    assert result.Volume() == pytest.approx(4.0)
+
+
+@pytest.mark.parametrize("options", OPTIONS)
+@pytest.mark.parametrize("mode", ["sequential", "batch"])
+def test_cut_all_options(mode, options):
+    block = cq.Solid.makeBox(4, 1, 1)
+    tools = [cq.Solid.makeBox(0.5, 2, 2, cq.Vector(i, -0.5, -0.5)) for i in range(4)]
+    assert cut_all(block, tools, mode, options).Volume() == pytest.approx(2.0)
+
+
+def test_fuzzy_closes_gaps():
+    """Boxes 1e-6 apart are separate, unless the fuzzy value bridges them."""
+    boxes = [cq.Solid.makeBox(1, 1, 1), cq.Solid.makeBox(1, 1, 1, cq.Vector(1 + 1e-6, 0, 0))]
+    assert len(fuse_all(boxes, "batch").Solids()) == 2
+    assert len(fuse_all(boxes, "batch", options=BooleanOptions(fuzzy=1e-4)).Solids()) == 1
+
+
+@pytest.mark.parametrize("strategy", ["tiles", "variants"])
+def test_draw_grid_options(strategy):
+    plan = prepare_grid(
+        LayoutMask.full(2, 3), connectors=True, tile_chamfers=True, screws="corners"
+    )
+    expected = draw_grid(plan, strategy=strategy).val()
+    options = BooleanOptions(parallel=False, fuzzy=1e-5, history=True)
+    result = draw_grid(plan, strategy=strategy, boolean_options=options).val()
+    assert result.isValid()
+    assert result.Volume() == pytest.approx(expected.Volume(), rel=1e-9)
+    assert result.Area() == pytest.approx(expected.Area(), rel=1e-9)
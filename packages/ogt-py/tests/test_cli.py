@@ -6,6 +6,7 @@ import trimesh
 from click.testing import CliRunner
 
 from ogt.cli import cli
+from ogt.draw import template_cache
 
 
 def test_help():
@@ -128,6 +129,14 @@ def test_draw_missing_file():
     assert result.exit_code != 0
 
 
+def test_draw_validates_plan(tmp_path):
+    plan_path = tmp_path / "plan.json"
+    plan_path.write_text(json.dumps({"tiles": [[True]], "summits": [[{}]]}))
+    result = CliRunner().invoke(cli, ["draw", str(plan_path)])
+    assert result.exit_code != 0
+    assert "Invalid plan file" in result.output
+
+
 def test_generate_creates_stl(tmp_path):
     output = tmp_path / "grid.stl"
     result = CliRunner().invoke(
@@ -162,6 +171,7 @@ def test_generate_compact_format(tmp_path):
         cli, ["generate", "0.f.2.2.KlAK.8A._4A", "--format", "stl", "-o", str(output)]
     )
     assert result.exit_code == 0, result.output
+    assert "Drawing 4 tiles, 4 connectors, 4 chamfers, 1 screws (56 x 56 mm)" in result.output
     assert output.exists()
     mesh = trimesh.load(str(output))
     assert isinstance(mesh, trimesh.Trimesh)
@@ -217,3 +227,42 @@ def test_roundtrip(tmp_path):
     assert isinstance(mesh_generate, trimesh.Trimesh)
     assert mesh_draw.volume == mesh_generate.volume
     assert (mesh_draw.bounding_box.extents == mesh_generate.bounding_box.extents).all()
+
+
+def test_generate_tile_fusion(tmp_path):
+    output = tmp_path / "grid.stl"
+    result = CliRunner().invoke(
+        cli,
+        [
+            "generate",
+            "--size",
+            "2x2",
+            "--tile-fusion",
+            "batch",
+            "--format",
+            "stl",
+            "-o",
+            str(output),
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    assert output.exists()
+
+
+def test_generate_cache_dir(tmp_path, monkeypatch):
+    # --cache-dir also configures the process-wide template cache
+    monkeypatch.setattr(template_cache, "_cache_dir", None)
+
+    cache_dir = tmp_path / "cache"
+    first = tmp_path / "first.stl"
+    second = tmp_path / "second.stl"
+    args = ["generate", "0.f.2.2.KlAK.8A._4A", "--format", "stl", "--cache-dir", str(cache_dir)]
+
+    result = CliRunner().invoke(cli, [*args, "-o", str(first)])
+    assert result.exit_code == 0, result.output
+    assert "(cached)" not in result.output
+
+    result = CliRunner().invoke(cli, [*args, "-o", str(second)])
+    assert result.exit_code == 0, result.output
+    assert "(cached)" in result.output
+    assert second.read_bytes() == first.read_bytes()
@@ -1,9 +1,23 @@
 """Tests for the compact GridPlan encoding/decoding."""
 
+import math
+import time
+
+import numpy as np
 import pytest
 
-from ogt.compact import decode, encode
-from ogt.prepare import prepare_grid
+from ogt import compact
+from ogt.compact import (
+    _b64url_encode,
+    _bits_to_bytes,
+    _bytes_to_bits,
+    decode,
+    decode_arrays,
+    decode_many,
+    encode,
+)
+from ogt.layout import LayoutMask
+from ogt.prepare import prepare_grid, prepare_grid_arrays
 from ogt.prepare.types import GridPlan, ScrewSize, SummitFeatures
 from ogt.slot import Hole, Tile
 
@@ -128,7 +142,7 @@ def test_roundtrip_custom_screw_size():
 
 def test_bad_version():
     with pytest.raises(ValueError, match="Unsupported version"):
-        decode("1.f.2.2.KlAK.8A._4A")
+        decode("2.f.2.2.KlAK.8A._4A")
 
 
 def test_wrong_part_count():
@@ -168,6 +182,36 @@ def test_insufficient_feature_data():
         decode("0.f.2.2.KlAK.8A.")
 
 
+@pytest.mark.parametrize(
+    "code",
+    [
+        "0.f.1001.1000.KlAK.8A._4A",
+        # 20000x20000 tiles in 2 runs, and deflated to 1 byte of zeros
+        "1.f.20000.20000.KlAK.rAICI3r4B.*",
+        "1.f.20000.20000.KlAK.zYwAA.*",
+    ],
+)
+def test_grid_too_large(code):
+    start = time.perf_counter()
+    with pytest.raises(ValueError, match="Grid too large"):
+        decode_arrays(code)
+    # Rejected from the header, before any bits are expanded
+    assert time.perf_counter() - start < 0.1
+
+
+def test_decode_max_cells():
+    code = encode(prepare_grid(LayoutMask.full(4, 4)))
+    assert decode(code, max_cells=16).tiles
+    with pytest.raises(ValueError, match="Grid too large: 4x4 is over 15 cells"):
+        decode(code, max_cells=15)
+
+
+def test_encode_grid_too_large():
+    plan = prepare_grid_arrays(LayoutMask.full(1001, 1000))
+    with pytest.raises(ValueError, match="Grid too large"):
+        encode(plan)
+
+
 # --- Roundtrip from prepare_grid ---
 
 
@@ -185,3 +229,233 @@ def test_roundtrip_prepare_grid(rows, cols, kwargs):
     layout = [[Tile()] * cols for _ in range(rows)]
     plan = prepare_grid(layout, **kwargs)
     _plans_equal(decode(encode(plan)), plan)
+
+
+# --- Bit packing ---
+
+
+def _bits_to_bytes_reference(bits: list[bool]) -> bytes:
+    """The original per-bit packing, kept as the reference."""
+    result = bytearray(math.ceil(len(bits) / 8))
+    for i, bit in enumerate(bits):
+        if bit:
+            result[i // 8] |= 1 << (7 - i % 8)
+    return bytes(result)
+
+
+def _bytes_to_bits_reference(data: bytes, n_bits: int) -> list[bool]:
+    return [bool(data[i // 8] & (1 << (7 - i % 8))) for i in range(n_bits)]
+
+
+def test_bit_packing_matches_reference():
+    rng = np.random.default_rng(17)
+    for _ in range(300):
+        n_bits = int(rng.integers(0, 200))
+        bits = (rng.random(n_bits) < rng.random()).tolist()
+        packed = _bits_to_bytes(bits)
+        assert packed == _bits_to_bytes_reference(bits)
+
+        # Padding bits after n_bits are ignored
+        data = packed + rng.bytes(int(rng.integers(0, 3)))
+        assert _bytes_to_bits(data, n_bits).tolist() == _bytes_to_bits_reference(data, n_bits)
+
+
+def test_encode_matches_reference():
+    """v0 codes are byte-identical to the per-bit packing."""
+    rng = np.random.default_rng(3)
+    for _ in range(30):
+        rows, cols = (int(n) for n in rng.integers(1, 30, size=2))
+        tiles = rng.random((rows, cols)) < 0.7
+        tiles[0, 0] = True
+        plan = prepare_grid(LayoutMask(tiles), connectors=True, tile_chamfers=True)
+        *header, tiles_str, features_str = encode(plan).split(".")
+        active = [
+            s.connector_angle is not None or s.tile_chamfer or s.screw
+            for row in plan.summits
+            for s in row
+        ]
+        assert tiles_str == _b64url_encode(_bits_to_bytes_reference(tiles.ravel().tolist()))
+        assert features_str == _b64url_encode(_bits_to_bytes_reference(active))
+
+
+def test_decode_arrays_matches_decode():
+    plan = prepare_grid(
+        LayoutMask.full(5, 7), connectors=True, tile_chamfers=True, screws="corners"
+    )
+    for version in (0, 1):
+        code = encode(plan, version=version)
+        assert decode_arrays(code).to_plan() == decode(code) == plan
+
+
+def test_codec_benchmark():
+    """Micro-benchmark: v0 encode and decode of a 1000x1000 plan."""
+    plan = prepare_grid_arrays(
+        LayoutMask.full(1000, 1000), connectors=True, tile_chamfers=True, screws="corners"
+    )
+
+    start = time.perf_counter()
+    code = encode(plan)
+    encoded = time.perf_counter() - start
+    start = time.perf_counter()
+    decoded = decode_arrays(code)
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"\ncompact v0, 1000x1000: encode {encoded * 1000:.1f} ms, decode {elapsed * 1000:.1f} ms"
+    )
+    assert decoded == plan
+    # A few ms each on a laptop; per-bit packing took about a second
+    assert encoded < 1.0
+    assert elapsed < 1.0
+
+
+# --- Format v1 ---
+
+
+def test_v1_known_value():
+    plan = decode("0.f.2.2.KlAK.8A._4A")
+    assert encode(plan, version=1) == "1.f.2.2.KlAK.b8A.*"
+    assert decode("1.f.2.2.KlAK.b8A.*") == plan
+
+
+def test_encode_defaults_to_v0():
+    plan = prepare_grid([[Tile()] * 20 for _ in range(20)], connectors=True)
+    assert encode(plan).startswith("0.")
+
+
+def test_encode_bad_version():
+    with pytest.raises(ValueError, match="Unsupported version"):
+        encode(decode("0.f.2.2.KlAK.8A._4A"), version=2)
+
+
+@pytest.mark.parametrize("density", [1.0, 0.9, 0.5, 0.1])
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"connectors": True},
+        {"connectors": True, "tile_chamfers": True},
+        {"connectors": True, "tile_chamfers": True, "screws": "corners"},
+        {"screws": "all"},
+    ],
+)
+def test_v1_decodes_like_v0(density, kwargs):
+    rng = np.random.default_rng(7)
+    for n in (1, 3, 12, 40):
+        tiles = rng.random((n, n)) < density
+        tiles[0, 0] = True
+        plan = prepare_grid(LayoutMask(tiles), **kwargs)
+        assert decode(encode(plan, version=1)) == decode(encode(plan))
+
+
+def test_v1_is_short_for_large_grids():
+    layout = LayoutMask.full(200, 200)
+    plan = prepare_grid(layout, connectors=True, tile_chamfers=True, screws="all")
+    code = encode(plan, version=1)
+    assert code.endswith(".*")
+    assert len(code) < 40
+    _plans_equal(decode(code), plan)
+
+    # Connectors only: one run per feature group
+    plan = prepare_grid(layout, connectors=True)
+    assert len(encode(plan, version=1)) < 40
+
+
+@pytest.mark.parametrize("method", ["b", "r", "z"])
+def test_v1_bitstream_methods(method):
+    """Every bitstream method decodes, whichever the encoder would pick."""
+    plan = prepare_grid([[Tile(), Hole(), Tile()], [Tile()] * 3], connectors=True)
+    # Tile bits 101111
+    tiles_str = {"b": "bvA", "r": "rAAEBBA", "z": "z2wMA"}[method]
+    code = encode(plan, version=1).split(".")
+    code[5] = tiles_str
+    assert decode(".".join(code)) == decode(encode(plan))
+
+
+def test_v1_invalid_bitstream_method():
+    with pytest.raises(ValueError, match="Invalid tile encoding"):
+        decode("1.f.2.2.KlAK.x8A.*")
+
+
+def test_v1_run_length_mismatch():
+    with pytest.raises(ValueError, match="Tile runs cover 5 bits, expected 4"):
+        decode("1.f.2.2.KlAK.rBQ.*")
+
+
+def test_v1_insufficient_data():
+    with pytest.raises(ValueError, match="Insufficient tile data"):
+        decode("1.f.2.2.KlAK..*")
+    with pytest.raises(ValueError, match="Insufficient feature data"):
+        decode("1.f.2.2.KlAK.b8A.b")
+
+
+# --- Batch decoding ---
+
+
+def _catalog() -> list[str]:
+    """Codes over a few layouts, mixing versions, features and screws."""
+    layouts = [
+        [[Tile()] * 3 for _ in range(2)],
+        [[Tile(), Hole()], [Tile(), Tile()]],
+        [[Tile()]],
+    ]
+    codes = []
+    for k in range(12):
+        layout = layouts[k % len(layouts)]
+        plan = prepare_grid(
+            layout,
+            connectors=k % 2 == 0,
+            tile_chamfers=k % 3 == 0,
+            screws="all" if k % 4 == 0 else None,
+            screw_size=ScrewSize(diameter=3.0 + k / 10),
+        )
+        codes.append(encode(plan, version=k // 6))
+    return codes
+
+
+def test_decode_many_matches_decode():
+    codes = _catalog()
+    assert decode_many(codes) == [decode(code) for code in codes]
+    assert decode_many(codes, arrays=True) == [decode_arrays(code) for code in codes]
+    assert decode_many([]) == []
+
+
+def test_decode_many_decodes_each_layout_once(monkeypatch):
+    calls = []
+    original = compact._decode_layout
+    monkeypatch.setattr(
+        compact, "_decode_layout", lambda *args: calls.append(args) or original(*args)
+    )
+    codes = _catalog()
+    decode_many(codes)
+    # 3 layouts, each encoded as v0 and v1
+    assert len(calls) == 6
+
+
+def test_decode_many_workers_preserve_order():
+    codes = _catalog()
+    assert decode_many(codes, workers=2) == [decode(code) for code in codes]
+
+
+def test_decode_many_invalid_code():
+    with pytest.raises(ValueError, match="Invalid type"):
+        decode_many(["0.f.2.2.KlAK.8A._4A", "0.x.2.2.KlAK.8A._4A"])
+
+
+# --- Trusted construction ---
+
+
+def test_decoded_plan_matches_validated():
+    """decode skips validation but builds the same models as validation would."""
+    plan = decode(encode(prepare_grid([[Tile()] * 3 for _ in range(2)], connectors=True)))
+    validated = GridPlan.model_validate(plan.model_dump())
+    assert plan == validated
+    assert plan.model_dump_json() == validated.model_dump_json()
+    assert plan.summits[0][0].model_fields_set == validated.summits[0][0].model_fields_set
+
+
+def test_decoded_summits_are_independent():
+    plan = decode("0.f.2.2.KlAK.8A._4A")
+    plan.summits[0][0].screw = True
+    assert not plan.summits[0][2].screw
+    assert not decode("0.f.2.2.KlAK.8A._4A").summits[0][0].screw
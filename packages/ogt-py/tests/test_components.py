@@ -0,0 +1,67 @@
+"""Tests for connected components of a plan's tiles."""
+
+import numpy as np
+import pytest
+
+from ogt import FrozenGridPlan, LayoutMask, draw_grid, prepare_grid
+from ogt.prepare.components import component_plans, label_components
+
+OPTIONS = {"connectors": True, "tile_chamfers": True, "screws": "corners"}
+
+
+def test_labels_in_row_major_order():
+    tiles = np.array(
+        [
+            [True, True, False, True],
+            [False, False, False, True],
+            [True, False, False, False],
+        ]
+    )
+    labels, count = label_components(tiles)
+    assert count == 3
+    assert labels.tolist() == [[1, 1, 0, 2], [0, 0, 0, 2], [3, 0, 0, 0]]
+
+
+def test_corner_contact_connects():
+    labels, count = label_components(np.array([[True, False], [False, True]]))
+    assert count == 1
+    assert labels.tolist() == [[1, 0], [0, 1]]
+
+
+def test_no_tiles():
+    labels, count = label_components(np.zeros((2, 3), dtype=bool))
+    assert count == 0
+    assert not labels.any()
+
+
+def test_island_inside_ring():
+    tiles = np.ones((5, 5), dtype=bool)
+    tiles[1:4, 1:4] = False
+    tiles[2, 2] = True
+    plan = FrozenGridPlan.from_plan(prepare_grid(LayoutMask(tiles), **OPTIONS))
+    labels, count = label_components(plan.tiles)
+    assert count == 2
+
+    (ring_row, ring_col, ring), (row, col, island) = component_plans(plan, labels, count)
+    assert (ring_row, ring_col, ring.shape) == (0, 0, (5, 5))
+    assert not ring.tiles[2, 2]
+    assert (row, col, island.shape) == (2, 2, (1, 1))
+    # Each plan keeps the features of its own summits only
+    assert ring.connector_count + island.connector_count == plan.connector_count
+    assert ring.screw_count + island.screw_count == plan.screw_count
+    assert ring.tile_chamfer_count + island.tile_chamfer_count == plan.tile_chamfer_count
+    assert island.screws.tolist() == plan.screws[2:4, 2:4].tolist()
+
+
+def test_draw_islands_as_compound():
+    # Without corner screws, which go on the corners of the whole layout
+    options = {"connectors": True, "tile_chamfers": True}
+    layout = LayoutMask([[True, True, False, True], [True, True, False, False]])
+    result = draw_grid(prepare_grid(layout, **options)).val()
+    assert len(result.Solids()) == 2
+    block = draw_grid(prepare_grid(LayoutMask.full(2, 2), **options)).val()
+    tile = draw_grid(prepare_grid(LayoutMask.full(1, 1), **options)).val()
+    assert result.Volume() == pytest.approx(block.Volume() + tile.Volume(), rel=1e-9)
+    # The lone tile is drawn in place
+    bb = result.Solids()[1].BoundingBox()
+    assert (bb.xmin, bb.ymax) == pytest.approx((84.0, 0.0), abs=1e-6)
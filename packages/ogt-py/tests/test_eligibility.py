@@ -0,0 +1,116 @@
+"""Tests for table-driven summit eligibility."""
+
+import math
+import random
+import time
+
+import numpy as np
+import pytest
+
+from ogt.layout import layout_tiles
+from ogt.prepare import (
+    compute_corner_screw_positions,
+    compute_eligible_connector_positions,
+    compute_eligible_screw_positions,
+    compute_eligible_tile_chamfer_positions,
+    prepare_grid,
+)
+from ogt.prepare.eligibility import CONNECTOR_ANGLE, summit_codes
+from ogt.slot import Hole, Tile
+
+
+def random_layout(rng, rows, cols):
+    return [[Tile() if rng.random() < 0.7 else Hole() for _ in range(cols)] for _ in range(rows)]
+
+
+def neighbors(layout, i, j):
+    """(tl, tr, bl, br) of summit (i, j), one cell at a time."""
+
+    def is_tile(r, c):
+        return 0 <= r < len(layout) and 0 <= c < len(layout[0]) and isinstance(layout[r][c], Tile)
+
+    return is_tile(i - 1, j - 1), is_tile(i - 1, j), is_tile(i, j - 1), is_tile(i, j)
+
+
+def reference(layout, rule):
+    return [
+        [rule(*neighbors(layout, i, j)) for j in range(len(layout[0]) + 1)]
+        for i in range(len(layout) + 1)
+    ]
+
+
+def connector_rule(tl, tr, bl, br):
+    return (tl == tr and bl == br and tl != bl) or (tl == bl and tr == br and tl != tr)
+
+
+def chamfer_rule(tl, tr, bl, br):
+    return sum((tl, tr, bl, br)) == 1
+
+
+def screw_rule(tl, tr, bl, br):
+    return tl and tr and bl and br
+
+
+def direction_rule(tl, tr, bl, br):
+    if tl == tr and bl == br and tl != bl:
+        return -90.0 if bl else 90.0
+    if tl == bl and tr == br and tl != tr:
+        return 0.0 if tr else 180.0
+    return None
+
+
+def test_summit_codes():
+    layout = [[Tile(), Hole()], [Tile(), Tile()]]
+    assert summit_codes(layout_tiles(layout)).tolist() == [
+        [0b0001, 0b0010, 0b0000],
+        [0b0101, 0b1011, 0b0010],
+        [0b0100, 0b1100, 0b1000],
+    ]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_masks_match_per_summit_rules(seed):
+    rng = random.Random(seed)
+    layout = random_layout(rng, rng.randint(1, 12), rng.randint(1, 12))
+    assert compute_eligible_connector_positions(layout) == reference(layout, connector_rule)
+    assert compute_eligible_tile_chamfer_positions(layout) == reference(layout, chamfer_rule)
+    assert compute_eligible_screw_positions(layout) == reference(layout, screw_rule)
+
+
+def test_corner_screws():
+    layout = [[Tile()] * 4 for _ in range(3)]
+    # Eligible summits form a 2x3 block; only its middle column passes through
+    assert compute_corner_screw_positions(compute_eligible_screw_positions(layout)) == [
+        [False] * 5,
+        [False, True, False, True, False],
+        [False, True, False, True, False],
+        [False] * 5,
+    ]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_connector_angles_match_per_summit_rule(seed):
+    rng = random.Random(seed)
+    layout = random_layout(rng, rng.randint(1, 12), rng.randint(1, 12))
+    angles = CONNECTOR_ANGLE[summit_codes(layout_tiles(layout))].tolist()
+    assert [[None if math.isnan(a) else a for a in row] for row in angles] == reference(
+        layout, direction_rule
+    )
+
+    plan = prepare_grid(layout, connectors=True)
+    planned = [[s.connector_angle for s in row] for row in plan.summits]
+    assert planned == reference(layout, direction_rule)
+
+
+def test_connector_planning_benchmark():
+    """Micro-benchmark: connector angles for a 1000x1000 layout."""
+    tiles = np.random.default_rng(0).random((1000, 1000)) < 0.5
+
+    start = time.perf_counter()
+    angles = CONNECTOR_ANGLE[summit_codes(tiles)]
+    elapsed = time.perf_counter() - start
+
+    print(f"\nconnector angles, 1000x1000: {elapsed * 1000:.1f} ms")
+    assert angles.shape == (1001, 1001)
+    # About 10 ms on a laptop; the per-summit version took seconds
+    assert elapsed < 1.0
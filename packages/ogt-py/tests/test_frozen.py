@@ -0,0 +1,142 @@
+"""Tests for FrozenGridPlan."""
+
+import copy
+import functools
+import pickle
+
+import numpy as np
+import pytest
+
+from ogt import FrozenGridPlan, GridPlanArrays, LayoutMask, prepare_grid
+
+
+def _plan():
+    return prepare_grid(
+        LayoutMask([[True, True, False], [True, True, True]]),
+        connectors=True,
+        tile_chamfers=True,
+        screws="all",
+    )
+
+
+def test_equal_and_hash_across_forms():
+    plan = _plan()
+    frozen = FrozenGridPlan.from_plan(plan)
+    from_arrays = FrozenGridPlan.from_plan(GridPlanArrays.from_plan(plan))
+    assert frozen == from_arrays
+    assert hash(frozen) == hash(from_arrays)
+    assert frozen.digest() == from_arrays.digest()
+    assert {frozen: "drawn"}[from_arrays] == "drawn"
+    assert frozen.to_plan() == plan
+
+
+def test_digest_covers_every_field():
+    plan = _plan()
+    frozen = FrozenGridPlan.from_plan(plan)
+    variants = [plan.model_copy(update={"opengrid_type": "lite"})]
+    for field in ("connector_angle", "tile_chamfer", "screw"):
+        changed = plan.model_copy(deep=True)
+        setattr(changed.summits[0][2], field, 45.0 if field == "connector_angle" else True)
+        variants.append(changed)
+    digests = {FrozenGridPlan.from_plan(v).digest() for v in variants}
+    assert len(digests) == len(variants)
+    assert frozen.digest() not in digests
+
+
+def test_digest_is_cached():
+    frozen = FrozenGridPlan.from_plan(_plan())
+    assert frozen.digest() is frozen.digest()
+
+
+def test_negative_zero_angle():
+    frozen = FrozenGridPlan.from_plan(prepare_grid(LayoutMask.full(2, 1), connectors=True))
+    angles = frozen.connector_angles.copy()
+    assert (angles == 0.0).any()
+    angles[angles == 0.0] = -0.0
+    same = FrozenGridPlan(
+        tiles=frozen.tiles,
+        connector_angles=angles,
+        tile_chamfers=frozen.tile_chamfers,
+        screws=frozen.screws,
+    )
+    assert same == frozen
+
+
+def test_immutable():
+    tiles = np.ones((1, 2), dtype=bool)
+    frozen = FrozenGridPlan.from_plan(prepare_grid(LayoutMask(tiles)))
+    with pytest.raises(ValueError, match="read-only"):
+        frozen.tiles[0, 0] = False
+    with pytest.raises(AttributeError):
+        frozen.opengrid_type = "lite"  # type: ignore[misc]
+
+
+@pytest.mark.parametrize(
+    "clone", [lambda f: pickle.loads(pickle.dumps(f)), copy.deepcopy, copy.copy]
+)
+def test_copies_stay_read_only(clone):
+    frozen = FrozenGridPlan.from_plan(_plan())
+    frozen.digest()
+    frozen.tile_count
+    clone = clone(frozen)
+    for name in ("tiles", "connector_angles", "tile_chamfers", "screws"):
+        assert not getattr(clone, name).flags.writeable
+    assert "_digest" not in vars(clone)
+    assert "tile_count" not in vars(clone)
+    assert clone == frozen
+    assert hash(clone) == hash(frozen)
+    assert clone.to_plan() == frozen.to_plan()
+
+
+def test_source_arrays_are_copied():
+    arrays = GridPlanArrays.from_plan(_plan())
+    frozen = FrozenGridPlan.from_plan(arrays)
+    digest = frozen.digest()
+    arrays.tiles[0, 0] = False
+    assert frozen.tiles[0, 0]
+    assert FrozenGridPlan.from_plan(arrays).digest() != digest
+
+
+def test_lru_cache_key():
+    calls = []
+
+    @functools.lru_cache
+    def work(plan: FrozenGridPlan) -> int:
+        calls.append(plan)
+        return plan.tile_count
+
+    assert work(FrozenGridPlan.from_plan(_plan())) == 5
+    assert work(FrozenGridPlan.from_plan(_plan())) == 5
+    assert len(calls) == 1
+
+
+def test_counts_and_extents():
+    frozen = FrozenGridPlan.from_plan(_plan())
+    assert frozen.shape == (2, 3)
+    assert frozen.tile_count == 5
+    assert frozen.connector_count == 4
+    assert frozen.tile_chamfer_count == 4
+    assert frozen.screw_count == 1
+    assert frozen.extents == (0.0, -56.0, 84.0, 0.0)
+
+    # Extents only cover placed tiles
+    holes = prepare_grid(LayoutMask([[False, False], [False, True]]))
+    assert FrozenGridPlan.from_plan(holes).extents == (28.0, -56.0, 56.0, -28.0)
+
+
+def test_shape_mismatch():
+    with pytest.raises(ValueError, match="screws has shape"):
+        FrozenGridPlan(
+            tiles=np.ones((1, 1)),
+            connector_angles=np.full((2, 2), np.nan),
+            tile_chamfers=np.zeros((2, 2)),
+            screws=np.zeros((3, 3)),
+        )
+
+
+def test_draw_frozen_plan():
+    from ogt.draw import draw_grid
+
+    plan = prepare_grid(LayoutMask.full(1, 2), connectors=True, tile_chamfers=True)
+    expected = draw_grid(plan).val().Volume()
+    assert draw_grid(FrozenGridPlan.from_plan(plan)).val().Volume() == pytest.approx(expected)
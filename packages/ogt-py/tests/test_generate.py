@@ -0,0 +1,126 @@
+"""Tests for in-process generation and call coalescing."""
+
+import io
+import threading
+import time
+
+import pytest
+import trimesh
+
+from ogt import generate_bytes
+from ogt.generate import SingleFlight, generate_stats
+
+
+def run_concurrently(flight, n, key, fn):
+    """Call ``flight.do(key, fn)`` from *n* threads; return results and errors."""
+    results, errors = [], []
+
+    def call():
+        try:
+            results.append(flight.do(key, fn))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(n)]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+
+def wait_for_waiters(flight, n):
+    deadline = time.monotonic() + 10
+    while flight.coalesced < n and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_single_flight_coalesces_concurrent_calls():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        release.wait()
+        return b"grid"
+
+    threads, results, errors = run_concurrently(flight, 8, "key", compute)
+    wait_for_waiters(flight, 7)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert results == [b"grid"] * 8
+    assert len(calls) == 1
+    assert flight.stats() == {"computed": 1, "coalesced": 7}
+
+
+def test_single_flight_shares_errors_then_forgets_the_key():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def fail():
+        release.wait()
+        raise ValueError("boom")
+
+    threads, results, errors = run_concurrently(flight, 4, "key", fail)
+    wait_for_waiters(flight, 3)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert results == []
+    assert len(errors) == 4
+    assert all(isinstance(e, ValueError) and str(e) == "boom" for e in errors)
+    # Waiters raise their own copy, chained to the leader's exception
+    (leader,) = [e for e in errors if e.__cause__ is None]
+    assert len({id(e) for e in errors}) == 4
+    assert all(e.__cause__ is leader for e in errors if e is not leader)
+
+    # Finished calls are not cached
+    assert flight.do("key", lambda: 42) == 42
+    assert flight.stats() == {"computed": 2, "coalesced": 3}
+
+
+def test_single_flight_wraps_errors_it_cannot_copy():
+    class Uncopyable(Exception):
+        def __init__(self, code, message):
+            super().__init__(message)
+
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def fail():
+        release.wait()
+        raise Uncopyable(1, "boom")
+
+    threads, _, errors = run_concurrently(flight, 2, "key", fail)
+    wait_for_waiters(flight, 1)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    (leader,) = [e for e in errors if isinstance(e, Uncopyable)]
+    (waiter,) = [e for e in errors if e is not leader]
+    assert isinstance(waiter, RuntimeError)
+    assert waiter.__cause__ is leader
+
+
+def test_single_flight_keys_are_independent():
+    flight = SingleFlight()
+    assert flight.do("a", lambda: 1) == 1
+    assert flight.do("b", lambda: 2) == 2
+    assert flight.stats() == {"computed": 2, "coalesced": 0}
+
+
+def test_generate_bytes_stl():
+    before = generate_stats()["computed"]
+    data = generate_bytes("0.f.2.2.KlAK.8A._4A", "stl")
+    mesh = trimesh.load(io.BytesIO(data), file_type="stl")
+    assert len(mesh.faces) > 0
+    assert generate_stats()["computed"] == before + 1
+
+
+def test_generate_bytes_rejects_invalid_code():
+    with pytest.raises(ValueError):
+        generate_bytes("not-a-code")
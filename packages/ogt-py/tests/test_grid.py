@@ -5,6 +5,7 @@ import trimesh
 
 from ogt import Tile, make_opengrid
 from ogt.constants import TILE_SIZE
+from ogt.draw.tile.chamfers import make_tile_chamfer_cutout
 from ogt.draw.tile.full import TILE_THICKNESS
 from ogt.draw.tile.lite import LITE_TILE_THICKNESS
 
@@ -119,8 +120,92 @@ def test_lite_tile_bounding_box():
         assert actual == pytest.approx(exp, abs=0.005)
 
 
+def test_lite_chamfer_cutout_matches_tile_thickness():
+    lite = make_tile_chamfer_cutout(LITE_TILE_THICKNESS).val().BoundingBox()
+    full = make_tile_chamfer_cutout().val().BoundingBox()
+    assert lite.zlen == pytest.approx(LITE_TILE_THICKNESS)
+    assert full.zlen == pytest.approx(TILE_THICKNESS)
+
+
 def test_lite_tile_thinner_than_full():
     layout = [[Tile()]]
     full = make_opengrid(layout, opengrid_type="full")
     lite = make_opengrid(layout, opengrid_type="lite")
     assert lite.val().Volume() < full.val().Volume()
+
+
+# ── Tile fusion modes ──
+
+
+@pytest.mark.parametrize("tile_fusion", ["batch", "tree"])
+def test_tile_fusion_matches_reference(tile_fusion):
+    (config,) = GRID_CONFIGS[3].values
+    layout = [[Tile()] * config.cols for _ in range(config.rows)]
+    grid = make_opengrid(
+        layout,
+        connectors=config.connectors,
+        tile_chamfers=config.chamfers,
+        screws=config.screws,
+        tile_fusion=tile_fusion,
+    )
+    sequential = build_grid(config)
+    reference_mesh = _load_reference_mesh(config)
+    assert grid.val().Volume() == pytest.approx(sequential.val().Volume(), rel=1e-9)
+    assert grid.val().Area() == pytest.approx(sequential.val().Area(), rel=1e-9)
+    assert grid.val().Volume() == pytest.approx(reference_mesh.volume, rel=0.005)
+
+
+def test_batch_cutouts_match_reference():
+    (config,) = GRID_CONFIGS[5].values
+    layout = [[Tile()] * config.cols for _ in range(config.rows)]
+    grid = make_opengrid(
+        layout,
+        connectors=config.connectors,
+        tile_chamfers=config.chamfers,
+        screws=config.screws,
+        cutouts="batch",
+    )
+    sequential = build_grid(config)
+    reference_mesh = _load_reference_mesh(config)
+    assert grid.val().Volume() == pytest.approx(sequential.val().Volume(), rel=1e-9)
+    assert grid.val().Area() == pytest.approx(sequential.val().Area(), rel=1e-9)
+    assert grid.val().Area() == pytest.approx(reference_mesh.area, rel=0.005)
+
+
+@pytest.mark.parametrize("config", [GRID_CONFIGS[5], GRID_CONFIGS[7]])
+def test_tile_variants_match_reference(config):
+    layout = [[Tile()] * config.cols for _ in range(config.rows)]
+    grid = make_opengrid(
+        layout,
+        opengrid_type=config.opengrid_type,
+        connectors=config.connectors,
+        tile_chamfers=config.chamfers,
+        screws=config.screws,
+        tile_fusion="batch",
+        strategy="variants",
+    )
+    reference = build_grid(config)
+    assert grid.val().Volume() == pytest.approx(reference.val().Volume(), rel=1e-9)
+    assert grid.val().Area() == pytest.approx(reference.val().Area(), rel=1e-9)
+
+
+@pytest.mark.parametrize("glue", ["off", "full"])
+@pytest.mark.parametrize("config", [GRID_CONFIGS[5], GRID_CONFIGS[7]])
+def test_glue_matches_reference(config, glue):
+    layout = [[Tile()] * config.cols for _ in range(config.rows)]
+    grid = make_opengrid(
+        layout,
+        opengrid_type=config.opengrid_type,
+        connectors=config.connectors,
+        tile_chamfers=config.chamfers,
+        screws=config.screws,
+        tile_fusion="batch",
+        glue=glue,
+    )
+    shift = build_grid(config)
+    reference_mesh = _load_reference_mesh(config)
+    assert grid.val().isValid()
+    assert grid.val().Volume() == pytest.approx(shift.val().Volume(), rel=1e-9)
+    assert grid.val().Area() == pytest.approx(shift.val().Area(), rel=1e-9)
+    assert grid.val().Volume() == pytest.approx(reference_mesh.volume, rel=0.005)
+    assert grid.val().Area() == pytest.approx(reference_mesh.area, rel=0.005)
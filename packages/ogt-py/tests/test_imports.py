@@ -0,0 +1,47 @@
+"""The planning side of ogt must not load cadquery."""
+
+import subprocess
+import sys
+
+import pytest
+
+
+def _loads_cadquery(code: str) -> bool:
+    """Run *code* in a fresh interpreter and report whether cadquery got imported."""
+    result = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint('cadquery' in sys.modules)"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip().splitlines()[-1] == "True"
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import ogt",
+        "from ogt import Tile, prepare_grid",
+        "from ogt.prepare import prepare_grid",
+        "from ogt.compact import decode; decode('0.f.2.2.KlAK.8A._4A')",
+        "from ogt.result_cache import result_key",
+        "import ogt.cli",
+    ],
+)
+def test_planning_imports_skip_cadquery(code):
+    assert not _loads_cadquery(code)
+
+
+def test_prepare_command_skips_cadquery(tmp_path):
+    args = ["prepare", "--size", "2x2", "-o", str(tmp_path / "plan.json")]
+    code = (
+        "from click.testing import CliRunner\n"
+        "from ogt.cli import cli\n"
+        f"r = CliRunner().invoke(cli, {args!r})\n"
+        "assert r.exit_code == 0, r.output"
+    )
+    assert not _loads_cadquery(code)
+
+
+def test_drawing_attributes_load_lazily():
+    assert _loads_cadquery("from ogt import make_opengrid")
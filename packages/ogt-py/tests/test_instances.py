@@ -0,0 +1,56 @@
+"""Tests for placing templates by location."""
+
+import cadquery as cq
+import pytest
+from OCP.BRep import BRep_Tool
+
+from ogt import LayoutMask, prepare_grid
+from ogt.draw.grid import _summit_cutouts, _summit_keys, draw_grid
+from ogt.draw.instances import place
+from ogt.draw.tile.full import make_opengrid_full_tile
+
+
+def test_place_shares_geometry():
+    template = make_opengrid_full_tile().val()
+    placed = place(template, 28.0, -56.0)
+    assert placed.wrapped.IsPartner(template.wrapped)
+    assert not placed.wrapped.IsSame(template.wrapped)
+    assert type(placed) is type(template)
+
+
+def test_place_matches_translate():
+    template = make_opengrid_full_tile().val()
+    placed = place(template, 28.0, -56.0, 1.5)
+    copied = template.translate(cq.Vector(28.0, -56.0, 1.5))
+    assert placed.Volume() == pytest.approx(copied.Volume())
+    placed_box, copied_box = placed.BoundingBox(), copied.BoundingBox()
+    for attr in ("xmin", "xmax", "ymin", "ymax", "zmin", "zmax"):
+        assert getattr(placed_box, attr) == pytest.approx(getattr(copied_box, attr), abs=1e-6)
+
+
+def test_fuse_instances():
+    box = cq.Solid.makeBox(1, 1, 1)
+    fused = place(box, 0, 0).fuse(place(box, 1, 0), place(box, 0, 1)).clean()
+    assert len(fused.Solids()) == 1
+    assert fused.Volume() == pytest.approx(3.0)
+
+
+def _tolerances(shape: cq.Shape) -> list[float]:
+    return [BRep_Tool.Tolerance_s(edge.wrapped) for edge in shape.Edges()] + [
+        BRep_Tool.Tolerance_s(vertex.wrapped) for vertex in shape.Vertices()
+    ]
+
+
+@pytest.mark.parametrize("strategy", ["tiles", "variants"])
+def test_draw_leaves_templates_unchanged(strategy):
+    """Cuts must not touch the cached templates their tools are placed from."""
+    plan = prepare_grid(
+        LayoutMask.full(3, 3), connectors=True, tile_chamfers=True, screws="corners"
+    )
+    keys = {key for row in _summit_keys(plan) for key in row}
+    templates = [
+        tool for key in keys for tool in _summit_cutouts(plan.opengrid_type, plan.screw_size, key)
+    ]
+    before = [_tolerances(template) for template in templates]
+    draw_grid(plan, cutouts="batch", strategy=strategy)
+    assert [_tolerances(template) for template in templates] == before
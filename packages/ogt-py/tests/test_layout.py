@@ -0,0 +1,72 @@
+"""Tests for the boolean-mask layout type."""
+
+import pytest
+
+from ogt import Hole, LayoutMask, Tile, make_opengrid
+from ogt.prepare import (
+    compute_eligible_connector_positions,
+    compute_eligible_screw_positions,
+    compute_eligible_tile_chamfer_positions,
+    prepare_grid,
+)
+
+SLOTS = [
+    [Tile(), Tile(), Hole()],
+    [Hole(), Tile(), Tile()],
+]
+
+
+def test_slot_round_trip():
+    mask = LayoutMask.from_slots(SLOTS)
+    assert mask.shape == (2, 3)
+    assert mask.to_slots() == SLOTS
+    assert mask == LayoutMask([[1, 1, 0], [0, 1, 1]])
+
+
+def test_is_tile():
+    mask = LayoutMask.from_slots(SLOTS)
+    assert mask.is_tile(0, 0)
+    assert not mask.is_tile(0, 2)
+    # Outside the grid is a hole
+    assert not mask.is_tile(-1, 0)
+    assert not mask.is_tile(2, 1)
+    assert not mask.is_tile(0, 3)
+
+
+def test_full():
+    assert LayoutMask.full(2, 3) == LayoutMask([[True] * 3] * 2)
+
+
+@pytest.mark.parametrize("tiles", [[], [[]], [True, False], [[[True]]]])
+def test_rejects_non_2d_or_empty(tiles):
+    with pytest.raises(ValueError):
+        LayoutMask(tiles)
+
+
+def test_copies_input():
+    tiles = [[True, True]]
+    mask = LayoutMask(tiles)
+    tiles[0][0] = False
+    assert mask.is_tile(0, 0)
+
+
+@pytest.mark.parametrize(
+    "compute",
+    [
+        compute_eligible_connector_positions,
+        compute_eligible_tile_chamfer_positions,
+        compute_eligible_screw_positions,
+    ],
+)
+def test_eligibility_accepts_mask(compute):
+    assert compute(LayoutMask.from_slots(SLOTS)) == compute(SLOTS)
+
+
+def test_prepare_grid_accepts_mask():
+    kwargs = {"connectors": True, "tile_chamfers": True, "screws": "all"}
+    assert prepare_grid(LayoutMask.from_slots(SLOTS), **kwargs) == prepare_grid(SLOTS, **kwargs)
+
+
+def test_make_opengrid_accepts_mask():
+    result = make_opengrid(LayoutMask([[True, False], [True, True]]))
+    assert result.val().isValid()
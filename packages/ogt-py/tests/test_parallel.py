@@ -0,0 +1,59 @@
+"""Tests for drawing plans in worker processes."""
+
+import pytest
+
+from ogt import FrozenGridPlan, LayoutMask, draw_grid, prepare_grid
+from ogt.draw.parallel import chunk_bounds
+
+
+def _covered(rows, cols, chunks):
+    covered = [[0] * cols for _ in range(rows)]
+    for r, c, n_rows, n_cols in chunks:
+        for rr in range(r, r + n_rows):
+            for cc in range(c, c + n_cols):
+                covered[rr][cc] += 1
+    return covered
+
+
+@pytest.mark.parametrize("rows,cols,workers", [(4, 6, 4), (1, 5, 8), (3, 3, 2), (7, 2, 3)])
+def test_chunks_cover_grid_once(rows, cols, workers):
+    chunks = chunk_bounds(rows, cols, workers)
+    assert len(chunks) <= workers
+    assert _covered(rows, cols, chunks) == [[1] * cols for _ in range(rows)]
+
+
+def test_chunks_have_short_seams():
+    # 2x2 blocks beat 4 bands on a square grid
+    assert chunk_bounds(4, 4, 4) == [(0, 0, 2, 2), (0, 2, 2, 2), (2, 0, 2, 2), (2, 2, 2, 2)]
+    # A wide grid is cut across its length
+    assert chunk_bounds(2, 8, 2) == [(0, 0, 2, 4), (0, 4, 2, 4)]
+
+
+@pytest.mark.parametrize("strategy", ["tiles", "variants"])
+def test_parallel_matches_serial(strategy):
+    """Seam summits are cut on both sides, so the fused chunks match."""
+    layout = LayoutMask([[True, True, True], [True, False, True], [False, True, True]])
+    plan = prepare_grid(layout, connectors=True, tile_chamfers=True, screws="corners")
+    expected = draw_grid(plan, strategy=strategy).val()
+    result = draw_grid(FrozenGridPlan.from_plan(plan), strategy=strategy, workers=3).val()
+    assert result.isValid()
+    assert len(result.Solids()) == 1
+    assert result.Volume() == pytest.approx(expected.Volume(), rel=1e-9)
+    difference = expected.cut(result).Volume() + result.cut(expected).Volume()
+    assert difference < 1e-6 * expected.Volume()
+
+
+def test_parallel_skips_empty_chunks():
+    plan = prepare_grid(LayoutMask([[True, False], [False, False]]), connectors=True)
+    expected = draw_grid(plan).val()
+    assert draw_grid(plan, workers=4).val().Volume() == pytest.approx(expected.Volume())
+
+
+def test_parallel_components():
+    layout = LayoutMask([[True, True, False, True], [True, False, False, True]])
+    plan = prepare_grid(layout, connectors=True, tile_chamfers=True)
+    expected = draw_grid(plan).val()
+    result = draw_grid(plan, workers=2).val()
+    assert len(result.Solids()) == 2
+    difference = expected.cut(result).Volume() + result.cut(expected).Volume()
+    assert difference < 1e-6 * expected.Volume()
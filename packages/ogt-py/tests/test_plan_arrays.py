@@ -0,0 +1,78 @@
+"""Tests for the struct-of-arrays plan."""
+
+import numpy as np
+import pytest
+
+from ogt import GridPlanArrays, Hole, Tile, draw_grid, prepare_grid, prepare_grid_arrays
+from ogt.compact import decode, encode
+from ogt.prepare import NO_CONNECTOR
+from ogt.prepare.types import SummitFeatures
+
+LAYOUT = [
+    [Tile(), Tile(), Tile()],
+    [Tile(), Hole(), Tile()],
+    [Tile(), Tile(), Hole()],
+]
+
+OPTIONS = [
+    {},
+    {"connectors": True},
+    {"tile_chamfers": True},
+    {"screws": "all"},
+    {"connectors": True, "tile_chamfers": True, "screws": "corners"},
+    {"opengrid_type": "lite", "connectors": True, "tile_chamfers": True},
+]
+
+
+@pytest.mark.parametrize("kwargs", OPTIONS)
+def test_round_trip(kwargs):
+    plan = prepare_grid(LAYOUT, **kwargs)
+    arrays = GridPlanArrays.from_plan(plan)
+    assert arrays.to_plan() == plan
+
+
+@pytest.mark.parametrize("kwargs", OPTIONS)
+def test_prepare_grid_arrays_matches_prepare_grid(kwargs):
+    arrays = prepare_grid_arrays(LAYOUT, **kwargs)
+    assert arrays == GridPlanArrays.from_plan(prepare_grid(LAYOUT, **kwargs))
+    assert encode(arrays) == encode(arrays.to_plan())
+
+
+def test_connector_turns():
+    arrays = prepare_grid_arrays([[Tile(), Tile()]], connectors=True)
+    # Summit between the two tiles, on the top and bottom edges
+    assert arrays.connector_turns[0, 1] == -1  # -90 degrees
+    assert arrays.connector_turns[1, 1] == 1  # 90 degrees
+    assert arrays.connector_turns[0, 0] == NO_CONNECTOR
+    assert arrays.connector_angles()[0][:2] == [None, -90.0]
+
+
+def test_decode_round_trip():
+    plan = decode("0.f.2.2.KlAK.8A._4A")
+    assert GridPlanArrays.from_plan(plan).to_plan() == plan
+
+
+def test_rejects_non_quarter_turn_angles():
+    plan = prepare_grid([[Tile()]])
+    plan.summits[0][0] = SummitFeatures(connector_angle=45.0)
+    with pytest.raises(ValueError, match="quarter turn"):
+        GridPlanArrays.from_plan(plan)
+
+
+def test_rejects_mismatched_shapes():
+    with pytest.raises(ValueError, match="screws"):
+        GridPlanArrays(
+            tiles=np.ones((2, 2), dtype=bool),
+            connector_turns=np.full((3, 3), NO_CONNECTOR),
+            tile_chamfers=np.zeros((3, 3), dtype=bool),
+            screws=np.zeros((2, 2), dtype=bool),
+        )
+
+
+def test_draw_grid_accepts_arrays():
+    kwargs = {"connectors": True, "tile_chamfers": True}
+    layout = [[Tile(), Tile()], [Hole(), Tile()]]
+    from_arrays = draw_grid(prepare_grid_arrays(layout, **kwargs), cutouts="batch").val()
+    from_plan = draw_grid(prepare_grid(layout, **kwargs), cutouts="batch").val()
+    assert from_arrays.isValid()
+    assert from_arrays.Volume() == pytest.approx(from_plan.Volume())
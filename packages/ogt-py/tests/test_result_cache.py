@@ -0,0 +1,83 @@
+"""Tests for the exported-file result cache."""
+
+import os
+
+from ogt import result_cache
+from ogt.compact import decode
+from ogt.prepare import prepare_grid
+from ogt.prepare.types import ScrewSize, SummitFeatures
+from ogt.result_cache import ResultCache, result_key
+from ogt.slot import Tile
+
+
+def test_key_is_canonical():
+    # The second code sets feature bits that are ignored by the decoder
+    a = decode("0.f.1.1.KlAK.gA.8A")
+    b = decode("0.f.1.1.KlAK.gA.__8")
+    assert result_key(a, "stl") == result_key(b, "stl")
+
+
+def test_key_depends_on_format_and_tessellation():
+    plan = prepare_grid([[Tile()] * 2] * 2, connectors=True)
+    assert result_key(plan, "stl") != result_key(plan, "step")
+    assert result_key(plan, "stl") != result_key(plan, "stl", tolerance=0.01)
+    # Tessellation settings do not apply to STEP
+    assert result_key(plan, "step") == result_key(plan, "step", tolerance=0.01)
+
+
+def test_key_for_plans_the_compact_format_cannot_encode():
+    # Screw sizes are stored in 0.1 mm steps of a byte, up to 25.5 mm
+    plan = prepare_grid([[Tile()] * 2] * 2, screws="all", screw_size=ScrewSize(head_diameter=26.0))
+    bigger = prepare_grid(
+        [[Tile()] * 2] * 2, screws="all", screw_size=ScrewSize(head_diameter=27.0)
+    )
+    assert result_key(plan, "stl") != result_key(bigger, "stl")
+    assert result_key(plan, "stl") == result_key(plan.model_copy(deep=True), "stl")
+
+
+def test_key_depends_on_draw_options():
+    plan = prepare_grid([[Tile()] * 2] * 2, connectors=True)
+    options = {"strategy": "variants", "glue": "off"}
+    assert result_key(plan, "step") == result_key(plan, "step", draw_options={})
+    assert result_key(plan, "step") != result_key(plan, "step", draw_options=options)
+    assert result_key(plan, "step", draw_options=options) == result_key(
+        plan, "step", draw_options=dict(reversed(options.items()))
+    )
+    assert result_key(plan, "step", draw_options=options) != result_key(
+        plan, "step", draw_options={**options, "glue": "shift"}
+    )
+
+
+def test_key_depends_on_ogt_version(monkeypatch):
+    plan = prepare_grid([[Tile()] * 2] * 2, connectors=True)
+    key = result_key(plan, "step")
+    monkeypatch.setattr(result_cache, "ogt_version", lambda: "0.0.0+other")
+    assert result_key(plan, "step") != key
+
+
+def test_key_falls_back_for_non_compact_plans():
+    plan = prepare_grid([[Tile()] * 2] * 2, connectors=True)
+    edited = plan.model_copy(deep=True)
+    edited.summits[0][1] = SummitFeatures(connector_angle=45.0)
+    assert result_key(plan, "stl") != result_key(edited, "stl")
+
+
+def test_get_put(tmp_path):
+    cache = ResultCache(tmp_path)
+    assert cache.get("k") is None
+    cache.put("k", b"data")
+    assert cache.get("k") == b"data"
+
+
+def test_lru_eviction(tmp_path):
+    cache = ResultCache(tmp_path, max_bytes=20)
+    cache.put("a", b"x" * 8)
+    cache.put("b", b"x" * 8)
+    os.utime(tmp_path / "a.bin", ns=(1, 1))
+    os.utime(tmp_path / "b.bin", ns=(2, 2))
+    # Touch "a" so that "b" becomes the least recently used entry
+    assert cache.get("a") is not None
+    cache.put("c", b"x" * 8)
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
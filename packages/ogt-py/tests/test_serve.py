@@ -0,0 +1,135 @@
+"""Tests for the warm worker server."""
+
+import copy
+import http.client
+import io
+import json
+import threading
+from http import HTTPStatus
+
+import pytest
+import trimesh
+
+from ogt.compact import encode
+from ogt.serve import RequestError, create_server
+
+CODE = "0.f.2.2.KlAK.8A._4A"
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = create_server(port=0, workers=1, queue_size=0, quiet=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def request(server, method, path, body=None):
+    host, port = server.server_address[:2]
+    conn = http.client.HTTPConnection(host, port, timeout=120)
+    try:
+        payload = None if body is None else json.dumps(body)
+        conn.request(method, path, body=payload)
+        response = conn.getresponse()
+        return response.status, response.getheader("Content-Type"), response.read()
+    finally:
+        conn.close()
+
+
+def test_health(server):
+    assert request(server, "GET", "/health")[0] == 200
+
+
+def test_generate_stl_from_code(server):
+    status, content_type, data = request(
+        server, "POST", "/generate", {"code": CODE, "format": "stl"}
+    )
+    assert status == 200
+    assert content_type == "model/stl"
+    mesh = trimesh.load(io.BytesIO(data), file_type="stl")
+    assert len(mesh.faces) > 0
+
+
+def test_generate_step_from_plan(server):
+    from ogt.compact import decode
+
+    plan = json.loads(decode(CODE).model_dump_json())
+    status, content_type, data = request(server, "POST", "/generate", {"plan": plan})
+    assert status == 200
+    assert content_type == "model/step"
+    assert data.startswith(b"ISO-10303-21")
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {"code": "not-a-code"},
+        {"code": "1.f.20000.20000.KlAK.rAICI3r4B.*"},
+        {"code": CODE, "format": "obj"},
+        {"code": CODE, "plan": {}},
+        {"plan": {"tiles": "nope"}},
+    ],
+)
+def test_generate_rejects_bad_requests(server, body):
+    assert request(server, "POST", "/generate", body)[0] == 400
+
+
+def test_generate_caps_grid_size(server):
+    from ogt.prepare import prepare_grid
+
+    plan = prepare_grid([[True] * 40] * 40)
+    code = encode(plan)
+    status, _, body = request(server, "POST", "/generate", {"code": code})
+    assert status == 400
+    assert b"Grid too large" in body
+    status, _, body = request(server, "POST", "/generate", {"plan": plan.model_dump(mode="json")})
+    assert status == 400
+    assert b"Grid too large" in body
+
+
+def test_request_error_copies_keep_their_status():
+    error = RequestError(HTTPStatus.GATEWAY_TIMEOUT, "Generation timed out")
+    copied = copy.copy(error)
+    assert copied.status == HTTPStatus.GATEWAY_TIMEOUT
+    assert str(copied) == "Generation timed out"
+
+
+def test_unknown_path(server):
+    assert request(server, "GET", "/nope")[0] == 404
+
+
+def test_busy_server_answers_503(server):
+    # Hold the only slot, as a long-running request would
+    server._slots.acquire()
+    try:
+        status = request(server, "POST", "/generate", {"code": CODE})[0]
+        # The slot is taken before the body is even decoded
+        unparsed = request(server, "POST", "/generate", {"code": "not-a-code"})[0]
+    finally:
+        server._slots.release()
+    assert status == 503
+    assert unparsed == 503
+
+
+def test_timeout_answers_504_and_restarts_workers(server):
+    pool = server.pool
+    server.request_timeout = 0.01
+    try:
+        status = request(server, "POST", "/generate", {"code": CODE, "tolerance": 0.11})[0]
+    finally:
+        server.request_timeout = None
+    assert status == 504
+    assert server.pool is not pool
+    assert request(server, "POST", "/generate", {"code": CODE, "tolerance": 0.11})[0] == 200
+
+
+def test_crashed_worker_answers_503_and_restarts_workers(server):
+    pool = server.pool
+    for process in list(pool._processes.values()):
+        process.terminate()
+        process.join()
+    assert request(server, "POST", "/generate", {"code": CODE, "tolerance": 0.12})[0] == 503
+    assert server.pool is not pool
+    assert request(server, "POST", "/generate", {"code": CODE, "tolerance": 0.12})[0] == 200
@@ -0,0 +1,94 @@
+"""Tests for canonical plan orientation."""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from ogt import LayoutMask, prepare_grid, prepare_grid_arrays
+from ogt.prepare import GridPlan, GridPlanArrays, PlanTransform, canonicalize
+
+TRANSFORMS = list(itertools.product(range(4), (False, True)))
+
+OPTIONS = [
+    {"connectors": True},
+    {"connectors": True, "tile_chamfers": True},
+    {"connectors": True, "tile_chamfers": True, "screws": "corners"},
+    {"screws": "all"},
+]
+
+
+def _layout(rows: int, cols: int, seed: int) -> np.ndarray:
+    tiles = np.random.default_rng(seed).random((rows, cols)) < 0.7
+    tiles[0, 0] = True
+    return tiles
+
+
+@pytest.mark.parametrize("turns,mirror", TRANSFORMS)
+@pytest.mark.parametrize("kwargs", OPTIONS)
+def test_transform_commutes_with_prepare(turns, mirror, kwargs):
+    """Transforming a plan gives the plan of the transformed layout."""
+    tiles = _layout(3, 5, seed=turns)
+    transform = PlanTransform(turns, mirror, 3, 5)
+    plan = prepare_grid_arrays(LayoutMask(tiles), **kwargs)
+    expected = prepare_grid_arrays(LayoutMask(transform.apply_array(tiles)), **kwargs)
+    assert transform.apply(plan) == expected
+
+
+@pytest.mark.parametrize("turns,mirror", TRANSFORMS)
+def test_inverse(turns, mirror):
+    transform = PlanTransform(turns, mirror, 2, 4)
+    plan = prepare_grid_arrays(LayoutMask(_layout(2, 4, seed=1)), connectors=True)
+    assert transform.inverse().apply(transform.apply(plan)) == plan
+    assert transform.inverse().inverse() == transform
+
+
+def test_canonicalize_all_orientations():
+    plan = prepare_grid_arrays(LayoutMask(_layout(3, 4, seed=2)), connectors=True)
+    canonical, transform = canonicalize(plan)
+    assert transform.apply(canonical) == plan
+
+    for turns, mirror in TRANSFORMS:
+        oriented = PlanTransform(turns, mirror, 3, 4).apply(plan)
+        other, other_transform = canonicalize(oriented)
+        assert other == canonical
+        assert other_transform.apply(other) == oriented
+
+
+def test_canonicalize_grid_plan():
+    layout = [[True, True, True, True], [True, False, False, False]]
+    plan = prepare_grid(LayoutMask(layout), connectors=True, tile_chamfers=True)
+    rotated = prepare_grid(LayoutMask(np.rot90(layout)), connectors=True, tile_chamfers=True)
+
+    canonical, transform = canonicalize(plan)
+    assert isinstance(canonical, GridPlan)
+    assert canonicalize(rotated)[0] == canonical
+    assert transform.apply(GridPlanArrays.from_plan(canonical)).to_plan() == plan
+
+
+def test_transform_shape_mismatch():
+    plan = prepare_grid_arrays(LayoutMask.full(2, 3))
+    with pytest.raises(ValueError, match="2x2 plan"):
+        PlanTransform(1, False, 2, 2).apply(plan)
+
+
+def test_transform_grid_geometry():
+    """A transformed drawing of the canonical plan is the original part."""
+    from ogt.draw import draw_grid, transform_grid
+
+    layout = LayoutMask([[True, True, False], [True, True, True], [True, False, False]])
+    plan = GridPlanArrays.from_plan(
+        prepare_grid(layout, opengrid_type="lite", connectors=True, screws="all")
+    )
+    # Pick an orientation whose transform mirrors and turns
+    for turns, mirror in TRANSFORMS:
+        oriented = PlanTransform(turns, mirror, 3, 3).apply(plan).to_plan()
+        canonical, transform = canonicalize(oriented)
+        if transform.mirror and transform.turns % 2:
+            break
+    assert transform.mirror and transform.turns % 2
+
+    expected = draw_grid(oriented).val()
+    result = transform_grid(draw_grid(canonical), transform).val()
+    difference = expected.cut(result).Volume() + result.cut(expected).Volume()
+    assert difference < 1e-6 * expected.Volume()
@@ -0,0 +1,108 @@
+"""Tests for the on-disk BREP template cache."""
+
+import cadquery as cq
+import pytest
+
+from ogt.draw import template_cache
+from ogt.draw.template_cache import brep_cached, set_cache_dir
+from ogt.draw.tile.full import make_opengrid_full_tile
+
+
+@pytest.fixture(autouse=True)
+def _reset_cache_dir():
+    set_cache_dir(None)
+    yield
+    set_cache_dir(None)
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    set_cache_dir(tmp_path)
+    return tmp_path
+
+
+def _counting_factory(name, *constants):
+    calls = []
+
+    @brep_cached(name, *constants)
+    def factory(size=1.0):
+        calls.append(size)
+        return cq.Workplane("XY").box(size, size, size)
+
+    return factory, calls
+
+
+def test_disabled_without_cache_dir(monkeypatch, tmp_path):
+    monkeypatch.delenv(template_cache.CACHE_DIR_ENV, raising=False)
+    factory, calls = _counting_factory("box", 1)
+    factory()
+    factory()
+    assert len(calls) == 2
+    assert not list(tmp_path.iterdir())
+
+
+def test_env_var_enables_cache(monkeypatch, tmp_path):
+    monkeypatch.setenv(template_cache.CACHE_DIR_ENV, str(tmp_path))
+    factory, calls = _counting_factory("box", 1)
+    factory()
+    factory()
+    assert len(calls) == 1
+
+
+def test_loads_from_disk(cache_dir):
+    factory, calls = _counting_factory("box", 1)
+    built = factory(2.0)
+    loaded = factory(2.0)
+    assert calls == [2.0]
+    assert len(list(cache_dir.glob("box-*.brep"))) == 1
+    assert loaded.val().Volume() == pytest.approx(built.val().Volume())
+
+
+def test_arguments_are_part_of_the_key(cache_dir):
+    factory, calls = _counting_factory("box", 1)
+    factory(1.0)
+    factory(2.0)
+    factory(1.0)
+    assert calls == [1.0, 2.0]
+    assert len(list(cache_dir.glob("box-*.brep"))) == 2
+
+
+def test_constant_change_invalidates(cache_dir):
+    old, _ = _counting_factory("box", 1)
+    old()
+    new, calls = _counting_factory("box", 2)
+    new()
+    assert calls == [1.0]
+    assert len(list(cache_dir.glob("box-*.brep"))) == 1
+
+
+def test_unreadable_entry_is_rebuilt(cache_dir, caplog):
+    factory, calls = _counting_factory("box", 1)
+    factory()
+    (path,) = cache_dir.glob("box-*.brep")
+    path.write_text("not a brep")
+    with caplog.at_level("WARNING", logger=template_cache.__name__):
+        assert factory().val().Volume() == pytest.approx(1.0)
+    assert len(calls) == 2
+    assert str(path) in caplog.text
+
+
+def test_unexpected_load_error_propagates(cache_dir, monkeypatch):
+    factory, _ = _counting_factory("box", 1)
+    factory()
+
+    def fail(path):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(cq.Shape, "importBrep", staticmethod(fail))
+    with pytest.raises(RuntimeError, match="boom"):
+        factory()
+
+
+def test_full_tile_roundtrip(cache_dir):
+    build = make_opengrid_full_tile.__wrapped__
+    built = build()
+    loaded = build()
+    assert list(cache_dir.glob("full_tile-*.brep"))
+    assert loaded.val().Volume() == pytest.approx(built.val().Volume(), rel=1e-9)
+    assert loaded.val().Area() == pytest.approx(built.val().Area(), rel=1e-9)